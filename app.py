@@ -3,18 +3,35 @@
 Main Streamlit application entry point.
 """
 
-import asyncio
 import re
-from typing import Optional
+from typing import Dict, Iterator, List, Optional
 import streamlit as st
 
 from src.utils.config import load_config, get_api_key
-from src.llm.factory import create_llm_client
-from src.ui.chat import render_chat, add_message, get_chat_history, init_chat_state
+from src.llm.cache import cached_complete, get_response_cache
+from src.llm.factory import get_llm_client
+from src.llm.runtime import iterate_async, run_async
+from src.llm.tokens import get_token_counter
+from src.ui.chat import (
+    render_chat,
+    add_message,
+    get_extraction_history,
+    get_windowed_history,
+    init_chat_state,
+    reset_history_summary
+)
 from src.ui.wall import render_discovery_wall, init_wall_state, refresh_wall_state, render_agent_overview
 from src.agents.orchestrator import get_active_agent, get_agent, set_active_agent, init_orchestrator_state
-from src.discovery.session import clear_session
+from src.discovery.session import clear_session, list_sessions
 from src.discovery.artifacts import clear_all_artifacts
+from src.discovery.writer import flush_background_writer, get_background_writer, start_background_writer
+from src.discovery.workspace import (
+    Workspace,
+    create_workspace,
+    open_workspace,
+    workspace_exists,
+    set_current_workspace
+)
 
 
 # Agent name to ID mapping for delegation detection
@@ -26,6 +43,9 @@ AGENT_NAME_MAP = {
     "theo": "theo",
 }
 
+# Number of sessions offered in the "resume session" picker
+SESSION_PICKER_LIMIT = 50
+
 
 def detect_delegation(response: str) -> Optional[str]:
     """Detect if LLM response contains a delegation to another agent.
@@ -76,8 +96,19 @@ def init_session_state():
             provider = config.get("llm", {}).get("provider", "anthropic")
             get_api_key(provider)  # Raises if missing
 
-            # Initialize LLM client
-            st.session_state.llm_client = create_llm_client(config)
+            # Shared LLM client (one connection pool for all sessions)
+            st.session_state.llm_client = get_llm_client(config)
+
+            # Write chat history in the background (see persistence config)
+            persistence_config = config.get("persistence", {})
+            if persistence_config.get("background", True):
+                start_background_writer(
+                    interval_ms=persistence_config.get("interval_ms", 200),
+                    max_pending=persistence_config.get("max_pending", 256)
+                )
+
+            # Open this browser session's workspace (chat + wall)
+            st.session_state.workspace = resume_or_create_workspace(config)
             st.session_state.error = None
             st.session_state.initialized = True
 
@@ -93,6 +124,9 @@ def init_session_state():
             st.session_state.error = f"Initialization error: {e}"
             st.session_state.initialized = False
 
+    # Route all persistence of this script run to the session's workspace
+    set_current_workspace(st.session_state.get("workspace"))
+
     # Initialize chat state
     init_chat_state()
 
@@ -106,6 +140,108 @@ def init_session_state():
     show_greeting_if_needed()
 
 
+def resume_or_create_workspace(config: dict) -> Workspace:
+    """Open the workspace named in the URL or create a new one.
+
+    The session ID is kept in the ?session= query parameter, so reloading
+    the page resumes the same discovery.
+
+    Args:
+        config: Application config
+
+    Returns:
+        Workspace of this browser session
+    """
+    session_id = st.query_params.get("session")
+    if session_id and workspace_exists(session_id, config=config):
+        workspace = open_workspace(session_id, config=config)
+    else:
+        workspace = create_workspace(config=config)
+
+    st.query_params["session"] = workspace.session_id
+    return workspace
+
+
+def switch_session(session_id: Optional[str]):
+    """Switch this browser session to another (or a new) workspace.
+
+    Args:
+        session_id: Session to resume, or None to start a new discovery
+    """
+    if session_id:
+        st.query_params["session"] = session_id
+    else:
+        del st.query_params["session"]
+
+    # Re-initialize everything for the selected workspace
+    for key in list(st.session_state.keys()):
+        del st.session_state[key]
+    st.rerun()
+
+
+def render_session_picker():
+    """Render the sidebar for resuming or starting discoveries."""
+    st.subheader("Discoveries")
+
+    if st.button("Neue Discovery", use_container_width=True):
+        switch_session(None)
+
+    writer = get_background_writer()
+    if writer is not None:
+        stats = writer.stats()
+        st.caption(f"Speichern: {stats.last_flush_ms:.0f} ms (max. {stats.max_flush_ms:.0f} ms), "
+                   f"Warteschlange: {stats.queue_depth}")
+
+    window = st.session_state.get("history_window")
+    if window is not None:
+        st.caption(f"Letzte Anfrage: {window.tokens:,} Tokens Verlauf "
+                   f"({window.kept_messages} von {window.total_messages} Nachrichten)")
+
+    counter_stats = get_token_counter().stats()
+    if counter_stats.samples:
+        st.caption(f"Token-Schätzung: Faktor {counter_stats.scale:.2f} "
+                   f"({counter_stats.samples} Messungen, {counter_stats.exact_counts} exakt gezählt)")
+
+    summarizer = st.session_state.get("history_summarizer")
+    if summarizer is not None and (summarizer.covered or summarizer.is_refreshing()):
+        refreshing = " (wird aktualisiert)" if summarizer.is_refreshing() else ""
+        st.caption(f"Zusammenfassung: {summarizer.covered} ältere Nachrichten{refreshing}")
+
+    usage = st.session_state.llm_client.usage_stats()
+    if usage.cache_read_tokens or usage.cache_write_tokens:
+        st.caption(f"Prompt-Cache: {usage.cache_read_tokens:,} Tokens gelesen, "
+                   f"{usage.cache_write_tokens:,} geschrieben, {usage.input_tokens:,} ungecacht")
+
+    cache_stats = get_response_cache(st.session_state.config).stats()
+    if cache_stats.hits or cache_stats.misses:
+        st.caption(f"LLM-Cache: {cache_stats.hits} Treffer, {cache_stats.misses} Fehlschläge "
+                   f"({cache_stats.hit_rate:.0%})")
+
+    current_id = st.session_state.workspace.session_id
+    prefix = st.text_input("Session suchen", placeholder="Name beginnt mit...")
+    sessions = [
+        s for s in list_sessions(st.session_state.config, prefix=prefix or None, limit=SESSION_PICKER_LIMIT + 1)
+        if s.get("id") != current_id
+    ][:SESSION_PICKER_LIMIT]
+    if not sessions:
+        st.caption("Keine passenden Sessions gefunden." if prefix else "Keine weiteren Sessions gespeichert.")
+        return
+
+    labels = {
+        s["id"]: f"{s.get('name', s['id'])} ({(s.get('updated_at') or '')[:16].replace('T', ' ')})"
+        for s in sessions
+    }
+    selected = st.selectbox(
+        "Session fortsetzen",
+        options=list(labels),
+        format_func=labels.get,
+        index=None,
+        placeholder="Session wählen..."
+    )
+    if selected and st.button("Fortsetzen", use_container_width=True):
+        switch_session(selected)
+
+
 def show_greeting_if_needed():
     """Show Nora's greeting if chat is empty."""
     if len(st.session_state.get("messages", [])) == 0:
@@ -134,34 +270,69 @@ def render_error():
     """)
 
 
-async def get_llm_response(user_message: str) -> str:
-    """Get response from LLM using active agent's persona.
+def stream_llm_response(user_message: str, spinner_text: str) -> Iterator[str]:
+    """Stream the response from LLM using active agent's persona.
+
+    The request runs on the shared event loop; the spinner is shown
+    until the first chunk arrives.
 
     Args:
         user_message: User's message
+        spinner_text: Text shown while waiting for the first chunk
 
-    Returns:
-        LLM response text
+    Yields:
+        Chunks of the LLM response text
     """
     llm_client = st.session_state.llm_client
-    chat_history = get_chat_history()
 
     # Get active agent's system prompt
     agent = get_active_agent()
     system_prompt = agent.load_system_prompt()
 
-    response = await llm_client.complete(chat_history, system_prompt)
-    return response
+    # Recent turns within the agent's history budget
+    chat_history = get_windowed_history(agent.id)
+
+    chunks = iterate_async(llm_client.stream(chat_history, system_prompt))
+    with st.spinner(spinner_text):
+        first_chunk = next(chunks, None)
+    if first_chunk is None:
+        return
+    yield first_chunk
+    yield from chunks
+
 
+def without_command_turns(chat_history: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Remove commands and the replies to them from the chat history.
+
+    A command (e.g. *speichern, *wechsel arthur) and the assistant
+    messages up to the next user message (confirmations, greetings)
+    carry no discovery content.
+
+    Args:
+        chat_history: Messages in LLM format
 
-async def compile_mandat_from_chat() -> Optional[str]:
+    Returns:
+        The remaining messages
+    """
+    history = []
+    in_command = False
+    for msg in chat_history:
+        if msg["role"] == "user":
+            in_command = msg["content"].strip().startswith("*")
+        if not in_command:
+            history.append(msg)
+    return history
+
+
+def compile_mandat_from_chat() -> Optional[str]:
     """Use LLM to compile a mandat from the chat history.
 
     Returns:
         Compiled mandat content or None if extraction fails
     """
     llm_client = st.session_state.llm_client
-    chat_history = get_chat_history()
+    # Older turns may be replaced by the rolling summary
+    chat_history = get_extraction_history("arthur")
 
     # Special system prompt for mandat extraction
     extraction_prompt = """Du bist Arthur, der Mandats-Architekt.
@@ -195,10 +366,13 @@ WICHTIG:
 
     # Add extraction request to history
     extraction_request = [{"role": "user", "content": "Fasse jetzt das Mandat aus unserem Gespräch zusammen."}]
-    full_history = chat_history + extraction_request
+    # The whole conversation (or its summary): the early briefing turns hold goal and boundaries
+    full_history = without_command_turns(chat_history) + extraction_request
 
     try:
-        response = await llm_client.complete(full_history, extraction_prompt)
+        # Same conversation -> same mandat (e.g. *speichern hit twice)
+        cache = get_response_cache(st.session_state.config)
+        response = run_async(cached_complete(llm_client, full_history, extraction_prompt, cache=cache))
         # Check if we got a valid response with at least some content
         if response and len(response) > 50 and "Kontext" in response:
             return response
@@ -209,8 +383,11 @@ WICHTIG:
 
 def start_new_session():
     """Clear session and start fresh (keeps artifacts on disk)."""
+    flush_background_writer()  # Queued chat writes must not recreate the session
+    reset_history_summary()
     clear_session()
     st.session_state.messages = []
+    st.session_state.messages_offset = 0
     # Remove artifacts from session state so they get reloaded from disk
     if "artifacts" in st.session_state:
         del st.session_state["artifacts"]
@@ -219,9 +396,12 @@ def start_new_session():
 
 def reset_everything():
     """Clear session AND delete all artifacts."""
+    flush_background_writer()  # Queued chat writes must not recreate the session
+    reset_history_summary()
     clear_session()
     clear_all_artifacts()
     st.session_state.messages = []
+    st.session_state.messages_offset = 0
     st.session_state.artifacts = {"mandat": [], "problem": [], "solution": [], "test": []}
     if "confirm_reset" in st.session_state:
         del st.session_state["confirm_reset"]
@@ -233,6 +413,9 @@ def render_app():
     llm_client = st.session_state.llm_client
     agent = get_active_agent()
 
+    with st.sidebar:
+        render_session_picker()
+
     # Header with session controls
     header_col1, header_col2 = st.columns([3, 1])
     with header_col1:
@@ -322,7 +505,7 @@ def render_app():
             # Arthur compiles mandat from chat history via LLM
             with st.chat_message("assistant", avatar=arthur.icon):
                 with st.spinner("Arthur kompiliert das Mandat..."):
-                    mandat_content = asyncio.run(compile_mandat_from_chat())
+                    mandat_content = compile_mandat_from_chat()
 
                     if mandat_content:
                         # Save the compiled mandat
@@ -393,37 +576,40 @@ Lass uns die 5 Elemente nochmal durchgehen:
 
         # Get LLM response
         with st.chat_message("assistant", avatar=agent.icon):
-            with st.spinner(f"{agent.name} denkt nach..."):
-                try:
-                    response = asyncio.run(get_llm_response(user_input))
-                    st.markdown(response)
+            try:
+                # Render tokens as they arrive; write_stream returns the full text
+                response = st.write_stream(
+                    stream_llm_response(user_input, f"{agent.name} denkt nach...")
+                )
+                if not isinstance(response, str):
+                    response = "".join(str(part) for part in response)
 
-                    # Add to history with agent info
-                    add_message(
-                        role="assistant",
-                        content=response,
-                        **agent.get_agent_info()
-                    )
+                # Add to history with agent info
+                add_message(
+                    role="assistant",
+                    content=response,
+                    **agent.get_agent_info()
+                )
+
+                # Auto-detect delegation in LLM response
+                delegation_target = detect_delegation(response)
+                if delegation_target and delegation_target != agent.id:
+                    target_agent = get_agent(delegation_target)
+                    if target_agent:
+                        set_active_agent(delegation_target)
+                        # Show target agent's greeting
+                        greeting = target_agent.get_greeting()
+                        add_message(
+                            role="assistant",
+                            content=greeting,
+                            **target_agent.get_agent_info()
+                        )
+                        st.rerun()
 
-                    # Auto-detect delegation in LLM response
-                    delegation_target = detect_delegation(response)
-                    if delegation_target and delegation_target != agent.id:
-                        target_agent = get_agent(delegation_target)
-                        if target_agent:
-                            set_active_agent(delegation_target)
-                            # Show target agent's greeting
-                            greeting = target_agent.get_greeting()
-                            add_message(
-                                role="assistant",
-                                content=greeting,
-                                **target_agent.get_agent_info()
-                            )
-                            st.rerun()
-
-                except Exception as e:
-                    error_msg = f"Fehler bei LLM-Anfrage: {e}"
-                    st.error(error_msg)
-                    add_message(role="assistant", content=error_msg)
+            except Exception as e:
+                error_msg = f"Fehler bei LLM-Anfrage: {e}"
+                st.error(error_msg)
+                add_message(role="assistant", content=error_msg)
 
 
 def main():
@@ -0,0 +1,83 @@
+"""Micro-benchmark: frontmatter codec versus yaml.safe_load / yaml.dump.
+
+Usage:
+    python -m benchmarks.bench_frontmatter [--sizes 1000 10000]
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+import yaml
+
+from src.discovery.frontmatter import YAML_LOADER, dump_frontmatter, load_frontmatter
+
+
+def make_frontmatter(count: int) -> List[Dict]:
+    """Build synthetic frontmatter dicts shaped like save_artifact() output."""
+    start = datetime(2025, 1, 1, 9, 0, 0)
+    types = ["insight", "idea", "hmw_challenge", "test_card", "research_question"]
+    agents = ["finn", "ida", "theo", "arthur"]
+
+    items = []
+    for i in range(count):
+        fields = {
+            "id": f"{types[i % len(types)]}-{i:05d}",
+            "type": types[i % len(types)],
+            "status": "draft" if i % 3 else "complete",
+            "created_by": agents[i % len(agents)],
+            "created_at": (start + timedelta(minutes=i)).isoformat(),
+            "updated_at": (start + timedelta(minutes=i, seconds=30)).isoformat()
+        }
+        if i % 2:
+            fields["related_to"] = ["mandat", f"insight-{i - 1:05d}"]
+        items.append(fields)
+    return items
+
+
+def timed(func: Callable, items: List) -> float:
+    """Run func over all items and return elapsed seconds."""
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return time.perf_counter() - start
+
+
+def run(size: int) -> None:
+    """Benchmark decoding and encoding for one wall size."""
+    fields = make_frontmatter(size)
+    texts = [yaml.dump(f, default_flow_style=False, allow_unicode=True) for f in fields]
+
+    # Sanity check: the codec must decode to exactly what YAML produces
+    for text in texts[:100]:
+        assert load_frontmatter(text) == yaml.safe_load(text)
+
+    results = {
+        "decode yaml.safe_load": timed(yaml.safe_load, texts),
+        f"decode yaml {YAML_LOADER.__name__}": timed(lambda t: yaml.load(t, Loader=YAML_LOADER), texts),
+        "decode codec": timed(load_frontmatter, texts),
+        "encode yaml.dump": timed(lambda f: yaml.dump(f, default_flow_style=False, allow_unicode=True), fields),
+        "encode codec": timed(dump_frontmatter, fields),
+    }
+
+    baseline_decode = results["decode yaml.safe_load"]
+    baseline_encode = results["encode yaml.dump"]
+    print(f"\n{size} artifacts")
+    for name, seconds in results.items():
+        baseline = baseline_decode if name.startswith("decode") else baseline_encode
+        print(f"  {name:<32} {seconds * 1000:9.1f} ms   {baseline / seconds:6.1f}x")
+
+
+def main() -> None:
+    """Run the benchmark for the requested sizes."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        run(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark: serial versus thread-pool scanning of a markdown discovery wall.
+
+Usage:
+    python -m benchmarks.bench_scan [--files 5000] [--workers 8] [--latency-ms 0]
+
+--latency-ms adds an artificial delay to every file read to emulate a
+network-mounted workspace, where per-file open/read latency dominates.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from src.discovery.index import ArtifactIndex
+from src.discovery.markdown_store import MarkdownArtifactStore, parse_header_block, read_header_block
+from src.discovery.models import Artifact, ArtifactType
+
+
+def populate(root: Path, count: int) -> None:
+    """Write count synthetic insight/idea artifacts."""
+    store = MarkdownArtifactStore(root)
+    for i in range(count):
+        artifact_type = ArtifactType.INSIGHT if i % 2 else ArtifactType.IDEA
+        store.save(Artifact(
+            id=f"{artifact_type.value}-{i:05d}",
+            type=artifact_type,
+            title=f"Synthetisches Artefakt {i}",
+            content="Nutzer berichten über wiederkehrende Probleme. " * 40,
+            created_by="finn",
+            related_to=["mandat"]
+        ))
+
+
+def scan(root: Path, workers: int, latency: float) -> tuple[float, int]:
+    """Cold-scan the wall and return (seconds, header count)."""
+    def read_block(path: Path):
+        if latency:
+            time.sleep(latency)
+        return read_header_block(path)
+
+    index = ArtifactIndex(root, read_block, parse_header_block)
+    start = time.perf_counter()
+    headers = index.headers(workers=workers)
+    return time.perf_counter() - start, len(headers)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    latency = args.latency_ms / 1000
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "discovery-wall"
+        populate(root, args.files)
+
+        serial, serial_count = scan(root, 1, latency)
+        parallel, parallel_count = scan(root, args.workers, latency)
+        assert serial_count == parallel_count == args.files
+
+    print(f"{args.files} files, {args.latency_ms} ms simulated read latency")
+    print(f"  serial              {serial * 1000:9.1f} ms")
+    print(f"  {args.workers} workers{'':<10}{parallel * 1000:9.1f} ms   {serial / parallel:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,13 +8,14 @@ from typing import Dict, List, Optional
 import yaml
 
 from src.context.loader import AgentContextLoader, AgentContext
+from src.llm.prompt import PromptBlock, SystemPrompt
 
 
 class BaseAgent(ABC):
     """Abstract base class for all Hansel agents."""
 
     def __init__(self):
-        self._system_prompt: Optional[str] = None
+        self._system_prompt: Optional[SystemPrompt] = None
         self._context: Optional[AgentContext] = None
 
     @property
@@ -51,62 +52,75 @@ class BaseAgent(ABC):
         """Path to agent definition markdown file."""
         return Path(f"docs/agents/{self.id}.md")
 
-    def load_system_prompt(self) -> str:
+    def load_system_prompt(self) -> SystemPrompt:
         """Load system prompt from agent definition file.
 
+        The prompt is split into blocks (persona, knowledge, artifacts)
+        so providers can cache the stable prefix across turns.
+
         Returns:
-            System prompt string
+            System prompt (a str made of PromptBlocks)
         """
         if self._system_prompt is not None:
             return self._system_prompt
 
+        persona = self._build_persona_prompt()
+
+        # Append context if available
+        context = self.load_context()
+        self._system_prompt = SystemPrompt([
+            PromptBlock("persona", persona, cache=True),
+            PromptBlock("knowledge", context.knowledge_text, cache=True),
+            PromptBlock("artifacts", context.artifacts_text, cache=True)
+        ])
+
+        return self._system_prompt
+
+    def _build_persona_prompt(self) -> str:
+        """Build the persona part of the system prompt from the definition file.
+
+        Returns:
+            Persona prompt string
+        """
         if not self.definition_file.exists():
-            self._system_prompt = self._get_default_prompt()
-            return self._system_prompt
+            return self._get_default_prompt()
 
         content = self.definition_file.read_text(encoding="utf-8")
 
         # Extract YAML from code block
         yaml_match = re.search(r"```yaml\s*\n(.*?)\n```", content, re.DOTALL)
-        if yaml_match:
-            try:
-                yaml_content = yaml.safe_load(yaml_match.group(1))
-                instructions = yaml_content.get("instructions", {})
-
-                # Build system prompt from instructions
-                prompt_parts = [
-                    f"Du bist {self.name}, {instructions.get('role', self.role)}.",
-                    "",
-                    f"**Persona:** {instructions.get('persona', '')}",
-                    f"**Fokus:** {instructions.get('focus', '')}",
-                    "",
-                    "**Verhaltensregeln:**",
-                    instructions.get('logic', ''),
-                    "",
-                    "**Verfügbare Commands:**"
-                ]
-
-                for cmd in instructions.get('commands', []):
-                    prompt_parts.append(f"- {cmd}")
-
-                prompt_parts.extend([
-                    "",
-                    "**Startup:**",
-                    instructions.get('startup', '')
-                ])
-
-                self._system_prompt = "\n".join(prompt_parts)
-            except yaml.YAMLError:
-                self._system_prompt = self._get_default_prompt()
-        else:
-            self._system_prompt = self._get_default_prompt()
-
-        # Append context if available
-        context_summary = self.get_context_summary()
-        if context_summary:
-            self._system_prompt = self._system_prompt + "\n\n" + context_summary
-
-        return self._system_prompt
+        if not yaml_match:
+            return self._get_default_prompt()
+
+        try:
+            yaml_content = yaml.safe_load(yaml_match.group(1))
+        except yaml.YAMLError:
+            return self._get_default_prompt()
+        instructions = yaml_content.get("instructions", {})
+
+        # Build system prompt from instructions
+        prompt_parts = [
+            f"Du bist {self.name}, {instructions.get('role', self.role)}.",
+            "",
+            f"**Persona:** {instructions.get('persona', '')}",
+            f"**Fokus:** {instructions.get('focus', '')}",
+            "",
+            "**Verhaltensregeln:**",
+            instructions.get('logic', ''),
+            "",
+            "**Verfügbare Commands:**"
+        ]
+
+        for cmd in instructions.get('commands', []):
+            prompt_parts.append(f"- {cmd}")
+
+        prompt_parts.extend([
+            "",
+            "**Startup:**",
+            instructions.get('startup', '')
+        ])
+
+        return "\n".join(prompt_parts)
 
     def _get_default_prompt(self) -> str:
         """Get default system prompt if definition file not found."""
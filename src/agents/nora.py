@@ -3,7 +3,7 @@
 from typing import List, Optional
 
 from src.agents.base import BaseAgent
-from src.discovery.artifacts import get_artifact_counts, load_artifacts
+from src.discovery.artifacts import get_artifact_counts, load_artifacts_by_type, search_artifacts
 from src.discovery.models import ArtifactType
 
 
@@ -32,7 +32,7 @@ class NoraAgent(BaseAgent):
 
     @property
     def commands(self) -> List[str]:
-        return ["*status", "*check", "*agent", "*mandat"]
+        return ["*status", "*check", "*agent", "*mandat", "*suche"]
 
     def _get_mandat_content(self) -> Optional[str]:
         """Load the current mandat content from disk.
@@ -43,10 +43,8 @@ class NoraAgent(BaseAgent):
         Returns:
             Mandat content string or None if no mandat exists
         """
-        artifacts = load_artifacts()
-        for artifact in artifacts:
-            if artifact.type == ArtifactType.MANDAT:
-                return f"**{artifact.title}**\n\n{artifact.content}"
+        for artifact in load_artifacts_by_type(ArtifactType.MANDAT):
+            return f"**{artifact.title}**\n\n{artifact.content}"
         return None
 
     def handle_command(self, command: str) -> Optional[str]:
@@ -68,9 +66,25 @@ class NoraAgent(BaseAgent):
             return self._suggest_agent()
         elif cmd == "*mandat":
             return self._show_mandat()
+        elif cmd == "*suche" or cmd.startswith("*suche "):
+            return self._search(command.strip()[len("*suche"):].strip())
 
         return None
 
+    def _search(self, query: str) -> str:
+        """Search all artifacts on the Discovery Wall."""
+        if not query:
+            return "## 🔎 Suche\n\n*Was soll ich suchen? Beispiel: `*suche interviews onboarding`*"
+
+        results = search_artifacts(query, limit=10)
+        if not results:
+            return f"## 🔎 Suche: {query}\n\n*Keine Artefakte gefunden.*"
+
+        lines = [f"## 🔎 Suche: {query}\n"]
+        for result in results:
+            lines.append(f"- **{result.title}** ({result.type.value}, `{result.artifact_id}`)")
+        return "\n".join(lines)
+
     def _show_mandat(self) -> str:
         """Show current mandat content."""
         mandat = self._get_mandat_content()
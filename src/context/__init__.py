@@ -5,9 +5,25 @@ from src.context.loader import (
     load_context_for_agent,
     get_context_summary
 )
+from src.context.history import (
+    HistorySummary,
+    HistoryWindow,
+    window_history,
+    get_history_budget
+)
+from src.context.summary import RollingSummarizer, create_history_summarizer
+from src.context.packing import pack_context, score_artifacts
 
 __all__ = [
     "AgentContextLoader",
     "load_context_for_agent",
-    "get_context_summary"
+    "get_context_summary",
+    "HistorySummary",
+    "HistoryWindow",
+    "window_history",
+    "get_history_budget",
+    "RollingSummarizer",
+    "create_history_summarizer",
+    "pack_context",
+    "score_artifacts"
 ]
@@ -0,0 +1,224 @@
+"""Chat history windowing - a token budget for the history sent per turn.
+
+Sending the whole conversation every turn makes latency and cost grow
+with the session and eventually exceeds the model's context. The window
+keeps, within the agent's budget:
+
+- the current (last) message, always
+- pinned messages: the greeting that opens the conversation and the
+  outputs of commands (*status, *wechsel, ...), newest first, up to a
+  share of the budget
+- the most recent turns verbatim, as far back as the budget allows
+
+Older turns are dropped. If a rolling summary of them exists (see
+summary.py), it is sent in their place, right before the recent turns.
+
+Once the budget is used up, the oldest recent turn moves forward in
+steps of WINDOW_STEP messages instead of one turn at a time. Between two
+steps the window only grows at its end, so the history sent last turn is
+a prefix of this turn's and the provider's prompt cache can read it.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
+
+from src.llm.tokens import get_token_counter
+
+
+# History token budget per agent (approximate)
+AGENT_HISTORY_BUDGETS = {
+    "nora": 6000,
+    "arthur": 12000,  # Compiles the mandat from the whole conversation
+    "finn": 8000,
+    "ida": 8000,
+    "theo": 8000
+}
+
+DEFAULT_HISTORY_BUDGET = 6000
+
+# Share of the budget pinned messages may take
+PINNED_SHARE = 0.25
+
+# Per-message overhead of the chat format (role, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# Messages the window start moves forward at once when the budget is used up
+WINDOW_STEP = 10
+
+# Heading of the message carrying the summary of dropped turns
+SUMMARY_HEADING = "[Zusammenfassung des bisherigen Gesprächs]"
+
+
+@dataclass
+class HistorySummary:
+    """Rolling summary of the oldest turns of a conversation."""
+    text: str
+    covered: int  # Messages from the start of the conversation it covers
+    updated_at: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return {"text": self.text, "covered": self.covered, "updated_at": self.updated_at}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Optional["HistorySummary"]:
+        """Create from a dict (None if it holds no summary)."""
+        if not data or not data.get("text"):
+            return None
+        return cls(
+            text=data["text"],
+            covered=int(data.get("covered", 0)),
+            updated_at=data.get("updated_at", "")
+        )
+
+    def as_message(self) -> Dict[str, str]:
+        """The summary as a chat message in LLM format."""
+        return {"role": "user", "content": f"{SUMMARY_HEADING}\n\n{self.text}"}
+
+
+@dataclass
+class HistoryWindow:
+    """The messages selected for one LLM request."""
+    messages: List[Dict[str, str]]  # LLM format, chronological
+    tokens: int  # Estimated tokens of the selected messages
+    total_messages: int  # Messages before windowing
+    dropped_messages: int  # Messages left out
+    recent_start: int = 0  # Index of the oldest recent turn sent verbatim (incl. offset)
+    summarized: bool = False  # Whether the summary was sent in place of dropped turns
+
+    @property
+    def kept_messages(self) -> int:
+        """Number of messages sent (without the summary)."""
+        return len(self.messages) - int(self.summarized)
+
+
+def get_history_budget(agent_id: str) -> int:
+    """Get the history token budget of an agent."""
+    return AGENT_HISTORY_BUDGETS.get(agent_id, DEFAULT_HISTORY_BUDGET)
+
+
+def message_tokens(message: Dict[str, Any]) -> int:
+    """Estimate the tokens a message takes in the request."""
+    return get_token_counter().count(message.get("content") or "") + MESSAGE_OVERHEAD_TOKENS
+
+
+def find_pinned(messages: List[Dict[str, Any]], pin_first: bool = True) -> Set[int]:
+    """Find the messages that are kept preferentially.
+
+    Args:
+        messages: Chat messages, chronological
+        pin_first: Whether messages[0] is the start of the conversation
+            (its greeting is pinned)
+
+    Returns:
+        Indexes of the greeting and of assistant messages answering a
+        command (a user message starting with "*")
+    """
+    pinned = set()
+    if pin_first and messages and messages[0].get("role") == "assistant":
+        pinned.add(0)
+
+    in_command = False
+    for index, message in enumerate(messages):
+        if message.get("role") == "user":
+            in_command = (message.get("content") or "").strip().startswith("*")
+        elif in_command:
+            pinned.add(index)
+    return pinned
+
+
+def window_history(
+    messages: List[Dict[str, Any]],
+    budget: int,
+    pin_first: bool = True,
+    pinned_share: float = PINNED_SHARE,
+    summary: Optional[HistorySummary] = None,
+    offset: int = 0,
+    step: int = 1
+) -> HistoryWindow:
+    """Select the messages to send within a token budget.
+
+    Args:
+        messages: Chat messages, chronological (extra fields are ignored)
+        budget: Token budget for the history
+        pin_first: Whether messages[0] is the start of the conversation
+        pinned_share: Share of the budget for pinned messages
+        summary: Summary of older turns, sent in place of dropped ones
+        offset: Index of messages[0] in the full history (earlier
+            messages are not loaded and count as dropped)
+        step: If turns have to be dropped, the oldest recent turn is
+            moved forward to a multiple of step (index in the full
+            history), so the window start only changes every step messages
+
+    Returns:
+        HistoryWindow with the selected messages in LLM format
+    """
+    if not messages:
+        return HistoryWindow(messages=[], tokens=0, total_messages=0, dropped_messages=0, recent_start=offset)
+
+    costs = [message_tokens(message) for message in messages]
+    keep: Set[int] = set()
+
+    # The current message is always sent
+    last = len(messages) - 1
+    keep.add(last)
+    used = costs[last]
+
+    # The summary only takes budget if turns have to be left out
+    summary_cost = 0
+    if summary is not None and summary.covered > 0 and (offset > 0 or sum(costs) > budget):
+        summary_cost = message_tokens(summary.as_message())
+        used += summary_cost
+
+    # Pinned messages, newest first (the greeting always)
+    pinned = find_pinned(messages, pin_first=pin_first)
+    pinned_budget = int(budget * pinned_share)
+    pinned_used = 0
+    for index in sorted(pinned - keep, reverse=True):
+        if index == 0 or pinned_used + costs[index] <= pinned_budget:
+            keep.add(index)
+            pinned_used += costs[index]
+    used += pinned_used
+
+    # Most recent turns verbatim, as far back as the budget allows
+    recent_start = last
+    saturated = False
+    for index in range(last - 1, -1, -1):
+        if index in keep:
+            recent_start = index
+            continue
+        if used + costs[index] > budget:
+            saturated = True
+            break
+        keep.add(index)
+        used += costs[index]
+        recent_start = index
+
+    # Drop the oldest recent turns up to the next step boundary
+    if saturated and step > 1:
+        aligned = min(-(-(offset + recent_start) // step) * step - offset, last)
+        for index in range(recent_start, aligned):
+            if index not in pinned:
+                keep.discard(index)
+        recent_start = aligned
+
+    selected = sorted(keep)
+    window = [{"role": messages[i]["role"], "content": messages[i]["content"]} for i in selected]
+    tokens = sum(costs[i] for i in selected)
+
+    # In place of the dropped turns: after the older pinned messages
+    dropped = offset + len(messages) - len(selected)
+    summarized = summary_cost > 0 and dropped > 0
+    if summarized:
+        position = sum(1 for i in selected if i < recent_start)
+        window.insert(position, summary.as_message())
+        tokens += summary_cost
+
+    return HistoryWindow(
+        messages=window,
+        tokens=tokens,
+        total_messages=offset + len(messages),
+        dropped_messages=dropped,
+        recent_start=offset + recent_start,
+        summarized=summarized
+    )
@@ -5,7 +5,15 @@ from typing import Dict, List, Optional
 from dataclasses import dataclass
 
 from src.discovery.models import ArtifactType, Artifact
-from src.discovery.artifacts import load_artifacts
+from src.discovery.artifacts import (
+    get_artifact_graph,
+    get_artifact_store,
+    load_artifacts_by_type,
+    load_related_artifacts
+)
+from src.llm.tokens import get_token_counter
+
+from .packing import mandat_distances, pack_context, score_artifacts
 
 
 # Token budget per agent (approximate)
@@ -35,6 +43,13 @@ AGENT_ARTIFACT_RELEVANCE = {
     "theo": [ArtifactType.TEST_CARD, ArtifactType.LEARNING_CARD]
 }
 
+# How many related_to links to follow from a focus artifact
+AGENT_RELATED_HOPS = 2
+
+# Heading and closing note of the artifact section
+ARTIFACTS_HEADING = "## Discovery Context\n"
+ARTIFACTS_NOTE = "*Beziehe dich auf diese Artefakte wenn der User nach dem Projekt, Auftrag oder bisherigen Erkenntnissen fragt.*"
+
 
 @dataclass
 class AgentContext:
@@ -44,13 +59,23 @@ class AgentContext:
     knowledge: str  # Book knowledge content
     summary: str
     token_estimate: int
+    knowledge_text: str = ""  # Knowledge section of the summary
+    artifacts_text: str = ""  # Artifact section of the summary
 
 
 class AgentContextLoader:
     """Loads context for agents using Just-In-Time loading."""
 
-    def __init__(self, agent_id: str):
+    def __init__(self, agent_id: str, focus_id: Optional[str] = None):
+        """Initialize the loader.
+
+        Args:
+            agent_id: Agent identifier
+            focus_id: Artifact the conversation is about; if set, only it
+                and its connected artifacts are loaded instead of whole types
+        """
         self.agent_id = agent_id
+        self.focus_id = focus_id
         self.token_budget = AGENT_TOKEN_BUDGETS.get(agent_id, 3000)
         self.relevant_types = AGENT_ARTIFACT_RELEVANCE.get(agent_id, [])
         self.knowledge_files = AGENT_KNOWLEDGE_FILES.get(agent_id, [])
@@ -83,94 +108,157 @@ class AgentContextLoader:
         # Load knowledge from book chapters
         knowledge = self._load_knowledge()
 
-        # Load all artifacts
-        all_artifacts = load_artifacts()
-
-        # Filter to relevant types
-        relevant = [
-            a for a in all_artifacts
-            if a.type in self.relevant_types
-        ]
-
-        # Build context text (knowledge + artifacts)
-        context_text = self._build_context_text(relevant, knowledge)
-        token_estimate = self._estimate_tokens(context_text)
-
-        # Truncate artifacts if over budget (keep knowledge)
-        while token_estimate > self.token_budget and relevant:
-            relevant = relevant[:-1]  # Remove last artifact
-            context_text = self._build_context_text(relevant, knowledge)
-            token_estimate = self._estimate_tokens(context_text)
+        relevant = self._load_artifacts()
+
+        # The knowledge section rarely changes: counted exactly if enabled,
+        # and only once per content (cached by hash)
+        knowledge_text = self._build_knowledge_text(knowledge)
+        knowledge_tokens = self._estimate_tokens(knowledge_text, exact=True)
+
+        # Size each artifact block once, then pack by priority (keep knowledge)
+        blocks = [self._build_artifact_block(artifact) for artifact in relevant]
+        costs = [self._estimate_tokens(block) for block in blocks]
+        frame_tokens = self._estimate_tokens(ARTIFACTS_HEADING + ARTIFACTS_NOTE)
+        chosen = pack_context(
+            costs,
+            self._prioritize(relevant),
+            self.token_budget - knowledge_tokens - frame_tokens
+        )
+        relevant = [relevant[index] for index in chosen]
+        artifacts_text = self._join_artifact_blocks([blocks[index] for index in chosen])
+        token_estimate = knowledge_tokens
+        if chosen:
+            token_estimate += frame_tokens + sum(costs[index] for index in chosen)
 
         return AgentContext(
             agent_id=self.agent_id,
             artifacts=relevant,
             knowledge=knowledge,
-            summary=context_text,
-            token_estimate=token_estimate
+            summary="\n".join(section for section in (knowledge_text, artifacts_text) if section),
+            token_estimate=token_estimate,
+            knowledge_text=knowledge_text,
+            artifacts_text=artifacts_text
         )
 
-    def _build_context_text(self, artifacts: List[Artifact], knowledge: str = "") -> str:
-        """Build context text from knowledge and artifacts.
+    def _load_artifacts(self) -> List[Artifact]:
+        """Load the artifacts to put into the context.
+
+        Returns:
+            The focus artifact and its connected artifacts of the relevant
+            types (nearest first), or all artifacts of the relevant types
+        """
+        if self.focus_id is not None:
+            focus = get_artifact_store().get(self.focus_id)
+            if focus is not None:
+                related = load_related_artifacts(
+                    self.focus_id,
+                    max_hops=AGENT_RELATED_HOPS,
+                    types=self.relevant_types
+                )
+                return [focus] + related
+
+        # Load relevant types only (scans just their subdirectories)
+        return load_artifacts_by_type(*self.relevant_types) if self.relevant_types else []
+
+    def _prioritize(self, artifacts: List[Artifact]) -> List[float]:
+        """Get the packing priority of each artifact.
+
+        Args:
+            artifacts: Artifacts from _load_artifacts()
+
+        Returns:
+            Priorities in artifact order; with a focus artifact, the load
+            order (focus first, then nearest), otherwise the score of
+            status, link to the mandat and recency
+        """
+        if self.focus_id is not None:
+            return [float(-index) for index in range(len(artifacts))]
+        if not artifacts:
+            return []
+        distances = mandat_distances(get_artifact_graph(), AGENT_RELATED_HOPS)
+        return score_artifacts(artifacts, distances)
+
+    def _build_knowledge_text(self, knowledge: str) -> str:
+        """Build the knowledge section of the context text.
 
         Args:
-            artifacts: List of artifacts to include
             knowledge: Book knowledge content
 
         Returns:
-            Formatted context string
+            Formatted knowledge section, or empty string
         """
-        parts = []
-
-        # Add knowledge first (most important)
-        if knowledge:
-            parts.append("## Dein Fachwissen\n")
-            parts.append(knowledge)
-            parts.append("\n---\n")
-            parts.append("*Nutze dieses Wissen um den User bei der Discovery zu unterstützen.*\n")
-
-        # Add artifacts context
-        if artifacts:
-            parts.append("## Discovery Context\n")
-
-            for artifact in artifacts:
-                parts.append(f"### {artifact.type.value.upper()}: {artifact.title}")
-                parts.append(f"Status: {artifact.status.value}")
-                parts.append(f"Erstellt von: {artifact.created_by}")
-                parts.append("")
-                parts.append(artifact.content)
-                parts.append("")
-                parts.append("---")
-                parts.append("")
-
-            parts.append("*Beziehe dich auf diese Artefakte wenn der User nach dem Projekt, Auftrag oder bisherigen Erkenntnissen fragt.*")
+        if not knowledge:
+            return ""
+
+        parts = [
+            "## Dein Fachwissen\n",
+            knowledge,
+            "\n---\n",
+            "*Nutze dieses Wissen um den User bei der Discovery zu unterstützen.*\n"
+        ]
+        return "\n".join(parts)
 
+    def _build_artifact_block(self, artifact: Artifact) -> str:
+        """Build the text of one artifact in the artifact section.
+
+        Args:
+            artifact: Artifact to format
+
+        Returns:
+            Formatted artifact block
+        """
+        parts = [
+            f"### {artifact.type.value.upper()}: {artifact.title}",
+            f"Status: {artifact.status.value}",
+            f"Erstellt von: {artifact.created_by}",
+            "",
+            artifact.content,
+            "",
+            "---",
+            ""
+        ]
         return "\n".join(parts)
 
-    def _estimate_tokens(self, text: str) -> int:
+    def _join_artifact_blocks(self, blocks: List[str]) -> str:
+        """Build the artifact section from formatted artifact blocks.
+
+        Args:
+            blocks: Blocks from _build_artifact_block()
+
+        Returns:
+            Formatted artifact section, or empty string
+        """
+        if not blocks:
+            return ""
+        return "\n".join([ARTIFACTS_HEADING, *blocks, ARTIFACTS_NOTE])
+
+    def _estimate_tokens(self, text: str, exact: bool = False) -> int:
         """Estimate token count for text.
 
-        Simple approximation: ~4 chars per token for German text.
+        Uses the shared token counter (see src/llm/tokens.py), calibrated
+        against the counts reported by the provider.
 
         Args:
             text: Text to estimate
+            exact: Count through the provider's count API if enabled
 
         Returns:
             Estimated token count
         """
-        return len(text) // 4
+        return get_token_counter().count(text, exact=exact)
 
 
-def load_context_for_agent(agent_id: str) -> AgentContext:
+def load_context_for_agent(agent_id: str, focus_id: Optional[str] = None) -> AgentContext:
     """Convenience function to load context for an agent.
 
     Args:
         agent_id: Agent identifier
+        focus_id: Optional artifact to load the connected context for
 
     Returns:
         AgentContext with relevant artifacts
     """
-    loader = AgentContextLoader(agent_id)
+    loader = AgentContextLoader(agent_id, focus_id=focus_id)
     return loader.load()
 
 
@@ -0,0 +1,103 @@
+"""Context packing - choose the artifacts that fit an agent's token budget.
+
+Each artifact block is sized once and gets a priority score; the blocks
+are then taken greedily by priority, skipping those that no longer fit,
+so a large wall is packed in a single pass instead of shrinking the
+context one artifact at a time. The score prefers:
+
+- finished work (COMPLETE over IN_PROGRESS over DRAFT)
+- artifacts linked to the mandat via related_to (fewer hops = closer)
+- recently updated artifacts
+"""
+
+from typing import Dict, List, Sequence
+
+from src.discovery.graph import ArtifactGraph
+from src.discovery.models import Artifact, ArtifactStatus, ArtifactType
+
+
+# Priority per status
+STATUS_PRIORITY = {
+    ArtifactStatus.COMPLETE: 2.0,
+    ArtifactStatus.IN_PROGRESS: 1.0,
+    ArtifactStatus.DRAFT: 0.0
+}
+
+# Priority of a link to the mandat (divided by the number of hops)
+MANDAT_LINK_PRIORITY = 1.5
+
+# Priority of the most recently updated artifact (the oldest gets 0)
+RECENCY_PRIORITY = 1.0
+
+
+def mandat_distances(graph: ArtifactGraph, max_hops: int) -> Dict[str, int]:
+    """Get the hop distance of every artifact near a mandat.
+
+    Args:
+        graph: Artifact link graph
+        max_hops: Maximum number of links to follow
+
+    Returns:
+        Dict of artifact ID -> hops to the nearest mandat (0 for a mandat)
+    """
+    distances: Dict[str, int] = {}
+    for node, type_ in graph.types.items():
+        if type_ != ArtifactType.MANDAT.value:
+            continue
+        distances[node] = 0
+        for linked, hops in graph.closure(node, max_hops=max_hops).items():
+            distances[linked] = min(hops, distances.get(linked, hops))
+    return distances
+
+
+def score_artifacts(artifacts: Sequence[Artifact], distances: Dict[str, int]) -> List[float]:
+    """Score artifacts for the context (higher = more important).
+
+    Args:
+        artifacts: Artifacts to score
+        distances: Hops to the mandat (see mandat_distances())
+
+    Returns:
+        One score per artifact, in the same order
+    """
+    if not artifacts:
+        return []
+
+    timestamps = [artifact.updated_at.timestamp() for artifact in artifacts]
+    oldest, newest = min(timestamps), max(timestamps)
+    span = newest - oldest
+
+    scores = []
+    for artifact, timestamp in zip(artifacts, timestamps):
+        score = STATUS_PRIORITY.get(artifact.status, 0.0)
+        hops = distances.get(artifact.id)
+        if hops is not None:
+            score += MANDAT_LINK_PRIORITY / max(hops, 1)
+        if span > 0:
+            score += RECENCY_PRIORITY * (timestamp - oldest) / span
+        scores.append(score)
+    return scores
+
+
+def pack_context(costs: Sequence[int], priorities: Sequence[float], budget: int) -> List[int]:
+    """Choose the items to put into a context within a token budget.
+
+    Greedy by priority: every item that still fits is taken, so a large
+    low-priority item does not keep smaller ones out.
+
+    Args:
+        costs: Tokens per item
+        priorities: Priority per item (higher first; ties keep input order)
+        budget: Tokens available
+
+    Returns:
+        Indexes of the chosen items, highest priority first
+    """
+    order = sorted(range(len(costs)), key=lambda index: -priorities[index])
+    chosen = []
+    used = 0
+    for index in order:
+        if used + costs[index] <= budget:
+            chosen.append(index)
+            used += costs[index]
+    return chosen
@@ -0,0 +1,260 @@
+"""Rolling summary of the chat history - maintained in the background.
+
+The history window (see history.py) drops the oldest turns once a
+conversation outgrows the agent's budget. The summarizer keeps a summary
+of those turns, which is sent in their place, so the prompt stays about
+the same size across multi-hour workshops without losing the early
+context.
+
+The summary is refreshed incrementally: once N more messages have fallen
+out of the window, the previous summary and those messages are condensed
+into a new one. The request runs on the shared event loop (see
+src/llm/runtime.py) with a separately configured, cheaper model, within
+the rate limits shared with the chat client, and never blocks the user's
+turn; until it finishes, the previous summary is sent. The mandat
+extraction uses the summary as well (see get_extraction_history()).
+The summary is persisted with the session (history-summary.json).
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+from src.discovery.session import load_history_summary, save_history_summary
+from src.discovery.workspace import Workspace
+from src.llm.base import BaseLLMClient
+from src.llm.factory import get_llm_client
+from src.llm.runtime import submit_async
+
+from .history import HistorySummary
+
+
+# Refresh once this many messages have fallen out of the window unsummarized
+DEFAULT_SUMMARY_EVERY = 10
+
+# Most messages condensed per refresh (a long backlog catches up over several turns)
+DEFAULT_MAX_BATCH_MESSAGES = 50
+
+SUMMARY_SYSTEM_PROMPT = """Du führst das Gedächtnis einer Product-Discovery-Session.
+Du erhältst die bisherige Zusammenfassung des Gesprächs und die darauf folgenden Nachrichten.
+Schreibe eine neue, in sich geschlossene Zusammenfassung des gesamten bisherigen Gesprächs.
+
+- Behalte Fakten, Entscheidungen, Zahlen, Namen, offene Fragen und Vereinbarungen.
+- Nenne, welcher Agent was erarbeitet hat.
+- Lass Begrüßungen, Höflichkeiten und Wiederholungen weg.
+- Höchstens 400 Wörter, Stichpunkte, auf Deutsch.
+- Antworte nur mit der Zusammenfassung."""
+
+
+def format_transcript(messages: List[Dict[str, Any]]) -> str:
+    """Format chat messages as a plain transcript for the summarizer.
+
+    Args:
+        messages: Chat messages (agent_name is used if present)
+
+    Returns:
+        One "Speaker: text" paragraph per message
+    """
+    lines = []
+    for message in messages:
+        if message.get("role") == "user":
+            speaker = "Nutzer"
+        else:
+            speaker = message.get("agent_name") or message.get("agent") or "Assistent"
+        lines.append(f"{speaker}: {(message.get('content') or '').strip()}")
+    return "\n\n".join(lines)
+
+
+def summary_llm_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the application config for the summary client.
+
+    The provider section is overlaid with the same provider's section of
+    llm.summary (e.g. a cheaper model and fewer max_tokens).
+
+    Args:
+        config: Full application config dict
+
+    Returns:
+        Config dict for get_llm_client()
+    """
+    llm_config = dict(config.get("llm", {}) or {})
+    provider = llm_config.get("provider", "").lower()
+    overrides = (llm_config.get("summary", {}) or {}).get(provider, {}) or {}
+    llm_config[provider] = {**(llm_config.get(provider, {}) or {}), **overrides}
+    return {**config, "llm": llm_config}
+
+
+class RollingSummarizer:
+    """Keeps the summary of older chat turns up to date in the background."""
+
+    def __init__(
+        self,
+        client: BaseLLMClient,
+        every_messages: int = DEFAULT_SUMMARY_EVERY,
+        max_batch_messages: int = DEFAULT_MAX_BATCH_MESSAGES,
+        summary: Optional[HistorySummary] = None,
+        save: Optional[Callable[[Dict[str, Any]], Any]] = None
+    ):
+        """Initialize the summarizer.
+
+        Args:
+            client: LLM client used for summarizing
+            every_messages: Unsummarized dropped messages that trigger a refresh
+            max_batch_messages: Most messages condensed per refresh
+            summary: Summary to start from (e.g. loaded with the session)
+            save: Persists a new summary (called with HistorySummary.to_dict())
+        """
+        self.client = client
+        self.every_messages = max(1, every_messages)
+        self.max_batch_messages = max(1, max_batch_messages)
+        self.last_error: Optional[str] = None
+
+        self._summary = summary
+        self._save = save
+        self._future: Optional[concurrent.futures.Future] = None
+        self._generation = 0  # Bumped by reset(): results of older refreshes are discarded
+        self._lock = threading.Lock()
+
+    @property
+    def summary(self) -> Optional[HistorySummary]:
+        """The latest finished summary."""
+        with self._lock:
+            return self._summary
+
+    @property
+    def covered(self) -> int:
+        """Messages from the start of the conversation the summary covers."""
+        summary = self.summary
+        return summary.covered if summary is not None else 0
+
+    def is_refreshing(self) -> bool:
+        """Whether a refresh is running."""
+        return self._future is not None and not self._future.done()
+
+    def needs_refresh(self, recent_start: int) -> bool:
+        """Whether enough turns fell out of the window to refresh.
+
+        Args:
+            recent_start: Index of the oldest turn still sent verbatim
+                (HistoryWindow.recent_start)
+        """
+        return recent_start - self.covered >= self.every_messages
+
+    def refresh(
+        self,
+        recent_start: int,
+        load: Callable[[int, int], List[Dict[str, Any]]]
+    ) -> Optional[concurrent.futures.Future]:
+        """Start a refresh in the background if one is due.
+
+        Returns immediately; the current summary stays in use until the
+        refresh has finished.
+
+        Args:
+            recent_start: Index of the oldest turn still sent verbatim
+            load: Returns the messages (offset, limit) of the full history
+
+        Returns:
+            Future of the new summary, or None if no refresh was started
+        """
+        if self.is_refreshing() or not self.needs_refresh(recent_start):
+            return None
+
+        with self._lock:
+            previous = self._summary
+            generation = self._generation
+        start = previous.covered if previous is not None else 0
+        messages = load(start, min(recent_start - start, self.max_batch_messages))
+        if not messages:
+            return None
+
+        self._future = submit_async(self._summarize(previous, messages, start, generation))
+        return self._future
+
+    def reset(self) -> None:
+        """Forget the summary (e.g. when the session is cleared).
+
+        A refresh still running is discarded when it finishes.
+        """
+        with self._lock:
+            self._generation += 1
+            self._summary = None
+            self.last_error = None
+
+    async def _summarize(
+        self,
+        previous: Optional[HistorySummary],
+        messages: List[Dict[str, Any]],
+        start: int,
+        generation: int
+    ) -> Optional[HistorySummary]:
+        """Condense the previous summary and messages into a new summary."""
+        parts = []
+        if previous is not None:
+            parts.append(f"Bisherige Zusammenfassung:\n\n{previous.text}")
+        parts.append(f"Neue Nachrichten:\n\n{format_transcript(messages)}")
+
+        try:
+            text = await self.client.complete(
+                [{"role": "user", "content": "\n\n---\n\n".join(parts)}],
+                SUMMARY_SYSTEM_PROMPT
+            )
+        except Exception as e:
+            self.last_error = str(e)  # The previous summary stays in use
+            return None
+        if not text or not text.strip():
+            return None
+
+        summary = HistorySummary(
+            text=text.strip(),
+            covered=start + len(messages),
+            updated_at=datetime.now().isoformat()
+        )
+        # File I/O off the event loop
+        stored = await asyncio.to_thread(self._store, summary, generation)
+        return summary if stored else None
+
+    def _store(self, summary: HistorySummary, generation: int) -> bool:
+        """Make a new summary current and persist it, unless reset() intervened."""
+        with self._lock:
+            if generation != self._generation:
+                return False
+            self._summary = summary
+            self.last_error = None
+            if self._save is not None:
+                try:
+                    self._save(summary.to_dict())
+                except OSError as e:
+                    self.last_error = str(e)  # Kept in memory; persisted with the next refresh
+            return True
+
+
+def create_history_summarizer(
+    config: Dict[str, Any],
+    workspace: Optional[Workspace] = None
+) -> Optional[RollingSummarizer]:
+    """Create the summarizer of a session from the llm.summary config.
+
+    Args:
+        config: Full application config dict
+        workspace: Session workspace the summary is loaded from and saved to
+
+    Returns:
+        RollingSummarizer, or None if summarizing is disabled or no LLM
+        provider is configured
+    """
+    llm_config = config.get("llm", {}) or {}
+    summary_config = llm_config.get("summary", {}) or {}
+    if not llm_config.get("provider") or not summary_config.get("enabled", True):
+        return None
+
+    return RollingSummarizer(
+        client=get_llm_client(summary_llm_config(config)),
+        every_messages=summary_config.get("every_messages", DEFAULT_SUMMARY_EVERY),
+        max_batch_messages=summary_config.get("max_batch_messages", DEFAULT_MAX_BATCH_MESSAGES),
+        summary=HistorySummary.from_dict(load_history_summary(workspace)),
+        save=partial(save_history_summary, workspace=workspace)
+    )
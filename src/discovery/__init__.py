@@ -4,32 +4,120 @@ from src.discovery.models import (
     ArtifactType,
     ArtifactStatus,
     Artifact,
+    ArtifactHeader,
     DiscoverySession
 )
 from src.discovery.artifacts import (
     save_artifact,
+    save_artifacts,
     load_artifacts,
+    load_artifact_headers,
     load_artifacts_by_type,
-    get_artifact_counts
+    get_artifact_counts,
+    get_artifact_store,
+    set_artifact_store,
+    get_wall_summary,
+    rebuild_wall_summary,
+    search_artifacts,
+    rebuild_search_index,
+    get_artifact_graph,
+    rebuild_artifact_graph,
+    load_related_artifacts
+)
+from src.discovery.store import ArtifactStore
+from src.discovery.markdown_store import MarkdownArtifactStore
+from src.discovery.sqlite_store import SqliteArtifactStore
+from src.discovery.factory import create_artifact_store
+from src.discovery.wall_summary import WallSummary
+from src.discovery.search import SearchResult
+from src.discovery.graph import ArtifactGraph
+from src.discovery.workspace import (
+    Workspace,
+    create_workspace,
+    open_workspace,
+    workspace_exists,
+    set_current_workspace,
+    get_current_workspace,
+    generate_session_id
+)
+from src.discovery.writer import (
+    BackgroundWriter,
+    WriterStats,
+    start_background_writer,
+    get_background_writer,
+    flush_background_writer
 )
 from src.discovery.session import (
+    list_sessions,
     save_session,
+    append_message,
     load_session,
+    load_messages,
+    count_messages,
     clear_session,
-    session_exists
+    session_exists,
+    migrate_legacy_session,
+    recover_session,
+    rebuild_session_catalog,
+    save_history_summary,
+    load_history_summary
 )
+from src.discovery.catalog import SessionCatalog
+from src.discovery.chat_log import RecoveryReport
 
 __all__ = [
     "ArtifactType",
     "ArtifactStatus",
     "Artifact",
+    "ArtifactHeader",
     "DiscoverySession",
     "save_artifact",
+    "save_artifacts",
     "load_artifacts",
+    "load_artifact_headers",
     "load_artifacts_by_type",
     "get_artifact_counts",
+    "get_artifact_store",
+    "set_artifact_store",
+    "get_wall_summary",
+    "rebuild_wall_summary",
+    "WallSummary",
+    "search_artifacts",
+    "rebuild_search_index",
+    "SearchResult",
+    "get_artifact_graph",
+    "rebuild_artifact_graph",
+    "load_related_artifacts",
+    "ArtifactGraph",
+    "ArtifactStore",
+    "MarkdownArtifactStore",
+    "SqliteArtifactStore",
+    "create_artifact_store",
+    "Workspace",
+    "create_workspace",
+    "open_workspace",
+    "workspace_exists",
+    "set_current_workspace",
+    "get_current_workspace",
+    "generate_session_id",
+    "BackgroundWriter",
+    "WriterStats",
+    "start_background_writer",
+    "get_background_writer",
+    "flush_background_writer",
+    "list_sessions",
     "save_session",
+    "append_message",
     "load_session",
+    "load_messages",
+    "count_messages",
     "clear_session",
-    "session_exists"
+    "session_exists",
+    "migrate_legacy_session",
+    "recover_session",
+    "rebuild_session_catalog",
+    "save_history_summary",
+    "load_history_summary",
+    "SessionCatalog",
+    "RecoveryReport"
 ]
@@ -1,246 +1,317 @@
-"""Artifact persistence - save/load artifacts to markdown files."""
+"""Artifact persistence - save/load artifacts through the configured store.
+
+Every function takes an optional workspace (see workspace.py). Without
+one, the current workspace is used, or the legacy wall directory
+DISCOVERY_DIR with the store set by set_artifact_store().
+"""
 
-import os
-import re
-from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
+
+from src.discovery.markdown_store import (
+    MarkdownArtifactStore,
+    parse_frontmatter,
+    parse_artifact,
+    load_artifact_from_file,
+    read_artifact_header
+)
+from src.discovery.graph import ArtifactGraph, get_artifact_graph_file
+from src.discovery.models import Artifact, ArtifactHeader, ArtifactType
+from src.discovery.session import SESSION_FILENAMES, record_session_artifacts
+from src.discovery.search import SearchResult, get_search_index_file
+from src.discovery.store import ArtifactStore
+from src.discovery.wall_summary import WallSummary, get_wall_summary_file
+from src.discovery.workspace import Workspace, get_current_workspace
+
+
+# Base directory for discovery output (legacy single wall)
+DISCOVERY_DIR = Path("_hansel-output/discovery-wall")
 
-import yaml
+# Store selected at startup (None = markdown files under DISCOVERY_DIR)
+_configured_store: Optional[ArtifactStore] = None
 
-from src.discovery.models import Artifact, ArtifactType, ArtifactStatus
 
+def set_artifact_store(store: Optional[ArtifactStore]) -> None:
+    """Set the store used for the legacy wall directory.
 
-# Base directory for discovery output
-DISCOVERY_DIR = Path("_hansel-output/discovery-wall")
+    Args:
+        store: Artifact store, or None to fall back to markdown files
+    """
+    global _configured_store
+    _configured_store = store
 
 
-def ensure_directories():
-    """Ensure all required directories exist."""
-    dirs = [
-        DISCOVERY_DIR,
-        DISCOVERY_DIR / "research",
-        DISCOVERY_DIR / "research" / "insights",
-        DISCOVERY_DIR / "ideen",
-        DISCOVERY_DIR / "tests"
-    ]
-    for d in dirs:
-        d.mkdir(parents=True, exist_ok=True)
+def _resolve_workspace(workspace: Optional[Workspace]) -> Optional[Workspace]:
+    """Get the explicit workspace, else the current one (None = legacy wall)."""
+    return workspace if workspace is not None else get_current_workspace()
 
 
-def clear_all_artifacts():
-    """Delete all artifact files from disk."""
-    if not DISCOVERY_DIR.exists():
-        return
+def get_wall_dir(workspace: Optional[Workspace] = None) -> Path:
+    """Get the wall directory of a workspace.
 
-    # Delete all markdown files in discovery wall
-    for md_file in DISCOVERY_DIR.rglob("*.md"):
-        md_file.unlink()
+    Args:
+        workspace: Workspace (defaults to the current workspace)
 
-    # Also delete session file if exists
-    session_file = DISCOVERY_DIR / "session-meta.yaml"
-    if session_file.exists():
-        session_file.unlink()
+    Returns:
+        Directory holding the artifacts and their indexes
+    """
+    workspace = _resolve_workspace(workspace)
+    return workspace.root if workspace is not None else DISCOVERY_DIR
 
 
-def save_artifact(artifact: Artifact) -> Path:
-    """Save an artifact to a markdown file.
+def get_artifact_store(workspace: Optional[Workspace] = None) -> ArtifactStore:
+    """Get the artifact store of a workspace.
 
     Args:
-        artifact: The artifact to save
+        workspace: Workspace (defaults to the current workspace)
 
     Returns:
-        Path to the saved file
+        The workspace's store, or the configured / default markdown store
+        of the legacy wall
     """
-    ensure_directories()
+    workspace = _resolve_workspace(workspace)
+    if workspace is not None:
+        return workspace.store
+    if _configured_store is not None:
+        return _configured_store
+    return MarkdownArtifactStore(DISCOVERY_DIR)
 
-    # Determine file path
-    subdir = artifact.get_directory()
-    if subdir:
-        file_dir = DISCOVERY_DIR / subdir
-    else:
-        file_dir = DISCOVERY_DIR
 
-    # Generate filename
-    if artifact.type == ArtifactType.MANDAT:
-        filename = "mandat.md"
-    else:
-        filename = f"{artifact.id}.md"
+def get_wall_summary(workspace: Optional[Workspace] = None) -> WallSummary:
+    """Get the materialized wall summary (built from the store if missing).
+
+    Args:
+        workspace: Workspace (defaults to the current workspace)
+
+    Returns:
+        WallSummary with counts, titles, recent artifacts and version
+    """
+    return get_wall_summary_file(get_wall_dir(workspace)).get(get_artifact_store(workspace))
+
+
+def rebuild_wall_summary(workspace: Optional[Workspace] = None) -> WallSummary:
+    """Rebuild the wall summary from the store (e.g. after hand edits).
+
+    Args:
+        workspace: Workspace (defaults to the current workspace)
+
+    Returns:
+        The rebuilt WallSummary
+    """
+    return get_wall_summary_file(get_wall_dir(workspace)).rebuild(get_artifact_store(workspace))
 
-    file_path = file_dir / filename
 
-    # Build frontmatter
-    frontmatter = {
-        "id": artifact.id,
-        "type": artifact.type.value,
-        "status": artifact.status.value,
-        "created_by": artifact.created_by,
-        "created_at": artifact.created_at.isoformat(),
-        "updated_at": datetime.now().isoformat()
-    }
-    if artifact.related_to:
-        frontmatter["related_to"] = artifact.related_to
+def ensure_directories(workspace: Optional[Workspace] = None):
+    """Ensure all required directories exist."""
+    MarkdownArtifactStore(get_wall_dir(workspace)).ensure_directories()
 
-    # Build markdown content
-    yaml_str = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True)
-    content = f"---\n{yaml_str}---\n\n# {artifact.title}\n\n{artifact.content}\n"
 
-    # Write file
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(content)
+def clear_all_artifacts(workspace: Optional[Workspace] = None):
+    """Delete all artifacts.
 
-    return file_path
+    Args:
+        workspace: Workspace (defaults to the current workspace)
+    """
+    wall_dir = get_wall_dir(workspace)
+    get_artifact_store(workspace).clear()
+    summary = get_wall_summary_file(wall_dir).record_clear()
+    record_session_artifacts(summary.counts(), workspace=workspace)
+    get_search_index_file(wall_dir).record_clear()
+    get_artifact_graph_file(wall_dir).record_clear()
 
+    # Also delete session files if they exist
+    for name in SESSION_FILENAMES:
+        session_file = wall_dir / name
+        if session_file.exists():
+            session_file.unlink()
 
-def parse_frontmatter(content: str) -> tuple[Dict, str]:
-    """Parse YAML frontmatter from markdown content.
+
+def save_artifact(artifact: Artifact, workspace: Optional[Workspace] = None) -> Path:
+    """Save an artifact.
 
     Args:
-        content: Raw markdown file content
+        artifact: The artifact to save
+        workspace: Workspace (defaults to the current workspace)
 
     Returns:
-        Tuple of (frontmatter dict, body content)
+        Path to the saved file
     """
-    pattern = r"^---\s*\n(.*?)\n---\s*\n(.*)$"
-    match = re.match(pattern, content, re.DOTALL)
+    return save_artifacts([artifact], workspace=workspace)[0]
+
+
+def save_artifacts(artifacts: Iterable[Artifact], workspace: Optional[Workspace] = None) -> List[Path]:
+    """Save several artifacts at once (e.g. an imported research batch).
+
+    The store writes the batch in one pass and the wall summary, search
+    index, graph and session catalog are updated and persisted once, as
+    a single wall version.
+
+    Args:
+        artifacts: The artifacts to save
+        workspace: Workspace (defaults to the current workspace)
 
-    if match:
-        yaml_str = match.group(1)
-        body = match.group(2)
-        try:
-            frontmatter = yaml.safe_load(yaml_str) or {}
-        except yaml.YAMLError:
-            frontmatter = {}
-        return frontmatter, body.strip()
+    Returns:
+        Paths to the saved files, in input order
+    """
+    artifacts = list(artifacts)
+    if not artifacts:
+        return []
 
-    return {}, content.strip()
+    wall_dir = get_wall_dir(workspace)
+    store = get_artifact_store(workspace)
+    file_paths = store.save_many(artifacts)
+    summary = get_wall_summary_file(wall_dir).record_saves(store, artifacts)
+    record_session_artifacts(summary.counts(), workspace=workspace)
+    get_search_index_file(wall_dir).record_saves(store, artifacts)
+    get_artifact_graph_file(wall_dir).record_saves(store, artifacts)
+    return file_paths
 
 
-def load_artifact_from_file(file_path: Path) -> Optional[Artifact]:
-    """Load an artifact from a markdown file.
+def load_artifact_headers(workspace: Optional[Workspace] = None) -> List[ArtifactHeader]:
+    """Load metadata and titles of all artifacts without their bodies.
 
     Args:
-        file_path: Path to the markdown file
+        workspace: Workspace (defaults to the current workspace)
 
     Returns:
-        Artifact or None if parsing fails
-    """
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        frontmatter, body = parse_frontmatter(content)
-
-        if not frontmatter.get("id") or not frontmatter.get("type"):
-            return None
-
-        # Extract title from body (first # heading)
-        title_match = re.match(r"^#\s+(.+)$", body, re.MULTILINE)
-        title = title_match.group(1) if title_match else "Untitled"
-
-        # Remove title from body
-        body_content = re.sub(r"^#\s+.+\n*", "", body, count=1).strip()
-
-        # Parse dates
-        created_at = frontmatter.get("created_at")
-        if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at)
-        elif not isinstance(created_at, datetime):
-            created_at = datetime.now()
-
-        updated_at = frontmatter.get("updated_at")
-        if isinstance(updated_at, str):
-            updated_at = datetime.fromisoformat(updated_at)
-        elif not isinstance(updated_at, datetime):
-            updated_at = datetime.now()
-
-        return Artifact(
-            id=frontmatter["id"],
-            type=ArtifactType(frontmatter["type"]),
-            title=title,
-            content=body_content,
-            status=ArtifactStatus(frontmatter.get("status", "draft")),
-            created_by=frontmatter.get("created_by", "unknown"),
-            created_at=created_at,
-            updated_at=updated_at,
-            related_to=frontmatter.get("related_to", [])
-        )
-    except Exception:
-        return None
-
-
-def load_artifacts() -> List[Artifact]:
-    """Load all artifacts from the discovery wall directory.
+        List of artifact headers; .content loads the body on access
+    """
+    return get_artifact_store(workspace).load_headers()
+
+
+def load_artifacts(workspace: Optional[Workspace] = None) -> List[Artifact]:
+    """Load all artifacts from the discovery wall.
+
+    Args:
+        workspace: Workspace (defaults to the current workspace)
 
     Returns:
         List of all artifacts
     """
-    ensure_directories()
-    artifacts = []
+    return get_artifact_store(workspace).load_all()
 
-    # Walk through all markdown files
-    for md_file in DISCOVERY_DIR.rglob("*.md"):
-        artifact = load_artifact_from_file(md_file)
-        if artifact:
-            artifacts.append(artifact)
 
-    return artifacts
+def load_artifacts_by_type(
+    *artifact_types: ArtifactType,
+    workspace: Optional[Workspace] = None
+) -> List[Artifact]:
+    """Load artifacts of specific types.
 
-
-def load_artifacts_by_type(artifact_type: ArtifactType) -> List[Artifact]:
-    """Load artifacts of a specific type.
+    Only the subdirectories holding these types are scanned and only
+    matching bodies are read.
 
     Args:
-        artifact_type: Type to filter by
+        artifact_types: Types to filter by
+        workspace: Workspace (defaults to the current workspace)
 
     Returns:
         List of matching artifacts
     """
-    all_artifacts = load_artifacts()
-    return [a for a in all_artifacts if a.type == artifact_type]
+    return get_artifact_store(workspace).by_type(*artifact_types)
 
 
-def get_artifact_counts() -> Dict[str, int]:
+def get_artifact_counts(workspace: Optional[Workspace] = None) -> Dict[str, int]:
     """Get counts of artifacts by wall category.
 
+    Read from the materialized wall summary, not from the artifacts.
+
+    Args:
+        workspace: Workspace (defaults to the current workspace)
+
     Returns:
         Dict with category names and counts
     """
-    artifacts = load_artifacts()
-
-    counts = {
-        "mandat": 0,
-        "problem": 0,
-        "solution": 0,
-        "test": 0
-    }
+    return get_wall_summary(workspace).counts()
 
-    for artifact in artifacts:
-        category = artifact.get_category()
-        if category in counts:
-            counts[category] += 1
 
-    return counts
+def get_artifacts_for_wall(workspace: Optional[Workspace] = None) -> Dict[str, List[str]]:
+    """Get artifact titles grouped by wall category.
 
+    Read from the materialized wall summary, not from the artifacts.
 
-def get_artifacts_for_wall() -> Dict[str, List[str]]:
-    """Get artifact titles grouped by wall category.
+    Args:
+        workspace: Workspace (defaults to the current workspace)
 
     Returns:
         Dict with category names and list of artifact titles
     """
-    artifacts = load_artifacts()
+    return get_wall_summary(workspace).titles()
+
+
+def search_artifacts(
+    query: str,
+    types: Optional[Iterable[ArtifactType]] = None,
+    limit: int = 10,
+    workspace: Optional[Workspace] = None
+) -> List[SearchResult]:
+    """Full-text search over artifact titles and bodies.
+
+    Args:
+        query: Search terms (German umlauts and word forms are normalized)
+        types: Only return artifacts of these types
+        limit: Maximum number of results
+        workspace: Workspace (defaults to the current workspace)
+
+    Returns:
+        Results ordered by relevance
+    """
+    return get_search_index_file(get_wall_dir(workspace)).search(
+        get_artifact_store(workspace), query, types=types, limit=limit
+    )
+
+
+def rebuild_search_index(workspace: Optional[Workspace] = None) -> None:
+    """Rebuild the search index from the store (e.g. after hand edits)."""
+    get_search_index_file(get_wall_dir(workspace)).rebuild(get_artifact_store(workspace))
+
+
+def get_artifact_graph(workspace: Optional[Workspace] = None) -> ArtifactGraph:
+    """Get the related_to graph (built from the store if missing).
+
+    Args:
+        workspace: Workspace (defaults to the current workspace)
+
+    Returns:
+        ArtifactGraph with forward and reverse links
+    """
+    return get_artifact_graph_file(get_wall_dir(workspace)).get(get_artifact_store(workspace))
+
+
+def rebuild_artifact_graph(workspace: Optional[Workspace] = None) -> ArtifactGraph:
+    """Rebuild the related_to graph from the store (e.g. after hand edits).
+
+    Args:
+        workspace: Workspace (defaults to the current workspace)
+
+    Returns:
+        The rebuilt ArtifactGraph
+    """
+    return get_artifact_graph_file(get_wall_dir(workspace)).rebuild(get_artifact_store(workspace))
+
 
-    wall_data = {
-        "mandat": [],
-        "problem": [],
-        "solution": [],
-        "test": []
-    }
+def load_related_artifacts(
+    artifact_id: str,
+    max_hops: int = 1,
+    types: Optional[Iterable[ArtifactType]] = None,
+    workspace: Optional[Workspace] = None
+) -> List[Artifact]:
+    """Load the artifacts connected to an artifact via related_to.
 
-    for artifact in artifacts:
-        category = artifact.get_category()
-        if category in wall_data:
-            wall_data[category].append(artifact.title)
+    Only the connected artifacts are read, nearest first.
 
-    return wall_data
+    Args:
+        artifact_id: Start artifact
+        max_hops: Maximum number of links to follow
+        types: Only return artifacts of these types
+        workspace: Workspace (defaults to the current workspace)
+
+    Returns:
+        List of connected artifacts (start artifact excluded)
+    """
+    graph = get_artifact_graph(workspace)
+    if types is None:
+        distances = graph.closure(artifact_id, max_hops=max_hops)
+        ids = sorted(distances, key=lambda node: (distances[node], node))
+    else:
+        ids = graph.linked(artifact_id, types, max_hops=max_hops)
+    return get_artifact_store(workspace).get_many(ids)
@@ -0,0 +1,349 @@
+"""Session catalog - one index file listing all session workspaces.
+
+The catalog lives in the sessions directory next to the workspaces and
+holds one small entry per session (id, name, timestamps, message count,
+current agent, mandat state and artifact counts). save_session(),
+clear_session(), save_artifacts() and clear_all_artifacts() keep it up
+to date, so the "resume session" picker and admin listings read a single
+file instead of opening every workspace.
+
+Changes are appended to session-catalog.log (see changelog.py), so a
+chat save costs one short line instead of rewriting the whole catalog;
+the JSON file is rewritten once the log has grown long.
+
+Workspaces copied in by hand are not tracked; rebuild the catalog from
+the workspace directories with:
+
+    python -m src.discovery.catalog
+"""
+
+import bisect
+import json
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.discovery.changelog import COMPACT_AFTER_CHANGES, ChangeLog
+from src.utils.files import atomic_write_text
+
+
+# Catalog file inside the sessions directory
+CATALOG_FILENAME = "session-catalog.json"
+
+# Change log of the catalog file
+CATALOG_LOG_FILENAME = "session-catalog.log"
+
+# Fields kept per session (besides artifact_counts)
+CATALOG_FIELDS = (
+    "id", "name", "created_at", "updated_at",
+    "message_count", "current_agent", "mandat_complete"
+)
+
+
+def _name_key(name: str) -> str:
+    """Normalize a session name for prefix search."""
+    return " ".join(name.casefold().split())
+
+
+@dataclass
+class SessionCatalog:
+    """Entries of all sessions, searchable by name prefix."""
+    version: int = 0
+    # session id -> entry
+    entries: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # Sorted (normalized name, session id) pairs, built on first search
+    _names: Optional[List[Tuple[str, str]]] = field(default=None, repr=False, compare=False)
+
+    def record_session(self, meta: Dict[str, Any]) -> bool:
+        """Add or update a session from its metadata.
+
+        Args:
+            meta: Session metadata (see save_session()); needs an "id"
+
+        Returns:
+            Whether the entry changed
+        """
+        fields = {key: meta[key] for key in CATALOG_FIELDS if key in meta}
+        entry = self.entries.setdefault(meta["id"], {})
+        if all(entry.get(key) == value for key, value in fields.items()):
+            return False
+        entry.update(fields)
+        self._names = None
+        self.version += 1
+        return True
+
+    def record_artifacts(self, session_id: str, counts: Dict[str, int]) -> bool:
+        """Update the artifact counts of a session.
+
+        Args:
+            session_id: Session identifier
+            counts: Artifact counts per wall category
+
+        Returns:
+            Whether the counts changed
+        """
+        entry = self.entries.setdefault(session_id, {"id": session_id})
+        if entry.get("artifact_counts") == counts:
+            return False
+        entry["artifact_counts"] = dict(counts)
+        self.version += 1
+        return True
+
+    def record_remove(self, session_id: str) -> bool:
+        """Remove a session (its chat was cleared).
+
+        The artifact counts are kept, since the wall is cleared separately.
+
+        Returns:
+            Whether the session was listed
+        """
+        entry = self.entries.get(session_id)
+        if entry is None:
+            return False
+        counts = entry.get("artifact_counts")
+        self.entries[session_id] = {"id": session_id}
+        if counts is not None:
+            self.entries[session_id]["artifact_counts"] = counts
+        self._names = None
+        self.version += 1
+        return True
+
+    def apply(self, change: Dict[str, Any]) -> bool:
+        """Apply a change as written to the change log.
+
+        Args:
+            change: {"op": "session", "meta": ...}, {"op": "artifacts",
+                "id": ..., "counts": ...} or {"op": "remove", "id": ...}
+
+        Returns:
+            Whether the catalog changed
+        """
+        op = change.get("op")
+        if op == "session":
+            return self.record_session(change["meta"])
+        if op == "artifacts":
+            return self.record_artifacts(change["id"], change["counts"])
+        if op == "remove":
+            return self.record_remove(change["id"])
+        return False
+
+    def sessions(self, prefix: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List saved sessions, most recently updated first.
+
+        Sessions whose chat was never saved are left out.
+
+        Args:
+            prefix: Only sessions whose name starts with this (case-insensitive)
+            limit: Maximum number of sessions
+
+        Returns:
+            Copies of the catalog entries
+        """
+        if prefix:
+            ids = self._search(prefix)
+            candidates = [self.entries[session_id] for session_id in ids]
+        else:
+            candidates = self.entries.values()
+
+        saved = [entry for entry in candidates if entry.get("updated_at")]
+        saved.sort(key=lambda entry: entry["updated_at"], reverse=True)
+        if limit is not None:
+            saved = saved[:limit]
+        return [dict(entry, artifact_counts=dict(entry.get("artifact_counts", {}))) for entry in saved]
+
+    def _search(self, prefix: str) -> List[str]:
+        """Get the IDs of sessions whose name starts with prefix."""
+        if self._names is None:
+            self._names = sorted(
+                (_name_key(entry["name"]), session_id)
+                for session_id, entry in self.entries.items()
+                if entry.get("name")
+            )
+
+        key = _name_key(prefix)
+        start = bisect.bisect_left(self._names, (key, ""))
+        ids = []
+        for name, session_id in self._names[start:]:
+            if not name.startswith(key):
+                break
+            ids.append(session_id)
+        return ids
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the catalog."""
+        return {
+            "version": self.version,
+            "sessions": list(self.entries.values())
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SessionCatalog":
+        """Deserialize a catalog written by to_dict()."""
+        return cls(
+            version=data.get("version", 0),
+            entries={entry["id"]: entry for entry in data.get("sessions", [])}
+        )
+
+
+class SessionCatalogFile:
+    """A session catalog persisted as JSON plus a change log, cached in memory."""
+
+    def __init__(self, path: Path, log_path: Optional[Path] = None):
+        """Initialize the catalog file.
+
+        Args:
+            path: Path of the catalog JSON file
+            log_path: Path of the change log (defaults to
+                CATALOG_LOG_FILENAME next to the JSON file)
+        """
+        self.path = path
+        self._log = ChangeLog(log_path or path.with_name(CATALOG_LOG_FILENAME))
+        self._catalog: Optional[SessionCatalog] = None
+        self._mtime_ns: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _read(self) -> Optional[SessionCatalog]:
+        """Read the catalog from disk, reusing the cached copy if unchanged.
+
+        Changes appended to the log since the last read are applied.
+        """
+        try:
+            mtime_ns = self.path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+        if self._catalog is None or self._mtime_ns != mtime_ns:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    catalog = SessionCatalog.from_dict(json.load(f))
+            except (OSError, ValueError, KeyError, TypeError):
+                return None
+            self._catalog = catalog
+            self._mtime_ns = mtime_ns
+            self._log.rewind()
+
+        catalog = self._catalog
+        for change in self._log.read_new():
+            version = change.get("version", 0)
+            if version <= catalog.version:
+                continue  # Already in the snapshot
+            try:
+                catalog.apply(change)
+            except (KeyError, TypeError, AttributeError):
+                continue
+            catalog.version = version
+        return catalog
+
+    def _write(self, catalog: SessionCatalog) -> None:
+        """Persist the whole catalog, empty the log and cache the catalog."""
+        content = json.dumps(catalog.to_dict(), ensure_ascii=False)
+        atomic_write_text(self.path, content, create_parents=True)
+        self._log.clear()
+        self._catalog = catalog
+        self._mtime_ns = self.path.stat().st_mtime_ns
+
+    def _update(self, scan: Callable[[], Iterable[Dict[str, Any]]], change: Dict[str, Any]) -> SessionCatalog:
+        """Apply a change and log it (the catalog is built with scan if missing).
+
+        Nothing is written if the change leaves the catalog as it is.
+        """
+        with self._lock:
+            catalog = self._read()
+            if catalog is None:
+                # The scan already sees the change
+                catalog = self._build(scan(), version=1)
+                self._write(catalog)
+            elif catalog.apply(change):
+                self._log.append([dict(change, version=catalog.version)])
+                if self._log.count >= COMPACT_AFTER_CHANGES:
+                    self._write(catalog)
+            return catalog
+
+    def get(self, scan: Callable[[], Iterable[Dict[str, Any]]]) -> SessionCatalog:
+        """Get the current catalog, building it if missing.
+
+        Args:
+            scan: Returns the entries of all workspaces; only called when
+                no catalog exists yet
+
+        Returns:
+            The session catalog (treat as read-only)
+        """
+        with self._lock:
+            catalog = self._read()
+            if catalog is None:
+                catalog = self._build(scan(), version=1)
+                self._write(catalog)
+            return catalog
+
+    def record_session(self, scan: Callable[[], Iterable[Dict[str, Any]]], meta: Dict[str, Any]) -> SessionCatalog:
+        """Apply saved session metadata and persist the change."""
+        fields = {key: meta[key] for key in CATALOG_FIELDS if key in meta}
+        return self._update(scan, {"op": "session", "meta": fields})
+
+    def record_artifacts(
+        self,
+        scan: Callable[[], Iterable[Dict[str, Any]]],
+        session_id: str,
+        counts: Dict[str, int]
+    ) -> SessionCatalog:
+        """Apply new artifact counts of a session and persist the change."""
+        return self._update(scan, {"op": "artifacts", "id": session_id, "counts": dict(counts)})
+
+    def record_remove(self, scan: Callable[[], Iterable[Dict[str, Any]]], session_id: str) -> SessionCatalog:
+        """Remove a cleared session and persist the change."""
+        return self._update(scan, {"op": "remove", "id": session_id})
+
+    def rebuild(self, scan: Callable[[], Iterable[Dict[str, Any]]]) -> SessionCatalog:
+        """Rebuild the catalog from a scan, keeping the version monotonic."""
+        with self._lock:
+            previous = self._read()
+            version = (previous.version if previous else 0) + 1
+            catalog = self._build(scan(), version=version)
+            self._write(catalog)
+            return catalog
+
+    def _build(self, entries: Iterable[Dict[str, Any]], version: int) -> SessionCatalog:
+        """Build a catalog from scanned entries."""
+        catalog = SessionCatalog(version=version)
+        for entry in entries:
+            catalog.entries[entry["id"]] = entry
+        return catalog
+
+
+# One catalog file per sessions directory
+_CATALOGS: Dict[Path, SessionCatalogFile] = {}
+_CATALOGS_LOCK = threading.Lock()
+
+
+def get_session_catalog_file(base_dir: Path) -> SessionCatalogFile:
+    """Get the shared catalog file of a sessions directory.
+
+    Args:
+        base_dir: Directory holding the session workspaces
+
+    Returns:
+        SessionCatalogFile for the directory
+    """
+    path = (base_dir / CATALOG_FILENAME).resolve()
+    with _CATALOGS_LOCK:
+        catalog_file = _CATALOGS.get(path)
+        if catalog_file is None:
+            catalog_file = SessionCatalogFile(base_dir / CATALOG_FILENAME)
+            _CATALOGS[path] = catalog_file
+        return catalog_file
+
+
+def main() -> None:
+    """Rebuild the session catalog from the workspace directories."""
+    from src.discovery.session import rebuild_session_catalog
+    from src.utils.config import load_config
+
+    catalog = rebuild_session_catalog(load_config())
+    print(f"Session catalog rebuilt (version {catalog.version}): "
+          f"{len(catalog.sessions())} sessions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Change logs - append-only JSON lines next to a JSON snapshot.
+
+Sidecar files like the session catalog and the search index grow with
+the number of sessions and artifacts; rewriting the whole JSON file for
+every small change costs time proportional to the file. Such files keep
+a change log instead: each change is appended as one fsynced line, and
+the full snapshot is only written when the log has grown long
+(compaction) or on rebuild.
+
+Every change carries the version the snapshot has after applying it.
+Replaying a log skips the changes a snapshot already contains, so a
+crash between writing the snapshot and emptying the log is harmless. A
+torn last line (a crash in the middle of an append) is ignored.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+# Changes appended before the snapshot is rewritten
+COMPACT_AFTER_CHANGES = 200
+
+
+class ChangeLog:
+    """An append-only log of JSON changes, read incrementally.
+
+    Not thread-safe; the owner serializes access with its own lock.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize the log.
+
+        Args:
+            path: Path of the log file (created on the first append)
+        """
+        self.path = path
+        self.count = 0  # Changes read or appended since the last rewind()
+        self._offset = 0  # End of the last complete line read
+        self._size = 0  # Size of the file at the last read or append
+
+    def rewind(self) -> None:
+        """Read the log from the start again (e.g. after a new snapshot was loaded)."""
+        self.count = 0
+        self._offset = 0
+        self._size = 0
+
+    def read_new(self) -> List[Dict[str, Any]]:
+        """Read the changes appended since the last read.
+
+        Returns:
+            Changes in log order (unparseable lines are skipped)
+        """
+        try:
+            with open(self.path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < self._offset:
+                    self.rewind()  # Emptied by someone else; versions skip what is known
+                f.seek(self._offset)
+                data = f.read()
+        except FileNotFoundError:
+            self.rewind()
+            return []
+
+        # An incomplete last line is read again once it is complete
+        end = data.rfind(b"\n") + 1
+        changes = []
+        for line in data[:end].splitlines():
+            try:
+                change = json.loads(line)
+            except ValueError:
+                continue  # Torn line followed by later appends
+            if isinstance(change, dict):
+                changes.append(change)
+
+        self._offset += end
+        self._size = self._offset + len(data) - end
+        self.count += len(changes)
+        return changes
+
+    def append(self, changes: List[Dict[str, Any]]) -> None:
+        """Append changes with a single fsync.
+
+        Call read_new() first, so a torn line left by a crash is known.
+
+        Args:
+            changes: JSON-serializable changes
+        """
+        if not changes:
+            return
+
+        # Start on a fresh line if the last write was torn
+        prefix = b"\n" if self._size != self._offset else b""
+        data = prefix + b"".join(
+            json.dumps(change, ensure_ascii=False).encode("utf-8") + b"\n"
+            for change in changes
+        )
+
+        try:
+            f = open(self.path, "ab")
+        except FileNotFoundError:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            f = open(self.path, "ab")
+        with f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._size += len(data)
+        self._offset = self._size
+        self.count += len(changes)
+
+    def clear(self) -> None:
+        """Delete the log (after its changes were written into a snapshot)."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        self.rewind()
@@ -0,0 +1,370 @@
+"""Append-only chat log with snapshots for paged loading and crash recovery.
+
+The log is a JSONL file with one message per line. Every line carries a
+CRC32 checksum of the message ({"crc": "...", "msg": {...}}) and every
+append is fsynced once for the whole batch, so a crash can at most leave
+a torn last line. recover() rereads the whole log, cuts such a tail off
+and reports it; lines with a wrong checksum are skipped and counted. Next to the log a small
+snapshot (chat-snapshot.json) is rewritten every SNAPSHOT_INTERVAL
+messages. It holds the message count, the byte offset it covers, byte
+offsets of every CHECKPOINT_INTERVAL-th message and the most recent
+messages. Opening a log reads the snapshot plus the lines appended
+after it, so resuming a session costs the same no matter how long the
+conversation is; older pages are read by seeking to a checkpoint.
+"""
+
+import json
+import os
+import threading
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+from src.utils.files import atomic_write_text
+
+
+# File names inside the session directory
+CHAT_LOG_FILENAME = "chat-log.jsonl"
+SNAPSHOT_FILENAME = "chat-snapshot.json"
+
+# Rewrite the snapshot after this many new messages
+SNAPSHOT_INTERVAL = 50
+
+# Messages kept in the snapshot (and in memory) for resuming
+SNAPSHOT_RECENT = 100
+
+# Remember the byte offset of every n-th message for seeking
+CHECKPOINT_INTERVAL = 100
+
+SNAPSHOT_VERSION = 1
+
+# Fixed line layout: CRC_PREFIX + 8 hex digits + MSG_PREFIX + message JSON + b"}\n"
+CRC_PREFIX = b'{"crc":"'
+MSG_PREFIX = b'","msg":'
+
+
+@dataclass
+class RecoveryReport:
+    """Result of checking a chat log after startup."""
+    message_count: int = 0
+    corrupt_records: int = 0  # Complete lines with a wrong checksum (skipped)
+    torn_tail_bytes: int = 0  # Bytes of a partly written last line (cut off)
+    meta_rebuilt: bool = False  # Session metadata was restored from the log
+    legacy_unreadable: bool = False  # An old session-meta.yaml could not be migrated
+
+    @property
+    def has_issues(self) -> bool:
+        """Whether anything had to be skipped or repaired."""
+        return bool(
+            self.corrupt_records or self.torn_tail_bytes or self.meta_rebuilt or self.legacy_unreadable
+        )
+
+
+class ChatLog:
+    """A session's chat log with its snapshot and in-memory tail."""
+
+    def __init__(self, directory: Path):
+        """Initialize the chat log.
+
+        Args:
+            directory: Session directory holding the log files
+        """
+        self.path = directory / CHAT_LOG_FILENAME
+        self.snapshot_path = directory / SNAPSHOT_FILENAME
+        self.lock = threading.RLock()
+        self._reset()
+        self._loaded = False
+
+    def _reset(self) -> None:
+        """Forget all state (empty log)."""
+        self._count = 0
+        self._size = 0  # Bytes of the log file that were scanned
+        self._valid_end = 0  # End of the last complete line
+        self._checkpoints: List[int] = []
+        self._recent: Deque[Dict[str, Any]] = deque(maxlen=SNAPSHOT_RECENT)
+        self._snapshot_count = 0
+        self._corrupt = 0
+
+    def _register(self, record: Dict[str, Any], start: int) -> None:
+        """Account for a record stored at byte offset start."""
+        if self._count % CHECKPOINT_INTERVAL == 0:
+            self._checkpoints.append(start)
+        self._recent.append(record)
+        self._count += 1
+
+    def _sync(self) -> None:
+        """Bring the in-memory state in line with the file on disk."""
+        try:
+            size = self.path.stat().st_size
+        except OSError:
+            self._reset()
+            self._loaded = True
+            return
+
+        if not self._loaded or size < self._size:
+            self._reset()
+            self._read_snapshot(size)
+            self._loaded = True
+        if size != self._size:
+            self._scan_tail()
+
+    def _read_snapshot(self, log_size: int) -> None:
+        """Restore state from the snapshot if it matches the log."""
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            if snapshot.get("version") != SNAPSHOT_VERSION or snapshot["log_offset"] > log_size:
+                return
+            count = snapshot["message_count"]
+            checkpoints = snapshot["checkpoints"]
+            recent = snapshot["recent"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+
+        self._count = count
+        self._size = self._valid_end = snapshot["log_offset"]
+        self._checkpoints = list(checkpoints)
+        self._recent.extend(recent)
+        self._snapshot_count = count
+
+    def _scan_tail(self) -> None:
+        """Read the lines appended after the scanned part of the log."""
+        with open(self.path, "rb") as f:
+            f.seek(self._valid_end)
+            position = self._valid_end
+            for line in f:
+                start = position
+                position += len(line)
+                if not line.endswith(b"\n"):
+                    break  # Torn last line; not a message (yet)
+                self._valid_end = position
+                record = _decode(line)
+                if record is not None:
+                    self._register(record, start)
+                elif line.strip():
+                    self._corrupt += 1
+            self._size = position
+
+        if self._count - self._snapshot_count >= SNAPSHOT_INTERVAL:
+            self._write_snapshot()
+
+    def _write_snapshot(self) -> None:
+        """Persist the current state as the snapshot."""
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "message_count": self._count,
+            "log_offset": self._valid_end,
+            "checkpoints": self._checkpoints,
+            "recent": list(self._recent)
+        }
+        atomic_write_text(self.snapshot_path, json.dumps(snapshot, ensure_ascii=False), create_parents=True)
+        self._snapshot_count = self._count
+
+    def count(self) -> int:
+        """Get the number of messages in the log."""
+        with self.lock:
+            self._sync()
+            return self._count
+
+    def append(self, records: List[Dict[str, Any]]) -> None:
+        """Append records to the log.
+
+        Args:
+            records: Message records to append
+        """
+        if not records:
+            return
+
+        with self.lock:
+            self._sync()
+            # Start on a fresh line if the last write was torn
+            prefix = b"\n" if self._size != self._valid_end else b""
+            lines = [_encode(record) for record in records]
+
+            try:
+                f = open(self.path, "ab")
+            except FileNotFoundError:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                f = open(self.path, "ab")
+            with f:
+                f.write(prefix + b"".join(lines))
+                f.flush()
+                os.fsync(f.fileno())  # One sync for the whole batch
+
+            position = self._size + len(prefix)
+            for record, line in zip(records, lines):
+                self._register(record, position)
+                position += len(line)
+            self._size = self._valid_end = position
+
+            if self._count - self._snapshot_count >= SNAPSHOT_INTERVAL:
+                self._write_snapshot()
+
+    def rewrite(self, records: List[Dict[str, Any]]) -> None:
+        """Replace the whole log.
+
+        Args:
+            records: Message records of the new log
+        """
+        with self.lock:
+            lines = [_encode(record) for record in records]
+            atomic_write_text(self.path, b"".join(lines).decode("utf-8"), create_parents=True)
+
+            self._reset()
+            position = 0
+            for record, line in zip(records, lines):
+                self._register(record, position)
+                position += len(line)
+            self._size = self._valid_end = position
+            self._loaded = True
+            self._write_snapshot()
+
+    def read(self, offset: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Read a page of messages.
+
+        Pages within the recent tail are served from memory; older pages
+        seek to the nearest checkpoint.
+
+        Args:
+            offset: Index of the first message
+            limit: Maximum number of messages (None = all from offset)
+
+        Returns:
+            Message records in log order
+        """
+        with self.lock:
+            self._sync()
+            offset = max(offset, 0)
+            end = self._count if limit is None else min(self._count, offset + limit)
+            if offset >= end:
+                return []
+
+            recent_start = self._count - len(self._recent)
+            if offset >= recent_start:
+                recent = list(self._recent)
+                return recent[offset - recent_start:end - recent_start]
+
+            checkpoint = min(offset // CHECKPOINT_INTERVAL, len(self._checkpoints) - 1)
+            index = checkpoint * CHECKPOINT_INTERVAL
+            records = []
+            with open(self.path, "rb") as f:
+                f.seek(self._checkpoints[checkpoint])
+                for line in f:
+                    if index >= end or not line.endswith(b"\n"):
+                        break
+                    record = _decode(line)
+                    if record is None:
+                        continue
+                    if index >= offset:
+                        records.append(record)
+                    index += 1
+            return records
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Stream all messages from the start of the log."""
+        try:
+            f = open(self.path, "rb")
+        except OSError:
+            return
+        with f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                record = _decode(line)
+                if record is not None:
+                    yield record
+
+    def recover(self) -> RecoveryReport:
+        """Check the whole log and cut off a torn last line.
+
+        The snapshot is ignored: every line is read again, so records
+        corrupted before the snapshot's offset are counted as well, and
+        the snapshot is rewritten from the rescanned state.
+
+        Returns:
+            RecoveryReport with the valid message count, skipped records
+            and the size of the removed tail
+        """
+        with self.lock:
+            self._reset()
+            self._loaded = True
+            if self.path.exists():
+                self._scan_tail()
+            torn = self._size - self._valid_end
+            if torn:
+                with open(self.path, "r+b") as f:
+                    f.truncate(self._valid_end)
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._size = self._valid_end
+
+            return RecoveryReport(
+                message_count=self._count,
+                corrupt_records=self._corrupt,
+                torn_tail_bytes=torn
+            )
+
+    def clear(self) -> None:
+        """Delete the log and its snapshot."""
+        with self.lock:
+            for path in (self.path, self.snapshot_path):
+                if path.exists():
+                    path.unlink()
+            self._reset()
+            self._loaded = True
+
+
+def _encode(record: Dict[str, Any]) -> bytes:
+    """Encode a record as one checksummed log line."""
+    payload = json.dumps(record, ensure_ascii=False).encode("utf-8")
+    crc = b"%08x" % zlib.crc32(payload)
+    return CRC_PREFIX + crc + MSG_PREFIX + payload + b"}\n"
+
+
+def _decode(line: bytes) -> Optional[Dict[str, Any]]:
+    """Decode a log line, or None if it is not a valid record.
+
+    Lines without a checksum (written before checksums were added) are
+    accepted as plain JSON.
+    """
+    line = line.rstrip(b"\r\n")
+    if line.startswith(CRC_PREFIX):
+        start = len(CRC_PREFIX) + 8 + len(MSG_PREFIX)
+        crc = line[len(CRC_PREFIX):len(CRC_PREFIX) + 8]
+        if line[len(CRC_PREFIX) + 8:start] != MSG_PREFIX or not line.endswith(b"}"):
+            return None
+        payload = line[start:-1]
+        if b"%08x" % zlib.crc32(payload) != crc:
+            return None
+        line = payload
+
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    return record if isinstance(record, dict) else None
+
+
+# One chat log per session directory
+_CHAT_LOGS: Dict[Path, ChatLog] = {}
+_CHAT_LOGS_LOCK = threading.Lock()
+
+
+def get_chat_log(directory: Path) -> ChatLog:
+    """Get the shared chat log of a session directory.
+
+    Args:
+        directory: Session directory
+
+    Returns:
+        ChatLog for the directory
+    """
+    key = directory.resolve()
+    with _CHAT_LOGS_LOCK:
+        chat_log = _CHAT_LOGS.get(key)
+        if chat_log is None:
+            chat_log = ChatLog(directory)
+            _CHAT_LOGS[key] = chat_log
+        return chat_log
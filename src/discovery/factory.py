@@ -0,0 +1,41 @@
+"""Artifact store factory for backend selection."""
+
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.discovery.store import ArtifactStore
+from src.discovery.markdown_store import MarkdownArtifactStore
+from src.discovery.sqlite_store import SqliteArtifactStore
+
+
+def create_artifact_store(config: Dict[str, Any], root: Optional[Path] = None) -> ArtifactStore:
+    """Create an artifact store based on configuration.
+
+    Factory function that instantiates the appropriate artifact store
+    based on the 'discovery.store' setting in config. Defaults to the
+    markdown layout.
+
+    Args:
+        config: Full application config dict
+        root: Wall directory (defaults to paths.output)
+
+    Returns:
+        Configured artifact store instance
+
+    Raises:
+        ValueError: If the store backend is unknown
+    """
+    discovery_config = config.get("discovery", {})
+    backend = discovery_config.get("store", "markdown").lower()
+    if root is None:
+        root = Path(config.get("paths", {}).get("output", "_hansel-output/discovery-wall"))
+
+    if backend == "markdown":
+        return MarkdownArtifactStore(root, scan_workers=discovery_config.get("scan_workers", 1))
+    elif backend == "sqlite":
+        return SqliteArtifactStore(root)
+    else:
+        raise ValueError(
+            f"Unknown artifact store: {backend}. "
+            "Supported stores: 'markdown', 'sqlite'"
+        )
@@ -0,0 +1,168 @@
+"""Frontmatter codec for the fixed artifact schema.
+
+Artifact frontmatter always has the same keys (id, type, status,
+created_by, created_at, updated_at, related_to) and simple string values.
+The codec encodes and decodes exactly that shape without going through
+the pure-Python YAML machinery. Anything it does not recognise - comments,
+extra keys, flow collections, multi-line values - is handed to the full
+YAML loader, so hand-edited files keep working.
+
+Run `python -m benchmarks.bench_frontmatter` for a comparison with
+yaml.safe_load.
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+
+# Prefer the libyaml bindings for the fallback path when available
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Keys of the artifact frontmatter schema, in the order yaml.dump sorts them
+SCHEMA_KEYS = ("created_at", "created_by", "id", "related_to", "status", "type", "updated_at")
+LIST_KEYS = {"related_to"}
+
+# Plain scalars that YAML resolves to something other than a string
+_NON_STRING_PLAIN = re.compile(
+    r"""^(?:
+        ~|null|Null|NULL
+        |true|True|TRUE|false|False|FALSE
+        |yes|Yes|YES|no|No|NO|on|On|ON|off|Off|OFF|y|Y|n|N
+        |[-+]?(?:0b[01_]+|0o?[0-7_]+|0x[0-9a-fA-F_]+|[0-9][0-9_]*(?::[0-5]?[0-9])*)
+        |[-+]?(?:\.[0-9]+|[0-9][0-9_]*(?:\.[0-9_]*)?)(?:[eE][-+]?[0-9]+)?
+        |[-+]?\.(?:inf|Inf|INF)|\.(?:nan|NaN|NAN)
+        |[0-9]{4}-[0-9]{1,2}-[0-9]{1,2}(?:[Tt ].*)?
+        |=|<<
+    )$""",
+    re.VERBOSE
+)
+
+# Plain scalars the fast path accepts without quoting
+_SAFE_PLAIN = re.compile(r"^[A-Za-z0-9_][A-Za-z0-9_.\-/]*$")
+
+
+class FrontmatterFormatError(ValueError):
+    """Frontmatter does not match the fixed schema fast path."""
+
+
+def _encode_scalar(value: str) -> str:
+    """Encode a string as a plain or single-quoted YAML scalar."""
+    if _SAFE_PLAIN.match(value) and not _NON_STRING_PLAIN.match(value):
+        return value
+    if any(ch in value for ch in "\n\r\t") or not value.isprintable():
+        raise FrontmatterFormatError(f"Value needs full YAML quoting: {value!r}")
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _decode_scalar(raw: str) -> str:
+    """Decode a plain, single-quoted or simple double-quoted YAML scalar."""
+    if len(raw) >= 2 and raw[0] == "'" and raw[-1] == "'":
+        inner = raw[1:-1]
+        if "'" in inner.replace("''", ""):
+            raise FrontmatterFormatError(f"Malformed quoted value: {raw!r}")
+        return inner.replace("''", "'")
+
+    if len(raw) >= 2 and raw[0] == '"' and raw[-1] == '"':
+        inner = raw[1:-1]
+        if "\\" in inner or '"' in inner:
+            raise FrontmatterFormatError(f"Escaped value: {raw!r}")
+        return inner
+
+    if not _SAFE_PLAIN.match(raw) or _NON_STRING_PLAIN.match(raw):
+        raise FrontmatterFormatError(f"Value is not a plain string: {raw!r}")
+    return raw
+
+
+def dump_frontmatter(fields: Dict[str, Any]) -> str:
+    """Encode artifact frontmatter as YAML.
+
+    Output is block-style YAML with sorted keys, readable by any YAML
+    loader. Falls back to yaml.dump for values the codec cannot encode.
+
+    Args:
+        fields: Frontmatter dict with schema keys and string values
+
+    Returns:
+        YAML text ending with a newline
+    """
+    try:
+        lines: List[str] = []
+        for key in sorted(fields):
+            if key not in SCHEMA_KEYS:
+                raise FrontmatterFormatError(f"Unknown key: {key}")
+            value = fields[key]
+            if key in LIST_KEYS:
+                if not value:
+                    lines.append(f"{key}: []")
+                    continue
+                lines.append(f"{key}:")
+                lines.extend(f"- {_encode_scalar(item)}" for item in value)
+            else:
+                if not isinstance(value, str):
+                    raise FrontmatterFormatError(f"Non-string value for {key}")
+                lines.append(f"{key}: {_encode_scalar(value)}")
+        return "\n".join(lines) + "\n"
+    except (FrontmatterFormatError, TypeError):
+        return yaml.dump(fields, default_flow_style=False, allow_unicode=True)
+
+
+def _load_fast(text: str) -> Dict[str, Any]:
+    """Decode frontmatter in the fixed schema, raising on anything else."""
+    result: Dict[str, Any] = {}
+    current_list: Optional[List[str]] = None
+
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+
+        if line.startswith("- ") or line.startswith("  - "):
+            if current_list is None:
+                raise FrontmatterFormatError("List item outside of a list")
+            current_list.append(_decode_scalar(line.split("- ", 1)[1].strip()))
+            continue
+
+        key, sep, raw = line.partition(":")
+        if not sep or key not in SCHEMA_KEYS or key in result:
+            raise FrontmatterFormatError(f"Unexpected line: {line!r}")
+        raw = raw.strip()
+
+        if key in LIST_KEYS:
+            if raw == "[]":
+                result[key] = []
+                current_list = None
+            elif raw == "":
+                current_list = []
+                result[key] = current_list
+            else:
+                raise FrontmatterFormatError(f"Unsupported list syntax: {line!r}")
+        else:
+            if not raw or raw.startswith("#"):
+                raise FrontmatterFormatError(f"Unsupported value: {line!r}")
+            result[key] = _decode_scalar(raw)
+            current_list = None
+
+    return result
+
+
+def load_frontmatter(text: str) -> Dict[str, Any]:
+    """Decode artifact frontmatter.
+
+    Uses the fixed-schema fast path and falls back to the full YAML
+    loader for anything else.
+
+    Args:
+        text: YAML text between the --- delimiters
+
+    Returns:
+        Frontmatter dict (empty if the YAML is not a mapping)
+
+    Raises:
+        yaml.YAMLError: If the fallback loader cannot parse the text
+    """
+    try:
+        return _load_fast(text)
+    except FrontmatterFormatError:
+        data = yaml.load(text, Loader=YAML_LOADER)
+        return data if isinstance(data, dict) else {}
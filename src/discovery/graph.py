@@ -0,0 +1,277 @@
+"""Relationship graph over related_to links between artifacts.
+
+The graph keeps forward edges (artifact -> IDs in its related_to) and
+reverse edges (artifact -> artifacts linking to it), so neighbours and
+multi-hop chains are answered without scanning the wall. It is built once
+from the artifact headers, updated by save_artifact() and persisted as
+artifact-graph.json next to the wall.
+
+Links are written by whichever agent creates the later artifact, so
+typed queries like "which insights support this idea" follow edges in
+both directions.
+"""
+
+import json
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+from src.discovery.models import Artifact, ArtifactHeader, ArtifactType
+from src.discovery.store import ArtifactStore
+from src.utils.files import atomic_write_text
+
+
+# Graph file inside the discovery wall directory
+GRAPH_FILENAME = "artifact-graph.json"
+
+# Edge directions for traversal
+OUTGOING = "out"
+INCOMING = "in"
+BOTH = "both"
+
+
+class ArtifactGraph:
+    """In-memory adjacency index over related_to links."""
+
+    def __init__(self):
+        # artifact id -> related IDs as stored in related_to
+        self.forward: Dict[str, List[str]] = {}
+        # artifact id -> IDs of artifacts linking to it
+        self.reverse: Dict[str, Set[str]] = {}
+        # artifact id -> type value (only for artifacts on the wall)
+        self.types: Dict[str, str] = {}
+
+    def add(self, artifact: Union[Artifact, ArtifactHeader]) -> None:
+        """Add an artifact and its links, replacing any previous version."""
+        # There is only one mandat per wall (mirrors mandat.md)
+        if artifact.type == ArtifactType.MANDAT:
+            for node_id, type_ in list(self.types.items()):
+                if type_ == ArtifactType.MANDAT.value and node_id != artifact.id:
+                    self.remove(node_id)
+
+        self._add_node(artifact.id, artifact.type.value, artifact.related_to)
+
+    def _add_node(self, node_id: str, type_: str, related_to: Iterable[str]) -> None:
+        """Add a node with its outgoing edges."""
+        self._unlink(node_id)
+        self.types[node_id] = type_
+        self.forward[node_id] = list(dict.fromkeys(related_to))
+        for target in self.forward[node_id]:
+            self.reverse.setdefault(target, set()).add(node_id)
+
+    def _unlink(self, node_id: str) -> None:
+        """Drop the outgoing edges of a node."""
+        for target in self.forward.pop(node_id, []):
+            sources = self.reverse.get(target)
+            if sources is None:
+                continue
+            sources.discard(node_id)
+            if not sources:
+                del self.reverse[target]
+
+    def remove(self, artifact_id: str) -> None:
+        """Remove an artifact; links pointing to it stay as dangling edges."""
+        self._unlink(artifact_id)
+        self.types.pop(artifact_id, None)
+
+    def clear(self) -> None:
+        """Remove all nodes and edges."""
+        self.forward = {}
+        self.reverse = {}
+        self.types = {}
+
+    def __contains__(self, artifact_id: str) -> bool:
+        return artifact_id in self.types
+
+    def neighbors(self, artifact_id: str, direction: str = BOTH) -> List[str]:
+        """Get directly linked artifacts.
+
+        Args:
+            artifact_id: Start artifact
+            direction: OUTGOING (its related_to), INCOMING (artifacts
+                linking to it) or BOTH
+
+        Returns:
+            IDs of linked artifacts on the wall, sorted
+        """
+        result: Set[str] = set()
+        if direction in (OUTGOING, BOTH):
+            result.update(self.forward.get(artifact_id, []))
+        if direction in (INCOMING, BOTH):
+            result.update(self.reverse.get(artifact_id, ()))
+        result.discard(artifact_id)
+        return sorted(node for node in result if node in self.types)
+
+    def closure(self, artifact_id: str, max_hops: int = 1, direction: str = BOTH) -> Dict[str, int]:
+        """Get all artifacts reachable within max_hops links.
+
+        Args:
+            artifact_id: Start artifact
+            max_hops: Maximum number of links to follow
+            direction: Edge direction to follow (see neighbors())
+
+        Returns:
+            Dict of reachable artifact ID -> hop distance (start excluded)
+        """
+        distances = {artifact_id: 0}
+        queue = deque([artifact_id])
+        while queue:
+            node = queue.popleft()
+            if distances[node] >= max_hops:
+                continue
+            for neighbor in self.neighbors(node, direction):
+                if neighbor not in distances:
+                    distances[neighbor] = distances[node] + 1
+                    queue.append(neighbor)
+        del distances[artifact_id]
+        return distances
+
+    def linked(
+        self,
+        artifact_id: str,
+        types: Iterable[ArtifactType],
+        max_hops: int = 1
+    ) -> List[str]:
+        """Get linked artifacts of the given types, nearest first.
+
+        Args:
+            artifact_id: Start artifact
+            types: Artifact types to return
+            max_hops: Maximum number of links to follow
+
+        Returns:
+            Matching artifact IDs ordered by distance, then ID
+        """
+        type_values = {t.value for t in types}
+        distances = self.closure(artifact_id, max_hops=max_hops)
+        return sorted(
+            (node for node in distances if self.types.get(node) in type_values),
+            key=lambda node: (distances[node], node)
+        )
+
+    def supporting_insights(self, idea_id: str) -> List[str]:
+        """Get the insights an idea is linked to."""
+        return self.linked(idea_id, [ArtifactType.INSIGHT])
+
+    def validating_test_cards(self, hmw_id: str) -> List[str]:
+        """Get the test cards validating a HMW challenge.
+
+        Test cards usually link to an idea, which links to the HMW, so
+        two hops are followed.
+        """
+        return self.linked(hmw_id, [ArtifactType.TEST_CARD], max_hops=2)
+
+    def to_dict(self) -> Dict:
+        """Serialize the graph (reverse edges are rebuilt on load)."""
+        return {
+            "nodes": {
+                node_id: {"type": type_, "related_to": self.forward.get(node_id, [])}
+                for node_id, type_ in self.types.items()
+            }
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ArtifactGraph":
+        """Deserialize a graph written by to_dict()."""
+        graph = cls()
+        for node_id, node in data.get("nodes", {}).items():
+            graph._add_node(node_id, node["type"], node["related_to"])
+        return graph
+
+
+class ArtifactGraphFile:
+    """An artifact graph persisted as JSON and kept in memory."""
+
+    def __init__(self, path: Path):
+        """Initialize the graph file.
+
+        Args:
+            path: Path of the graph JSON file
+        """
+        self.path = path
+        self._graph: Optional[ArtifactGraph] = None
+        self._lock = threading.Lock()
+
+    def _load(self, store: ArtifactStore) -> ArtifactGraph:
+        """Get the in-memory graph, reading or building it on first use."""
+        if self._graph is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._graph = ArtifactGraph.from_dict(json.load(f))
+            except (OSError, ValueError, KeyError):
+                self._graph = self._build(store)
+                self._write()
+        return self._graph
+
+    def _build(self, store: ArtifactStore) -> ArtifactGraph:
+        """Build a graph from the artifact headers in the store."""
+        graph = ArtifactGraph()
+        for header in store.load_headers():
+            graph.add(header)
+        return graph
+
+    def _write(self) -> None:
+        """Persist the in-memory graph."""
+        content = json.dumps(self._graph.to_dict(), ensure_ascii=False)
+        atomic_write_text(self.path, content, create_parents=True)
+
+    def get(self, store: ArtifactStore) -> ArtifactGraph:
+        """Get the current graph, building it from the store if missing.
+
+        Args:
+            store: Store to build from when no graph exists yet
+
+        Returns:
+            The artifact graph (treat as read-only)
+        """
+        with self._lock:
+            return self._load(store)
+
+    def record_save(self, store: ArtifactStore, artifact: Artifact) -> None:
+        """Apply a saved artifact and persist the graph."""
+        self.record_saves(store, [artifact])
+
+    def record_saves(self, store: ArtifactStore, artifacts: List[Artifact]) -> None:
+        """Apply several saved artifacts and persist the graph once."""
+        with self._lock:
+            graph = self._load(store)
+            for artifact in artifacts:
+                graph.add(artifact)
+            self._write()
+
+    def record_clear(self) -> None:
+        """Empty the graph and persist it."""
+        with self._lock:
+            self._graph = ArtifactGraph()
+            self._write()
+
+    def rebuild(self, store: ArtifactStore) -> ArtifactGraph:
+        """Rebuild the graph from the store (e.g. after hand edits)."""
+        with self._lock:
+            self._graph = self._build(store)
+            self._write()
+            return self._graph
+
+
+# One graph file per discovery wall directory
+_GRAPHS: Dict[Path, ArtifactGraphFile] = {}
+_GRAPHS_LOCK = threading.Lock()
+
+
+def get_artifact_graph_file(root: Path) -> ArtifactGraphFile:
+    """Get the shared artifact graph for a discovery wall directory.
+
+    Args:
+        root: Discovery wall directory
+
+    Returns:
+        ArtifactGraphFile for the directory
+    """
+    path = (root / GRAPH_FILENAME).resolve()
+    with _GRAPHS_LOCK:
+        graph_file = _GRAPHS.get(path)
+        if graph_file is None:
+            graph_file = ArtifactGraphFile(root / GRAPH_FILENAME)
+            _GRAPHS[path] = graph_file
+        return graph_file
@@ -0,0 +1,287 @@
+"""In-process artifact index - parse each markdown file once, re-parse on change."""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from src.discovery.models import ArtifactHeader, ARTIFACT_DIRECTORIES
+
+
+# Reads the raw header block of a file (I/O, runs on worker threads)
+ReadBlock = Callable[[Path], Optional[Any]]
+# Parses a raw header block into a header (CPU, runs on the calling thread)
+ParseBlock = Callable[[Path, Any], Optional[ArtifactHeader]]
+
+
+@dataclass
+class IndexEntry:
+    """Cached parse result for a single artifact file."""
+    mtime_ns: int
+    size: int
+    header: Optional[ArtifactHeader]  # None if the file is not a valid artifact
+
+
+class ArtifactIndex:
+    """Cache of parsed artifacts for one discovery wall directory.
+
+    Files are identified by (path, mtime, size). A refresh only stats the
+    files on disk and re-reads the headers of those whose signature
+    changed, so repeated loads within one chat turn do not re-read
+    unchanged files. Bodies are loaded lazily by the headers and stay
+    cached with them.
+
+    With more than one worker, stats and file reads run on a thread pool
+    (useful on network-mounted workspaces where each open/read has high
+    latency) while the calling thread parses the results in path order.
+
+    Returned headers are shared between callers and must be treated as
+    read-only.
+    """
+
+    def __init__(self, root: Path, read_block: ReadBlock, parse_block: ParseBlock):
+        """Initialize the index.
+
+        Args:
+            root: Discovery wall directory to index
+            read_block: Function that reads the header block of a file
+            parse_block: Function that parses a header block
+        """
+        self.root = root
+        self._read_block = read_block
+        self._parse_block = parse_block
+        self._entries: Dict[Path, IndexEntry] = {}
+        self._full_scan_done = False
+        # mtime of every wall directory at the last full scan (None = missing)
+        self._dir_mtimes: Dict[Path, Optional[int]] = {}
+        self._lock = threading.Lock()
+
+    def _scan(self, md_file: Path) -> Union[IndexEntry, tuple, None]:
+        """Stat a file and read its header block if it changed.
+
+        Returns:
+            The cached entry if unchanged, (stat, block) if it changed,
+            or None if the file vanished
+        """
+        try:
+            stat = md_file.stat()
+        except OSError:
+            return None  # Deleted between listing and stat
+
+        cached = self._entries.get(md_file)
+        if cached and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+            return cached
+        return stat, self._read_block(md_file)
+
+    def _scan_paths(self, paths: List[Path], workers: int) -> Dict[Path, IndexEntry]:
+        """Scan files and return their entries in path order (vanished files omitted)."""
+        entries: Dict[Path, IndexEntry] = {}
+
+        if workers > 1 and len(paths) > 1:
+            executor = ThreadPoolExecutor(max_workers=min(workers, len(paths)))
+            # map() yields in path order, so parsing overlaps with pending reads
+            results = executor.map(self._scan, paths)
+        else:
+            executor = None
+            results = map(self._scan, paths)
+
+        try:
+            for md_file, result in zip(paths, results):
+                if result is None:
+                    continue
+                if isinstance(result, IndexEntry):
+                    entries[md_file] = result
+                    continue
+
+                stat, block = result
+                entries[md_file] = IndexEntry(
+                    mtime_ns=stat.st_mtime_ns,
+                    size=stat.st_size,
+                    header=self._parse_block(md_file, block) if block is not None else None
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        return entries
+
+    def _is_misplaced(self, md_file: Path, entry: IndexEntry) -> bool:
+        """Check if a file is not in the directory of its artifact type."""
+        if entry.header is None:
+            return False
+        expected = self.root / ARTIFACT_DIRECTORIES.get(entry.header.type, "")
+        return md_file.parent != expected
+
+    def refresh(self, workers: int = 1) -> None:
+        """Sync the index with the files currently on disk.
+
+        Args:
+            workers: Threads used to stat and read files (1 = serial)
+        """
+        with self._lock:
+            self._refresh_all(workers)
+
+    def _refresh_all(self, workers: int) -> None:
+        """Full refresh; caller holds the lock."""
+        # Taken before listing, so files added during the scan count as changes
+        self._dir_mtimes = self._directory_mtimes()
+        paths = sorted(self.root.rglob("*.md")) if self.root.exists() else []
+        self._entries = self._scan_paths(paths, workers)
+        self._full_scan_done = True
+
+    def _directory_mtimes(self) -> Dict[Path, Optional[int]]:
+        """Get the mtime of the wall directory and all its subdirectories."""
+        mtimes: Dict[Path, Optional[int]] = {self.root: _mtime_ns(self.root)}
+        for directory, _, _ in os.walk(self.root):
+            mtimes[Path(directory)] = _mtime_ns(Path(directory))
+        return mtimes
+
+    def _wall_changed(self) -> bool:
+        """Check if files were added, removed or renamed anywhere in the wall.
+
+        Adding, removing or renaming an entry changes its directory's
+        mtime (a new subdirectory changes its parent's), so a few stats
+        tell whether a file may have appeared outside the scanned
+        directories since the last full scan.
+        """
+        return any(_mtime_ns(directory) != mtime_ns for directory, mtime_ns in self._dir_mtimes.items())
+
+    def _note_own_write(self, file_path: Path) -> None:
+        """Accept the directory mtime change of a file written through the index."""
+        if file_path.parent in self._dir_mtimes:
+            self._dir_mtimes[file_path.parent] = _mtime_ns(file_path.parent)
+
+    def _refresh_directories(self, directories: List[Path], workers: int) -> List[Path]:
+        """Refresh only files directly inside the given directories.
+
+        Files known to be misplaced (found by an earlier full scan outside
+        the directory of their type) are re-checked as well. To find new
+        misplaced files, a full scan runs instead if no full scan was done
+        yet or a file was added, removed or renamed in any wall directory
+        since the last one (except by update()). Caller holds the lock.
+
+        Returns:
+            Paths of the refreshed files, in path order
+        """
+        if not self._full_scan_done or self._wall_changed():
+            self._refresh_all(workers)
+            return list(self._entries)
+
+        scope = set(directories)
+        listed = {
+            md_file
+            for directory in scope if directory.is_dir()
+            for md_file in directory.glob("*.md")
+        }
+        known = {
+            md_file for md_file, entry in self._entries.items()
+            if md_file.parent in scope or self._is_misplaced(md_file, entry)
+        }
+        paths = sorted(listed | known)
+
+        scanned = self._scan_paths(paths, workers)
+        for md_file in paths:
+            if md_file in scanned:
+                self._entries[md_file] = scanned[md_file]
+            else:
+                self._entries.pop(md_file, None)
+
+        return list(scanned)
+
+    def headers(
+        self,
+        workers: int = 1,
+        directories: Optional[List[Path]] = None
+    ) -> List[ArtifactHeader]:
+        """Get valid artifact headers, refreshing changed files first.
+
+        Args:
+            workers: Threads used to stat and read files (1 = serial)
+            directories: Only scan files directly inside these directories
+                (plus known misplaced files); None scans the whole wall
+
+        Returns:
+            List of headers in path order
+        """
+        with self._lock:
+            if directories is None:
+                self._refresh_all(workers)
+                paths = list(self._entries)
+            else:
+                paths = self._refresh_directories(directories, workers)
+
+            headers = []
+            for md_file in paths:
+                entry = self._entries.get(md_file)
+                if entry is not None and entry.header is not None:
+                    headers.append(entry.header)
+            return headers
+
+    def update(self, file_path: Path, header: Optional[ArtifactHeader]) -> None:
+        """Record a freshly written file without re-reading it.
+
+        Args:
+            file_path: Path of the file that was just written
+            header: Header of the written artifact
+        """
+        try:
+            stat = file_path.stat()
+        except OSError:
+            self.remove(file_path)
+            return
+
+        with self._lock:
+            self._entries[file_path] = IndexEntry(
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                header=header
+            )
+            self._note_own_write(file_path)
+
+    def remove(self, file_path: Path) -> None:
+        """Drop a file from the index."""
+        with self._lock:
+            self._entries.pop(file_path, None)
+            self._note_own_write(file_path)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries = {}
+            self._full_scan_done = False
+            self._dir_mtimes = {}
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Get the mtime of a path, or None if it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+# One index per discovery wall directory
+_INDEXES: Dict[Path, ArtifactIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_artifact_index(root: Path, read_block: ReadBlock, parse_block: ParseBlock) -> ArtifactIndex:
+    """Get the shared index for a discovery wall directory.
+
+    Args:
+        root: Discovery wall directory
+        read_block: Function that reads the header block of a file
+        parse_block: Function that parses a header block
+
+    Returns:
+        ArtifactIndex for the directory
+    """
+    key = root.resolve()
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = ArtifactIndex(root, read_block, parse_block)
+            _INDEXES[key] = index
+        return index
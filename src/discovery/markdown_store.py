@@ -0,0 +1,423 @@
+"""Markdown artifact store - one markdown file with YAML frontmatter per artifact."""
+
+import re
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import yaml
+
+from src.discovery.frontmatter import dump_frontmatter, load_frontmatter
+from src.discovery.index import ArtifactIndex, get_artifact_index
+from src.discovery.models import (
+    Artifact,
+    ArtifactHeader,
+    ArtifactType,
+    ArtifactStatus,
+    ARTIFACT_DIRECTORIES
+)
+from src.discovery.store import ArtifactStore
+from src.utils.files import atomic_write_text
+
+
+FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)$", re.DOTALL)
+TITLE_PATTERN = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+
+# Wall directories whose subdirectories were already created in this process
+_ENSURED_ROOTS: Set[Path] = set()
+
+
+def render_artifact(artifact: Artifact, updated_at: datetime) -> str:
+    """Render an artifact as markdown with YAML frontmatter.
+
+    Args:
+        artifact: The artifact to render
+        updated_at: Timestamp to write as updated_at
+
+    Returns:
+        Markdown file content
+    """
+    # Build frontmatter
+    frontmatter = {
+        "id": artifact.id,
+        "type": artifact.type.value,
+        "status": artifact.status.value,
+        "created_by": artifact.created_by,
+        "created_at": artifact.created_at.isoformat(),
+        "updated_at": updated_at.isoformat()
+    }
+    if artifact.related_to:
+        frontmatter["related_to"] = artifact.related_to
+
+    # Build markdown content
+    yaml_str = dump_frontmatter(frontmatter)
+    return f"---\n{yaml_str}---\n\n# {artifact.title}\n\n{artifact.content}\n"
+
+
+def parse_frontmatter(content: str) -> tuple[Dict, str]:
+    """Parse YAML frontmatter from markdown content.
+
+    Args:
+        content: Raw markdown file content
+
+    Returns:
+        Tuple of (frontmatter dict, body content)
+    """
+    match = FRONTMATTER_PATTERN.match(content)
+
+    if match:
+        yaml_str = match.group(1)
+        body = match.group(2)
+        try:
+            frontmatter = load_frontmatter(yaml_str)
+        except yaml.YAMLError:
+            frontmatter = {}
+        return frontmatter, body.strip()
+
+    return {}, content.strip()
+
+
+def parse_artifact(content: str) -> Optional[Artifact]:
+    """Parse an artifact from raw markdown content.
+
+    Args:
+        content: Raw markdown file content
+
+    Returns:
+        Artifact or None if parsing fails
+    """
+    try:
+        frontmatter, body = parse_frontmatter(content)
+
+        if not frontmatter.get("id") or not frontmatter.get("type"):
+            return None
+
+        # Extract title from body (first # heading)
+        title_match = TITLE_PATTERN.match(body)
+        title = title_match.group(1) if title_match else "Untitled"
+
+        # Remove title from body
+        body_content = re.sub(r"^#\s+.+\n*", "", body, count=1).strip()
+
+        return Artifact(
+            title=title,
+            content=body_content,
+            **_frontmatter_fields(frontmatter)
+        )
+    except Exception:
+        return None
+
+
+def _parse_datetime(value: Any) -> datetime:
+    """Parse a frontmatter date (ISO string or YAML datetime)."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    elif isinstance(value, datetime):
+        return value
+    return datetime.now()
+
+
+def _frontmatter_fields(frontmatter: Dict) -> Dict[str, Any]:
+    """Get the artifact fields stored in the frontmatter."""
+    return {
+        "id": frontmatter["id"],
+        "type": ArtifactType(frontmatter["type"]),
+        "status": ArtifactStatus(frontmatter.get("status", "draft")),
+        "created_by": frontmatter.get("created_by", "unknown"),
+        "created_at": _parse_datetime(frontmatter.get("created_at")),
+        "updated_at": _parse_datetime(frontmatter.get("updated_at")),
+        "related_to": frontmatter.get("related_to", [])
+    }
+
+
+def load_artifact_from_file(file_path: Path) -> Optional[Artifact]:
+    """Load an artifact from a markdown file.
+
+    Args:
+        file_path: Path to the markdown file
+
+    Returns:
+        Artifact or None if parsing fails
+    """
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            content = f.read()
+    except Exception:
+        return None
+
+    return parse_artifact(content)
+
+
+def _load_body(file_path: Path) -> str:
+    """Load the body of an artifact file (without title)."""
+    artifact = load_artifact_from_file(file_path)
+    return artifact.content if artifact else ""
+
+
+def read_header_block(file_path: Path) -> Optional[Tuple[str, str]]:
+    """Read the frontmatter block and title line of a markdown file.
+
+    This is the I/O half of header loading: it stops reading at the first
+    heading and does no YAML parsing, so it can run on a thread pool.
+
+    Args:
+        file_path: Path to the markdown file
+
+    Returns:
+        Tuple of (frontmatter YAML text, title) or None if there is no
+        frontmatter or the file cannot be read
+    """
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            if f.readline().strip() != "---":
+                return None
+
+            yaml_lines = []
+            for line in f:
+                if line.rstrip() == "---":
+                    break
+                yaml_lines.append(line)
+            else:
+                return None  # Unterminated frontmatter
+
+            # Title is the first non-empty line if it is a # heading
+            title = "Untitled"
+            for line in f:
+                if line.strip():
+                    title_match = TITLE_PATTERN.match(line.strip())
+                    if title_match:
+                        title = title_match.group(1)
+                    break
+    except Exception:
+        return None
+
+    return "".join(yaml_lines), title
+
+
+def parse_header_block(file_path: Path, block: Tuple[str, str]) -> Optional[ArtifactHeader]:
+    """Parse a block returned by read_header_block() into a header.
+
+    Args:
+        file_path: Path of the markdown file (for lazy body loading)
+        block: Tuple of (frontmatter YAML text, title)
+
+    Returns:
+        ArtifactHeader or None if parsing fails
+    """
+    yaml_text, title = block
+    try:
+        frontmatter = load_frontmatter(yaml_text)
+
+        if not frontmatter.get("id") or not frontmatter.get("type"):
+            return None
+
+        header = ArtifactHeader(title=title, **_frontmatter_fields(frontmatter))
+        header.set_content_loader(partial(_load_body, file_path))
+        return header
+    except Exception:
+        return None
+
+
+def read_artifact_header(file_path: Path) -> Optional[ArtifactHeader]:
+    """Read only the frontmatter and title of a markdown file.
+
+    Stops reading at the first heading; the body is loaded lazily when
+    the header's content is accessed.
+
+    Args:
+        file_path: Path to the markdown file
+
+    Returns:
+        ArtifactHeader or None if parsing fails
+    """
+    block = read_header_block(file_path)
+    if block is None:
+        return None
+    return parse_header_block(file_path, block)
+
+
+class MarkdownArtifactStore(ArtifactStore):
+    """Markdown file artifact store.
+
+    Stores every artifact as a markdown file in the subdirectory given by
+    Artifact.get_directory(). This is the default layout and the one
+    users can edit by hand.
+    """
+
+    def __init__(self, root: Path, scan_workers: int = 1):
+        """Initialize markdown store.
+
+        Args:
+            root: Discovery wall directory
+            scan_workers: Threads used to read changed files (1 = serial)
+        """
+        self.root = root
+        self.scan_workers = scan_workers
+
+    @property
+    def index(self) -> ArtifactIndex:
+        """Shared in-process index for this directory."""
+        return get_artifact_index(self.root, read_header_block, parse_header_block)
+
+    def ensure_directories(self, force: bool = False) -> None:
+        """Ensure all required directories exist.
+
+        The directories are created once per process and wall directory.
+
+        Args:
+            force: Check the directories again even if already done
+        """
+        key = self.root.resolve()
+        if key in _ENSURED_ROOTS and not force:
+            return
+
+        dirs = [
+            self.root,
+            self.root / "research",
+            self.root / "research" / "insights",
+            self.root / "ideen",
+            self.root / "tests"
+        ]
+        for d in dirs:
+            d.mkdir(parents=True, exist_ok=True)
+        _ENSURED_ROOTS.add(key)
+
+    def get_file_path(self, artifact: Artifact) -> Path:
+        """Get the markdown file path for an artifact.
+
+        Args:
+            artifact: The artifact
+
+        Returns:
+            Path of the artifact's markdown file
+        """
+        # Determine file path
+        subdir = artifact.get_directory()
+        if subdir:
+            file_dir = self.root / subdir
+        else:
+            file_dir = self.root
+
+        # Generate filename
+        if artifact.type == ArtifactType.MANDAT:
+            filename = "mandat.md"
+        else:
+            filename = f"{artifact.id}.md"
+
+        return file_dir / filename
+
+    def save(self, artifact: Artifact) -> Path:
+        """Save an artifact to a markdown file.
+
+        The file is replaced atomically, so readers never see a partly
+        written artifact.
+
+        Args:
+            artifact: The artifact to save
+
+        Returns:
+            Path to the saved file
+        """
+        self.ensure_directories()
+        return self._write(artifact, datetime.now())
+
+    def save_many(self, artifacts: Iterable[Artifact]) -> List[Path]:
+        """Save several artifacts with a single directory check.
+
+        Args:
+            artifacts: The artifacts to save
+
+        Returns:
+            Paths to the saved files, in input order
+        """
+        self.ensure_directories()
+        updated_at = datetime.now()
+        return [self._write(artifact, updated_at) for artifact in artifacts]
+
+    def _write(self, artifact: Artifact, updated_at: datetime) -> Path:
+        """Write one artifact file and update the index."""
+        file_path = self.get_file_path(artifact)
+        content = render_artifact(artifact, updated_at)
+
+        try:
+            atomic_write_text(file_path, content)
+        except FileNotFoundError:
+            # Directory was removed behind our back
+            self.ensure_directories(force=True)
+            atomic_write_text(file_path, content)
+
+        # Update index from the content we just wrote (no re-read needed)
+        saved = parse_artifact(content)
+        header = ArtifactHeader.from_artifact(saved) if saved else None
+        if header:
+            header.set_content_loader(partial(_load_body, file_path))
+        self.index.update(file_path, header)
+
+        return file_path
+
+    def load_headers(self) -> List[ArtifactHeader]:
+        """Load all artifact headers from the discovery wall directory.
+
+        Headers are served from an in-process index; files are only
+        re-read when their mtime or size changed since the last load.
+
+        Returns:
+            List of all artifact headers
+        """
+        self.ensure_directories()
+
+        # Only new or changed files are read, the rest comes from the index
+        return self.index.headers(workers=self.scan_workers)
+
+    def query(
+        self,
+        types: Optional[Iterable[ArtifactType]] = None,
+        status: Optional[ArtifactStatus] = None,
+        created_by: Optional[str] = None,
+        related_to: Optional[str] = None
+    ) -> List[Artifact]:
+        """Load artifacts matching all given filters.
+
+        Type-scoped queries only scan the subdirectories that hold the
+        requested types (see Artifact.get_directory()), plus files found
+        outside their type's directory by a full scan. The full scan is
+        repeated when files were added or moved elsewhere in the wall.
+        """
+        if types is None:
+            return super().query(status=status, created_by=created_by, related_to=related_to)
+
+        type_set = set(types)
+        directories = sorted({self.root / ARTIFACT_DIRECTORIES.get(t, "") for t in type_set})
+        headers = self.index.headers(workers=self.scan_workers, directories=directories)
+
+        return [
+            h.to_artifact() for h in headers
+            if h.type in type_set
+            and (status is None or h.status == status)
+            and (created_by is None or h.created_by == created_by)
+            and (related_to is None or related_to in h.related_to)
+        ]
+
+    def load_all(self) -> List[Artifact]:
+        """Load all artifacts from the discovery wall directory.
+
+        Returns:
+            List of all artifacts
+        """
+        return [header.to_artifact() for header in self.load_headers()]
+
+    def clear(self) -> None:
+        """Delete all artifact files from disk."""
+        if not self.root.exists():
+            return
+
+        self.index.clear()
+
+        # Delete all markdown files in discovery wall
+        for md_file in self.root.rglob("*.md"):
+            md_file.unlink()
+
+    def get_store_name(self) -> str:
+        """Return store name."""
+        return "Markdown"
@@ -2,8 +2,8 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import Callable, List, Optional
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class ArtifactType(str, Enum):
@@ -24,6 +24,32 @@ class ArtifactStatus(str, Enum):
     COMPLETE = "complete"
 
 
+# Wall categories in display order
+WALL_CATEGORIES = ["mandat", "problem", "solution", "test"]
+
+# Wall category per artifact type
+ARTIFACT_CATEGORIES = {
+    ArtifactType.MANDAT: "mandat",
+    ArtifactType.RESEARCH_QUESTION: "problem",
+    ArtifactType.INSIGHT: "problem",
+    ArtifactType.HMW_CHALLENGE: "solution",
+    ArtifactType.IDEA: "solution",
+    ArtifactType.TEST_CARD: "test",
+    ArtifactType.LEARNING_CARD: "test"
+}
+
+# Subdirectory (relative to the discovery wall) per artifact type
+ARTIFACT_DIRECTORIES = {
+    ArtifactType.MANDAT: "",
+    ArtifactType.RESEARCH_QUESTION: "research",
+    ArtifactType.INSIGHT: "research/insights",
+    ArtifactType.HMW_CHALLENGE: "ideen",
+    ArtifactType.IDEA: "ideen",
+    ArtifactType.TEST_CARD: "tests",
+    ArtifactType.LEARNING_CARD: "tests"
+}
+
+
 class Artifact(BaseModel):
     """A Discovery artifact."""
     id: str
@@ -38,29 +64,79 @@ class Artifact(BaseModel):
 
     def get_category(self) -> str:
         """Get the wall category for this artifact type."""
-        type_to_category = {
-            ArtifactType.MANDAT: "mandat",
-            ArtifactType.RESEARCH_QUESTION: "problem",
-            ArtifactType.INSIGHT: "problem",
-            ArtifactType.HMW_CHALLENGE: "solution",
-            ArtifactType.IDEA: "solution",
-            ArtifactType.TEST_CARD: "test",
-            ArtifactType.LEARNING_CARD: "test"
-        }
-        return type_to_category.get(self.type, "problem")
+        return ARTIFACT_CATEGORIES.get(self.type, "problem")
 
     def get_directory(self) -> str:
         """Get the subdirectory for this artifact type."""
-        type_to_dir = {
-            ArtifactType.MANDAT: "",
-            ArtifactType.RESEARCH_QUESTION: "research",
-            ArtifactType.INSIGHT: "research/insights",
-            ArtifactType.HMW_CHALLENGE: "ideen",
-            ArtifactType.IDEA: "ideen",
-            ArtifactType.TEST_CARD: "tests",
-            ArtifactType.LEARNING_CARD: "tests"
-        }
-        return type_to_dir.get(self.type, "")
+        return ARTIFACT_DIRECTORIES.get(self.type, "")
+
+
+class ArtifactHeader(BaseModel):
+    """Artifact metadata and title without the body.
+
+    The body is loaded on first access of .content, so counting and
+    listing artifacts never reads long research transcripts.
+    """
+    id: str
+    type: ArtifactType
+    title: str
+    status: ArtifactStatus = ArtifactStatus.DRAFT
+    created_by: str
+    created_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now)
+    related_to: List[str] = Field(default_factory=list)
+
+    _content_loader: Optional[Callable[[], str]] = PrivateAttr(default=None)
+    _content: Optional[str] = PrivateAttr(default=None)
+    _artifact: Optional[Artifact] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_artifact(cls, artifact: Artifact) -> "ArtifactHeader":
+        """Create a header for a fully loaded artifact."""
+        header = cls(
+            id=artifact.id,
+            type=artifact.type,
+            title=artifact.title,
+            status=artifact.status,
+            created_by=artifact.created_by,
+            created_at=artifact.created_at,
+            updated_at=artifact.updated_at,
+            related_to=list(artifact.related_to)
+        )
+        header._content = artifact.content
+        header._artifact = artifact
+        return header
+
+    def set_content_loader(self, loader: Callable[[], str]) -> None:
+        """Set the function that loads the body on first access."""
+        self._content_loader = loader
+
+    @property
+    def content(self) -> str:
+        """Artifact body, loaded on first access."""
+        if self._content is None:
+            self._content = self._content_loader() if self._content_loader else ""
+        return self._content
+
+    def get_category(self) -> str:
+        """Get the wall category for this artifact type."""
+        return ARTIFACT_CATEGORIES.get(self.type, "problem")
+
+    def to_artifact(self) -> Artifact:
+        """Get the full artifact, loading the body if needed."""
+        if self._artifact is None:
+            self._artifact = Artifact(
+                id=self.id,
+                type=self.type,
+                title=self.title,
+                content=self.content,
+                status=self.status,
+                created_by=self.created_by,
+                created_at=self.created_at,
+                updated_at=self.updated_at,
+                related_to=self.related_to
+            )
+        return self._artifact
 
 
 class DiscoverySession(BaseModel):
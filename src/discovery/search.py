@@ -0,0 +1,391 @@
+"""Full-text search over artifact titles and bodies.
+
+An inverted index (term -> artifact IDs with term frequencies) is kept up
+to date by save_artifact() and persisted as search-index.json next to the
+wall. Saves append the indexed documents to search-index.log (see
+changelog.py), which is folded into the JSON file once it has grown long
+or when the index is rebuilt. Text is normalized for German: lowercased, umlauts folded
+(ä -> ae, ß -> ss) and reduced by a small suffix stemmer, so "Nutzerinnen",
+"Nutzer" and "nutzern" find each other.
+"""
+
+import bisect
+import json
+import math
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from src.discovery.changelog import COMPACT_AFTER_CHANGES, ChangeLog
+from src.discovery.models import Artifact, ArtifactType
+from src.discovery.store import ArtifactStore
+from src.utils.files import atomic_write_text
+
+
+# Index file inside the discovery wall directory
+SEARCH_INDEX_FILENAME = "search-index.json"
+
+# Change log of the index file
+SEARCH_INDEX_LOG_FILENAME = "search-index.log"
+
+# Title terms count this many times as often as body terms
+TITLE_WEIGHT = 3
+
+UMLAUT_MAP = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Longest first; only stripped if at least MIN_STEM_LENGTH characters remain
+SUFFIXES = (
+    "innen", "ungen", "heiten", "keiten",
+    "ung", "heit", "keit", "isch", "lich", "in",
+    "ern", "em", "en", "er", "es", "e", "n", "s"
+)
+MIN_STEM_LENGTH = 3
+
+STOPWORDS = {
+    "der", "die", "das", "den", "dem", "des", "ein", "eine", "einer", "eines", "einem", "einen",
+    "und", "oder", "aber", "mit", "von", "zu", "zum", "zur", "im", "in", "an", "am", "auf",
+    "fuer", "ist", "sind", "war", "wie", "was", "wir", "ich", "du", "sie", "es", "er",
+    "nicht", "auch", "als", "bei", "aus", "so", "dass", "noch", "nur", "um", "the", "a", "of"
+}
+
+
+def stem(word: str) -> str:
+    """Reduce a folded, lowercased word with a simple German suffix stemmer.
+
+    Suffixes are stripped until none applies, so "nutzerinnen", "nutzern"
+    and "nutzer" all end up as "nutz".
+    """
+    stripped = True
+    while stripped:
+        stripped = False
+        for suffix in SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM_LENGTH:
+                word = word[:-len(suffix)]
+                stripped = True
+                break
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into normalized search terms.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        List of stemmed terms (stopwords removed)
+    """
+    folded = text.lower().translate(UMLAUT_MAP)
+    return [stem(word) for word in WORD_PATTERN.findall(folded) if word not in STOPWORDS]
+
+
+@dataclass
+class SearchResult:
+    """A single search hit."""
+    artifact_id: str
+    title: str
+    type: ArtifactType
+    score: float
+
+
+class SearchIndex:
+    """In-memory inverted index over artifact titles and bodies."""
+
+    def __init__(self, version: int = 0):
+        self.version = version  # Bumped per change (see SearchIndexFile)
+        # artifact id -> {"title", "type", "terms": {term: weighted tf}}
+        self.docs: Dict[str, Dict] = {}
+        # term -> {artifact id: weighted tf}
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self._vocabulary: Optional[List[str]] = None  # Sorted, built lazily for prefix search
+
+    def add(self, artifact: Artifact) -> Dict:
+        """Index an artifact, replacing any previous version.
+
+        Returns:
+            The change, as written to the change log (see apply())
+        """
+        terms = Counter(tokenize(artifact.content))
+        for term in tokenize(artifact.title):
+            terms[term] += TITLE_WEIGHT
+
+        change = {
+            "op": "add",
+            "id": artifact.id,
+            "title": artifact.title,
+            "type": artifact.type.value,
+            "terms": dict(terms)
+        }
+        self.apply(change)
+        return change
+
+    def apply(self, change: Dict) -> None:
+        """Apply a change returned by add() or {"op": "clear"}."""
+        if change.get("op") == "clear":
+            self.clear()
+            return
+        if change.get("op") != "add":
+            return
+
+        # There is only one mandat per wall (mirrors mandat.md)
+        if change["type"] == ArtifactType.MANDAT.value:
+            for doc_id, doc in list(self.docs.items()):
+                if doc["type"] == ArtifactType.MANDAT.value:
+                    self.remove(doc_id)
+        else:
+            self.remove(change["id"])
+
+        self._add_doc(change["id"], change["title"], change["type"], change["terms"])
+
+    def _add_doc(self, doc_id: str, title: str, type_: str, terms: Dict[str, int]) -> None:
+        """Add a document with precomputed term frequencies."""
+        self.docs[doc_id] = {"title": title, "type": type_, "terms": terms}
+        for term, tf in terms.items():
+            if term not in self.postings:
+                self.postings[term] = {}
+                self._vocabulary = None
+            self.postings[term][doc_id] = tf
+
+    def remove(self, artifact_id: str) -> None:
+        """Remove an artifact from the index."""
+        doc = self.docs.pop(artifact_id, None)
+        if doc is None:
+            return
+        for term in doc["terms"]:
+            posting = self.postings.get(term)
+            if posting is None:
+                continue
+            posting.pop(artifact_id, None)
+            if not posting:
+                del self.postings[term]
+                self._vocabulary = None
+
+    def clear(self) -> None:
+        """Remove all documents."""
+        self.docs = {}
+        self.postings = {}
+        self._vocabulary = None
+
+    def _expand(self, term: str) -> Set[str]:
+        """Get all indexed terms starting with term."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings)
+        start = bisect.bisect_left(self._vocabulary, term)
+        matches = set()
+        for candidate in self._vocabulary[start:]:
+            if not candidate.startswith(term):
+                break
+            matches.add(candidate)
+        return matches
+
+    def search(
+        self,
+        query: str,
+        types: Optional[Iterable[ArtifactType]] = None,
+        limit: int = 10
+    ) -> List[SearchResult]:
+        """Find artifacts containing all query terms.
+
+        The last query term also matches as a prefix, so partial input
+        like "interv" finds "Interviews".
+
+        Args:
+            query: Search query
+            types: Only return artifacts of these types
+            limit: Maximum number of results
+
+        Returns:
+            Results ordered by descending tf-idf score
+        """
+        terms = tokenize(query)
+        if not terms or not self.docs:
+            return []
+
+        type_values = {t.value for t in types} if types is not None else None
+        total_docs = len(self.docs)
+        scores: Optional[Dict[str, float]] = None
+
+        for position, term in enumerate(terms):
+            expanded = {term} if term in self.postings else set()
+            if position == len(terms) - 1:
+                expanded |= self._expand(term)
+
+            term_scores: Dict[str, float] = {}
+            for match in expanded:
+                posting = self.postings[match]
+                idf = math.log(1 + total_docs / len(posting))
+                for doc_id, tf in posting.items():
+                    term_scores[doc_id] = term_scores.get(doc_id, 0.0) + (1 + math.log(tf)) * idf
+
+            # All terms must match
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {
+                    doc_id: score + term_scores[doc_id]
+                    for doc_id, score in scores.items() if doc_id in term_scores
+                }
+            if not scores:
+                return []
+
+        results = []
+        for doc_id, score in scores.items():
+            doc = self.docs[doc_id]
+            if type_values is not None and doc["type"] not in type_values:
+                continue
+            results.append(SearchResult(
+                artifact_id=doc_id,
+                title=doc["title"],
+                type=ArtifactType(doc["type"]),
+                score=score
+            ))
+
+        results.sort(key=lambda r: (-r.score, r.artifact_id))
+        return results[:limit]
+
+    def to_dict(self) -> Dict:
+        """Serialize the index (postings are rebuilt on load)."""
+        return {"version": self.version, "docs": self.docs}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SearchIndex":
+        """Deserialize an index written by to_dict()."""
+        index = cls(version=data.get("version", 0))
+        for doc_id, doc in data.get("docs", {}).items():
+            index._add_doc(doc_id, doc["title"], doc["type"], doc["terms"])
+        return index
+
+
+class SearchIndexFile:
+    """A search index persisted as JSON plus a change log, kept in memory."""
+
+    def __init__(self, path: Path, log_path: Optional[Path] = None):
+        """Initialize the index file.
+
+        Args:
+            path: Path of the index JSON file
+            log_path: Path of the change log (defaults to
+                SEARCH_INDEX_LOG_FILENAME next to the JSON file)
+        """
+        self.path = path
+        self._log = ChangeLog(log_path or path.with_name(SEARCH_INDEX_LOG_FILENAME))
+        self._index: Optional[SearchIndex] = None
+        self._lock = threading.Lock()
+
+    def _load(self, store: ArtifactStore) -> SearchIndex:
+        """Get the in-memory index, reading or building it on first use.
+
+        The logged changes are replayed onto the JSON snapshot (and
+        folded into it if the log has grown long).
+        """
+        if self._index is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    index = SearchIndex.from_dict(json.load(f))
+            except (OSError, ValueError, KeyError):
+                self._index = self._build(store)
+                self._write()
+                return self._index
+
+            self._log.rewind()
+            for change in self._log.read_new():
+                version = change.get("version", 0)
+                if version <= index.version:
+                    continue  # Already in the snapshot
+                try:
+                    index.apply(change)
+                except (KeyError, TypeError, AttributeError):
+                    continue
+                index.version = version
+            self._index = index
+            if self._log.count >= COMPACT_AFTER_CHANGES:
+                self._write()
+        return self._index
+
+    def _build(self, store: ArtifactStore, version: int = 0) -> SearchIndex:
+        """Build an index from all artifacts in the store."""
+        index = SearchIndex(version=version)
+        for artifact in store.load_all():
+            index.add(artifact)
+        return index
+
+    def _write(self) -> None:
+        """Persist the whole in-memory index and empty the log."""
+        content = json.dumps(self._index.to_dict(), ensure_ascii=False)
+        atomic_write_text(self.path, content, create_parents=True)
+        self._log.clear()
+
+    def _log_changes(self, changes: List[Dict]) -> None:
+        """Append applied changes to the log, compacting it when long."""
+        for change in changes:
+            self._index.version += 1
+            change["version"] = self._index.version
+        self._log.append(changes)
+        if self._log.count >= COMPACT_AFTER_CHANGES:
+            self._write()
+
+    def search(
+        self,
+        store: ArtifactStore,
+        query: str,
+        types: Optional[Iterable[ArtifactType]] = None,
+        limit: int = 10
+    ) -> List[SearchResult]:
+        """Search the index (see SearchIndex.search)."""
+        with self._lock:
+            return self._load(store).search(query, types=types, limit=limit)
+
+    def record_save(self, store: ArtifactStore, artifact: Artifact) -> None:
+        """Index a saved artifact and persist the index."""
+        self.record_saves(store, [artifact])
+
+    def record_saves(self, store: ArtifactStore, artifacts: List[Artifact]) -> None:
+        """Index several saved artifacts and log them with one append."""
+        with self._lock:
+            index = self._load(store)
+            self._log_changes([index.add(artifact) for artifact in artifacts])
+
+    def record_clear(self) -> None:
+        """Empty the index and persist it."""
+        with self._lock:
+            self._index = SearchIndex(version=self._next_version())
+            self._write()
+
+    def rebuild(self, store: ArtifactStore) -> None:
+        """Rebuild the index from the store (e.g. after hand edits)."""
+        with self._lock:
+            self._index = self._build(store, version=self._next_version())
+            self._write()
+
+    def _next_version(self) -> int:
+        """Version for a new snapshot, above every logged change."""
+        versions = [change.get("version", 0) for change in self._log.read_new()]
+        current = self._index.version if self._index is not None else 0
+        return max([current] + versions) + 1
+
+
+# One index file per discovery wall directory
+_SEARCH_INDEXES: Dict[Path, SearchIndexFile] = {}
+_SEARCH_INDEXES_LOCK = threading.Lock()
+
+
+def get_search_index_file(root: Path) -> SearchIndexFile:
+    """Get the shared search index for a discovery wall directory.
+
+    Args:
+        root: Discovery wall directory
+
+    Returns:
+        SearchIndexFile for the directory
+    """
+    path = (root / SEARCH_INDEX_FILENAME).resolve()
+    with _SEARCH_INDEXES_LOCK:
+        index_file = _SEARCH_INDEXES.get(path)
+        if index_file is None:
+            index_file = SearchIndexFile(root / SEARCH_INDEX_FILENAME)
+            _SEARCH_INDEXES[path] = index_file
+        return index_file
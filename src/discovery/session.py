@@ -1,140 +1,568 @@
-"""Session persistence - save/load chat history and session state."""
+"""Session persistence - save/load chat history and session state.
 
-import uuid
+A session is stored in its directory (the session's workspace, see
+workspace.py, or SESSION_DIR when no workspace is used):
+
+- chat-log.jsonl: append-only chat log, one JSON message per line
+- chat-snapshot.json: periodic snapshot for paged loading (see chat_log.py)
+- session-meta.json: small metadata file (id, name, agent, ...)
+- history-summary.json: rolling summary of older chat turns (see
+  src/context/summary.py)
+
+Log lines are checksummed and fsynced; recover_session() repairs a log
+torn by a crash and restores lost metadata from it.
+
+Every workspace session is also listed in the session catalog of the
+sessions directory (see catalog.py), which list_sessions() reads.
+
+Adding a message appends a single line instead of rewriting the whole
+history. Resuming reads the snapshot and the recent messages only; older
+messages are loaded page by page with load_messages(). Sessions saved in
+the old single-file YAML format (session-meta.yaml) are migrated when
+they are opened; listing sessions only reads them.
+"""
+
+import json
+from functools import partial
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import yaml
 
+from src.discovery.catalog import CATALOG_FIELDS, SessionCatalog, get_session_catalog_file
+from src.discovery.chat_log import CHAT_LOG_FILENAME, SNAPSHOT_FILENAME, RecoveryReport, get_chat_log
+from src.discovery.wall_summary import SUMMARY_FILENAME
+from src.discovery.workspace import (
+    Workspace,
+    generate_session_id,
+    get_current_workspace,
+    get_workspaces_dir
+)
+from src.utils.files import atomic_write_text
+
+
+# Session directory of the legacy single session
+SESSION_DIR = Path("_hansel-output/discovery-wall")
+
+# File names inside the session directory
+SESSION_META_FILENAME = "session-meta.json"
+HISTORY_SUMMARY_FILENAME = "history-summary.json"
+LEGACY_SESSION_FILENAME = "session-meta.yaml"
+SESSION_FILENAMES = (
+    SESSION_META_FILENAME,
+    CHAT_LOG_FILENAME,
+    SNAPSHOT_FILENAME,
+    HISTORY_SUMMARY_FILENAME,
+    LEGACY_SESSION_FILENAME
+)
+
+# Message fields persisted in the chat log
+MESSAGE_FIELDS = ("role", "content", "agent", "agent_icon", "agent_name", "timestamp")
+
+# Name of a session until one is derived from its chat
+DEFAULT_SESSION_NAME = "Meine Discovery"
+
+# Longest name derived from a chat message
+SESSION_NAME_MAX_LENGTH = 60
+
+
+def get_session_dir(workspace: Optional[Workspace] = None) -> Path:
+    """Get the directory holding the session files.
+
+    Args:
+        workspace: Workspace (defaults to the current workspace)
+
+    Returns:
+        The workspace directory, or SESSION_DIR if no workspace is set
+    """
+    if workspace is None:
+        workspace = get_current_workspace()
+    return workspace.root if workspace is not None else SESSION_DIR
+
+
+def _meta_file(directory: Path) -> Path:
+    return directory / SESSION_META_FILENAME
+
+
+def _legacy_file(directory: Path) -> Path:
+    return directory / LEGACY_SESSION_FILENAME
+
+
+def _to_record(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the persisted form of a chat message."""
+    record = {field: message.get(field) for field in MESSAGE_FIELDS}
+    record["timestamp"] = record["timestamp"] or datetime.now().isoformat()
+    return record
+
+
+def _from_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a chat message from its persisted form."""
+    message = {
+        "role": record.get("role"),
+        "content": record.get("content")
+    }
+    # Add optional fields if present
+    for field in ("agent", "agent_icon", "agent_name", "timestamp"):
+        if record.get(field):
+            message[field] = record[field]
+    return message
+
+
+def _scan_sessions(base_dir: Path) -> List[Dict[str, Any]]:
+    """Build catalog entries by reading every workspace directory."""
+    if not base_dir.is_dir():
+        return []
+
+    entries = []
+    for directory in base_dir.iterdir():
+        if not directory.is_dir():
+            continue
+        entry = {"id": directory.name}
+        meta = _peek_meta(directory)
+        if meta:
+            entry.update({key: meta[key] for key in CATALOG_FIELDS if key in meta})
+            entry["id"] = directory.name
+        try:
+            with open(directory / SUMMARY_FILENAME, "r", encoding="utf-8") as f:
+                entry["artifact_counts"] = json.load(f).get("counts", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+        entries.append(entry)
+    return entries
+
+
+def _record_in_catalog(workspace: Optional[Workspace], meta: Optional[Dict[str, Any]]) -> None:
+    """Update (or with meta=None remove) a workspace session in the catalog."""
+    if workspace is None:
+        return  # The legacy session is not part of any catalog
+    base_dir = workspace.root.parent
+    catalog_file = get_session_catalog_file(base_dir)
+    scan = partial(_scan_sessions, base_dir)
+    if meta is None:
+        catalog_file.record_remove(scan, workspace.session_id)
+    else:
+        catalog_file.record_session(scan, dict(meta, id=workspace.session_id))
+
+
+def _write_meta(directory: Path, meta: Dict[str, Any]) -> None:
+    """Persist the session metadata."""
+    atomic_write_text(_meta_file(directory), json.dumps(meta, ensure_ascii=False), create_parents=True)
+
+
+def _read_meta(directory: Path) -> Dict[str, Any]:
+    """Read the session metadata (migrating a legacy session first)."""
+    _migrate(directory)
+    return _read_meta_file(directory)
+
+
+def _peek_meta(directory: Path) -> Dict[str, Any]:
+    """Read the session metadata without migrating (for listing sessions)."""
+    legacy = _read_legacy(directory)
+    if legacy is not None:
+        return legacy[1]
+    return _read_meta_file(directory)
+
+
+def _read_meta_file(directory: Path) -> Dict[str, Any]:
+    """Read session-meta.json ({} if missing or unreadable)."""
+    try:
+        with open(_meta_file(directory), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
 
-# Session file location
-SESSION_FILE = Path("_hansel-output/discovery-wall/session-meta.yaml")
+def derive_session_name(messages: List[Dict[str, Any]], mandat_title: Optional[str] = None) -> Optional[str]:
+    """Derive a session name from the mandat or the first user message.
 
+    Args:
+        messages: Chat messages from the start of the conversation
+        mandat_title: Title of the session's mandat, if there is one
+
+    Returns:
+        The mandat title, else the first user message shortened to
+        SESSION_NAME_MAX_LENGTH characters, or None if neither exists
+    """
+    if mandat_title and mandat_title.strip():
+        return " ".join(mandat_title.split())
 
-def generate_session_id() -> str:
-    """Generate a unique session ID."""
-    return f"session-{uuid.uuid4().hex[:8]}"
+    for message in messages:
+        content = " ".join((message.get("content") or "").split())
+        # Commands like *speichern are no name
+        if message.get("role") != "user" or not content or content.startswith("*"):
+            continue
+        if len(content) <= SESSION_NAME_MAX_LENGTH:
+            return content
+        shortened = content[:SESSION_NAME_MAX_LENGTH - 1].rsplit(" ", 1)[0]
+        return shortened.rstrip(" ,.;:-") + "…"
+    return None
 
 
 def save_session(
     messages: List[Dict[str, Any]],
     session_id: Optional[str] = None,
-    session_name: str = "Meine Discovery",
+    session_name: Optional[str] = None,
     current_agent: str = "nora",
-    mandat_complete: bool = False
+    mandat_complete: bool = False,
+    workspace: Optional[Workspace] = None,
+    offset: int = 0
 ) -> Path:
-    """Save session state and chat history to YAML file.
+    """Save session state and chat history.
+
+    Only messages not yet in the chat log are appended. If the history
+    got shorter (e.g. after a reset), the log is rewritten.
 
     Args:
         messages: List of chat messages
         session_id: Optional session ID (generates new if None)
-        session_name: Name of the discovery session
+        session_name: Name of the discovery session (None keeps the
+            saved name, or DEFAULT_SESSION_NAME for a new session)
         current_agent: Currently active agent
         mandat_complete: Whether mandat phase is complete
+        workspace: Workspace (defaults to the current workspace)
+        offset: Index of messages[0] in the full history, if only the
+            most recent messages are loaded (see load_session(limit=...))
 
     Returns:
-        Path to the saved session file
+        Path to the session metadata file
+
+    Raises:
+        ValueError: If a partial history (offset > 0) does not line up
+            with the log
     """
-    # Ensure directory exists
-    SESSION_FILE.parent.mkdir(parents=True, exist_ok=True)
+    if workspace is None:
+        workspace = get_current_workspace()
+    directory = get_session_dir(workspace)
+    chat_log = get_chat_log(directory)
+
+    with chat_log.lock:
+        existing = _read_meta(directory)
+        total = offset + len(messages)
+
+        logged = chat_log.count()
+        if offset > logged:
+            raise ValueError(f"Partial history starts at {offset}, but the log has {logged} messages")
+        if total >= logged:
+            chat_log.append([_to_record(msg) for msg in messages[logged - offset:]])
+        elif offset == 0:
+            chat_log.rewrite([_to_record(msg) for msg in messages])
+        else:
+            raise ValueError(f"Partial history ends at {total}, but the log has {logged} messages")
+
+        now = datetime.now().isoformat()
+        default_id = workspace.session_id if workspace is not None else generate_session_id()
+        meta = {
+            "id": session_id or existing.get("id") or default_id,
+            "name": session_name or existing.get("name") or DEFAULT_SESSION_NAME,
+            "created_at": existing.get("created_at") or now,
+            "updated_at": now,
+            "current_agent": current_agent,
+            "mandat_complete": mandat_complete,
+            "message_count": total
+        }
+        _write_meta(directory, meta)
+        _record_in_catalog(workspace, meta)
 
-    # Load existing session to preserve ID and created_at
-    existing = load_session_raw()
+    return _meta_file(directory)
 
-    if session_id is None:
-        session_id = existing.get("session", {}).get("id") or generate_session_id()
 
-    created_at = existing.get("session", {}).get("created_at") or datetime.now().isoformat()
+def append_message(message: Dict[str, Any], workspace: Optional[Workspace] = None) -> Path:
+    """Append a single message to the chat log.
 
-    # Build session data
-    session_data = {
-        "session": {
-            "id": session_id,
-            "name": session_name,
-            "created_at": created_at,
-            "updated_at": datetime.now().isoformat(),
-            "current_agent": current_agent,
-            "mandat_complete": mandat_complete
-        },
-        "chat_history": [
-            {
-                "role": msg.get("role"),
-                "content": msg.get("content"),
-                "agent": msg.get("agent"),
-                "agent_icon": msg.get("agent_icon"),
-                "agent_name": msg.get("agent_name"),
-                "timestamp": msg.get("timestamp") or datetime.now().isoformat()
-            }
-            for msg in messages
-        ]
-    }
+    Does not read or rewrite anything else; metadata is updated by the
+    next save_session().
+
+    Args:
+        message: Chat message dict
+        workspace: Workspace (defaults to the current workspace)
+
+    Returns:
+        Path to the chat log
+    """
+    directory = get_session_dir(workspace)
+    _migrate(directory)
+    chat_log = get_chat_log(directory)
+    chat_log.append([_to_record(message)])
+    return chat_log.path
 
-    # Write to file
-    with open(SESSION_FILE, "w", encoding="utf-8") as f:
-        yaml.dump(session_data, f, default_flow_style=False, allow_unicode=True)
 
-    return SESSION_FILE
+def migrate_legacy_session(workspace: Optional[Workspace] = None) -> bool:
+    """Convert a session-meta.yaml session into the chat log format.
 
+    Runs once: the YAML file is removed after the new files are written.
 
-def load_session_raw() -> Dict[str, Any]:
-    """Load raw session data from YAML file.
+    Args:
+        workspace: Workspace (defaults to the current workspace)
 
     Returns:
-        Raw session data dict or empty dict if file doesn't exist
+        True if a legacy session was migrated
     """
-    if not SESSION_FILE.exists():
-        return {}
+    return _migrate(get_session_dir(workspace))
+
+
+def _read_legacy(directory: Path) -> Optional[tuple[List[Dict[str, Any]], Dict[str, Any]]]:
+    """Parse the YAML session in a directory without changing any file.
+
+    Returns:
+        Tuple of (log records, session metadata), or None if there is no
+        readable legacy session
+    """
+    legacy_file = _legacy_file(directory)
+    if not legacy_file.exists():
+        return None
 
     try:
-        with open(SESSION_FILE, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+        with open(legacy_file, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
     except Exception:
-        return {}
+        return None
+
+    records = [_to_record(msg) for msg in data.get("chat_history", []) or []]
+    meta = dict(data.get("session", {}) or {})
+    meta["message_count"] = len(records)
+    return records, meta
+
+
+def _migrate(directory: Path) -> bool:
+    """Migrate the YAML session in a directory, if any."""
+    legacy = _read_legacy(directory)
+    if legacy is None:
+        return False
 
+    records, meta = legacy
+    get_chat_log(directory).rewrite(records)
+    _write_meta(directory, meta)
+    _legacy_file(directory).unlink()
+    return True
 
-def load_session() -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
+
+def load_session(
+    workspace: Optional[Workspace] = None,
+    limit: Optional[int] = None
+) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
     """Load session state and chat history.
 
+    Args:
+        workspace: Workspace (defaults to the current workspace)
+        limit: Only load the most recent messages (None = full history,
+            streamed from the log). The index of the first returned message
+            is count_messages() - len(messages).
+
     Returns:
         Tuple of (messages list, session metadata dict)
     """
-    data = load_session_raw()
+    directory = get_session_dir(workspace)
+    meta = _read_meta(directory)
+    chat_log = get_chat_log(directory)
 
-    if not data:
+    if limit is None:
+        records = list(chat_log)
+    else:
+        records = chat_log.read(max(chat_log.count() - limit, 0), limit)
+    messages = [_from_record(record) for record in records]
+
+    if not meta and not messages:
         return [], {}
 
-    # Extract messages
-    messages = []
-    for msg in data.get("chat_history", []):
-        message = {
-            "role": msg.get("role"),
-            "content": msg.get("content")
-        }
-        # Add optional fields if present
-        if msg.get("agent"):
-            message["agent"] = msg["agent"]
-        if msg.get("agent_icon"):
-            message["agent_icon"] = msg["agent_icon"]
-        if msg.get("agent_name"):
-            message["agent_name"] = msg["agent_name"]
-        if msg.get("timestamp"):
-            message["timestamp"] = msg["timestamp"]
+    return messages, meta
+
+
+def load_messages(
+    offset: int = 0,
+    limit: Optional[int] = None,
+    workspace: Optional[Workspace] = None
+) -> List[Dict[str, Any]]:
+    """Load a page of the chat history.
+
+    Args:
+        offset: Index of the first message
+        limit: Maximum number of messages (None = all from offset)
+        workspace: Workspace (defaults to the current workspace)
+
+    Returns:
+        List of messages in chronological order
+    """
+    directory = get_session_dir(workspace)
+    _migrate(directory)
+    return [_from_record(record) for record in get_chat_log(directory).read(offset, limit)]
+
+
+def count_messages(workspace: Optional[Workspace] = None) -> int:
+    """Get the number of messages in the chat history.
+
+    Args:
+        workspace: Workspace (defaults to the current workspace)
+    """
+    directory = get_session_dir(workspace)
+    _migrate(directory)
+    return get_chat_log(directory).count()
+
+
+def recover_session(workspace: Optional[Workspace] = None) -> RecoveryReport:
+    """Check a session after startup and repair what a crash left behind.
+
+    Cuts off a partly written last log line and rebuilds the metadata
+    from the log if it is missing or unreadable, so the last valid state
+    is restored instead of silently starting empty.
+
+    Args:
+        workspace: Workspace (defaults to the current workspace)
+
+    Returns:
+        RecoveryReport describing what was skipped or repaired
+    """
+    if workspace is None:
+        workspace = get_current_workspace()
+    directory = get_session_dir(workspace)
+    _migrate(directory)
+    chat_log = get_chat_log(directory)
+
+    with chat_log.lock:
+        report = chat_log.recover()
+        if report.message_count and not _read_meta(directory):
+            first = chat_log.read(0, 1)[0]
+            last = chat_log.read(report.message_count - 1, 1)[0]
+            meta = {
+                "id": workspace.session_id if workspace is not None else generate_session_id(),
+                "name": DEFAULT_SESSION_NAME,
+                "created_at": first.get("timestamp") or datetime.now().isoformat(),
+                "updated_at": last.get("timestamp") or datetime.now().isoformat(),
+                "current_agent": last.get("agent") or "nora",
+                "mandat_complete": False,
+                "message_count": report.message_count
+            }
+            _write_meta(directory, meta)
+            _record_in_catalog(workspace, meta)
+            report.meta_rebuilt = True
+
+    # _migrate() leaves a legacy file in place only if it cannot be parsed
+    report.legacy_unreadable = _legacy_file(directory).exists()
+    return report
+
+
+def save_history_summary(data: Dict[str, Any], workspace: Optional[Workspace] = None) -> Path:
+    """Persist the rolling summary of the chat history.
+
+    Args:
+        data: Summary as a dict (see HistorySummary.to_dict())
+        workspace: Workspace (defaults to the current workspace)
+
+    Returns:
+        Path to the summary file
+    """
+    path = get_session_dir(workspace) / HISTORY_SUMMARY_FILENAME
+    atomic_write_text(path, json.dumps(data, ensure_ascii=False), create_parents=True)
+    return path
+
+
+def load_history_summary(workspace: Optional[Workspace] = None) -> Dict[str, Any]:
+    """Load the rolling summary of the chat history.
+
+    Args:
+        workspace: Workspace (defaults to the current workspace)
+
+    Returns:
+        Summary dict, or an empty dict if there is none
+    """
+    try:
+        with open(get_session_dir(workspace) / HISTORY_SUMMARY_FILENAME, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def clear_session(workspace: Optional[Workspace] = None) -> None:
+    """Clear the current session (for starting fresh).
+
+    Args:
+        workspace: Workspace (defaults to the current workspace)
+    """
+    if workspace is None:
+        workspace = get_current_workspace()
+    directory = get_session_dir(workspace)
+    chat_log = get_chat_log(directory)
+    with chat_log.lock:
+        chat_log.clear()
+        for name in SESSION_FILENAMES:
+            path = directory / name
+            if path.exists():
+                path.unlink()
+        _record_in_catalog(workspace, None)
+
+
+def session_exists(workspace: Optional[Workspace] = None) -> bool:
+    """Check if a session file exists.
 
-        messages.append(message)
+    Args:
+        workspace: Workspace (defaults to the current workspace)
+    """
+    directory = get_session_dir(workspace)
+    return any((directory / name).exists() for name in SESSION_FILENAMES)
 
-    # Extract session metadata
-    session_meta = data.get("session", {})
 
-    return messages, session_meta
+def record_session_artifacts(counts: Dict[str, int], workspace: Optional[Workspace] = None) -> None:
+    """Update the artifact counts of a session in the session catalog.
 
+    Called by save_artifacts() and clear_all_artifacts().
+
+    Args:
+        counts: Artifact counts per wall category
+        workspace: Workspace (defaults to the current workspace)
+    """
+    if workspace is None:
+        workspace = get_current_workspace()
+    if workspace is None:
+        return
+    base_dir = workspace.root.parent
+    get_session_catalog_file(base_dir).record_artifacts(
+        partial(_scan_sessions, base_dir), workspace.session_id, counts
+    )
+
+
+def list_sessions(
+    config: Optional[Dict[str, Any]] = None,
+    base_dir: Optional[Path] = None,
+    prefix: Optional[str] = None,
+    limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """List the saved sessions of all workspaces, most recent first.
+
+    Read from the session catalog; the workspaces are only scanned when
+    no catalog exists yet.
 
-def clear_session() -> None:
-    """Clear the current session (for starting fresh)."""
-    if SESSION_FILE.exists():
-        SESSION_FILE.unlink()
+    Args:
+        config: Application config (uses paths.sessions if set)
+        base_dir: Base directory (defaults to get_workspaces_dir(config))
+        prefix: Only sessions whose name starts with this (case-insensitive)
+        limit: Maximum number of sessions
 
+    Returns:
+        Session entries (id, name, created_at, updated_at, message_count,
+        current_agent, mandat_complete, artifact_counts)
+    """
+    base_dir = base_dir or get_workspaces_dir(config)
+    if not base_dir.is_dir():
+        return []
 
-def session_exists() -> bool:
-    """Check if a session file exists."""
-    return SESSION_FILE.exists()
+    catalog = get_session_catalog_file(base_dir).get(partial(_scan_sessions, base_dir))
+    return catalog.sessions(prefix=prefix, limit=limit)
+
+
+def rebuild_session_catalog(
+    config: Optional[Dict[str, Any]] = None,
+    base_dir: Optional[Path] = None
+) -> SessionCatalog:
+    """Rebuild the session catalog from the workspace directories.
+
+    Args:
+        config: Application config (uses paths.sessions if set)
+        base_dir: Base directory (defaults to get_workspaces_dir(config))
+
+    Returns:
+        The rebuilt SessionCatalog
+    """
+    base_dir = base_dir or get_workspaces_dir(config)
+    return get_session_catalog_file(base_dir).rebuild(partial(_scan_sessions, base_dir))
@@ -0,0 +1,307 @@
+"""SQLite artifact store - indexed storage for large discovery walls."""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from src.discovery.models import (
+    Artifact,
+    ArtifactHeader,
+    ArtifactType,
+    ArtifactStatus,
+    ARTIFACT_CATEGORIES,
+    WALL_CATEGORIES
+)
+from src.discovery.store import ArtifactStore
+
+
+# Database file inside the discovery wall directory
+DATABASE_FILENAME = "discovery-wall.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    category TEXT NOT NULL,
+    status TEXT NOT NULL,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    created_by TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    related_to TEXT NOT NULL DEFAULT '[]'
+);
+CREATE INDEX IF NOT EXISTS idx_artifacts_type ON artifacts(type);
+CREATE INDEX IF NOT EXISTS idx_artifacts_category ON artifacts(category);
+CREATE INDEX IF NOT EXISTS idx_artifacts_status ON artifacts(status);
+CREATE INDEX IF NOT EXISTS idx_artifacts_created_by ON artifacts(created_by);
+
+CREATE TABLE IF NOT EXISTS artifact_relations (
+    artifact_id TEXT NOT NULL REFERENCES artifacts(id) ON DELETE CASCADE,
+    related_id TEXT NOT NULL,
+    PRIMARY KEY (artifact_id, related_id)
+);
+CREATE INDEX IF NOT EXISTS idx_relations_related_id ON artifact_relations(related_id);
+"""
+
+ARTIFACT_COLUMNS = (
+    "id, type, status, title, content, created_by, created_at, updated_at, related_to"
+)
+HEADER_COLUMNS = (
+    "id, type, status, title, created_by, created_at, updated_at, related_to"
+)
+
+
+class SqliteArtifactStore(ArtifactStore):
+    """SQLite artifact store.
+
+    Keeps all artifacts in a single database with indexes on type,
+    category, status, created_by and related_to. Counts and wall titles
+    are answered by SQL without loading artifact bodies.
+    """
+
+    def __init__(self, root: Path):
+        """Initialize SQLite store.
+
+        Args:
+            root: Discovery wall directory holding the database file
+        """
+        self.root = root
+        self.db_path = root / DATABASE_FILENAME
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database connection on first use."""
+        if self._conn is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            # Streamlit runs scripts on worker threads; access is serialized by _lock
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _row_to_artifact(self, row: tuple) -> Artifact:
+        """Build an artifact from a row in ARTIFACT_COLUMNS order."""
+        artifact_id, type_, status, title, content, created_by, created_at, updated_at, related_to = row
+        return Artifact(
+            id=artifact_id,
+            type=ArtifactType(type_),
+            title=title,
+            content=content,
+            status=ArtifactStatus(status),
+            created_by=created_by,
+            created_at=datetime.fromisoformat(created_at),
+            updated_at=datetime.fromisoformat(updated_at),
+            related_to=json.loads(related_to)
+        )
+
+    def _select(self, where: str = "", params: Iterable = ()) -> List[Artifact]:
+        """Run a SELECT over the artifacts table."""
+        sql = f"SELECT {ARTIFACT_COLUMNS} FROM artifacts {where} ORDER BY created_at, id"
+        with self._lock:
+            rows = self._connect().execute(sql, tuple(params)).fetchall()
+        return [self._row_to_artifact(row) for row in rows]
+
+    def save(self, artifact: Artifact) -> Path:
+        """Save an artifact to the database.
+
+        Args:
+            artifact: The artifact to save
+
+        Returns:
+            Path to the database file
+        """
+        return self.save_many([artifact])[0]
+
+    def save_many(self, artifacts: Iterable[Artifact]) -> List[Path]:
+        """Save several artifacts in a single transaction.
+
+        Args:
+            artifacts: The artifacts to save
+
+        Returns:
+            Path to the database file for each artifact
+        """
+        artifacts = list(artifacts)
+        updated_at = datetime.now().isoformat()
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                for artifact in artifacts:
+                    self._insert(conn, artifact, updated_at)
+
+        return [self.db_path] * len(artifacts)
+
+    def _insert(self, conn: sqlite3.Connection, artifact: Artifact, updated_at: str) -> None:
+        """Insert or replace one artifact and its relations."""
+        row = (
+            artifact.id,
+            artifact.type.value,
+            ARTIFACT_CATEGORIES.get(artifact.type, "problem"),
+            artifact.status.value,
+            artifact.title,
+            artifact.content.strip(),
+            artifact.created_by,
+            artifact.created_at.isoformat(),
+            updated_at,
+            json.dumps(artifact.related_to)
+        )
+
+        # There is only one mandat per wall (mirrors mandat.md)
+        if artifact.type == ArtifactType.MANDAT:
+            conn.execute(
+                "DELETE FROM artifacts WHERE type = ? AND id != ?",
+                (ArtifactType.MANDAT.value, artifact.id)
+            )
+        conn.execute(
+            "INSERT OR REPLACE INTO artifacts "
+            "(id, type, category, status, title, content, created_by, created_at, updated_at, related_to) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            row
+        )
+        conn.execute("DELETE FROM artifact_relations WHERE artifact_id = ?", (artifact.id,))
+        conn.executemany(
+            "INSERT OR IGNORE INTO artifact_relations (artifact_id, related_id) VALUES (?, ?)",
+            [(artifact.id, related_id) for related_id in artifact.related_to]
+        )
+
+    def load_all(self) -> List[Artifact]:
+        """Load all artifacts from the database.
+
+        Returns:
+            List of all artifacts
+        """
+        return self._select()
+
+    def load_headers(self) -> List[ArtifactHeader]:
+        """Load all artifact headers without their bodies.
+
+        Returns:
+            List of all artifact headers
+        """
+        sql = f"SELECT {HEADER_COLUMNS} FROM artifacts ORDER BY created_at, id"
+        with self._lock:
+            rows = self._connect().execute(sql).fetchall()
+
+        headers = []
+        for artifact_id, type_, status, title, created_by, created_at, updated_at, related_to in rows:
+            header = ArtifactHeader(
+                id=artifact_id,
+                type=ArtifactType(type_),
+                title=title,
+                status=ArtifactStatus(status),
+                created_by=created_by,
+                created_at=datetime.fromisoformat(created_at),
+                updated_at=datetime.fromisoformat(updated_at),
+                related_to=json.loads(related_to)
+            )
+            header.set_content_loader(partial(self._load_content, artifact_id))
+            headers.append(header)
+        return headers
+
+    def _load_content(self, artifact_id: str) -> str:
+        """Load the body of a single artifact."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT content FROM artifacts WHERE id = ?", (artifact_id,)
+            ).fetchone()
+        return row[0] if row else ""
+
+    def get(self, artifact_id: str) -> Optional[Artifact]:
+        """Get a single artifact by ID."""
+        artifacts = self._select("WHERE id = ?", (artifact_id,))
+        return artifacts[0] if artifacts else None
+
+    def get_many(self, artifact_ids: Iterable[str]) -> List[Artifact]:
+        """Get several artifacts by ID in the order given."""
+        wanted = list(dict.fromkeys(artifact_ids))
+        if not wanted:
+            return []
+        found = {
+            a.id: a for a in self._select(f"WHERE id IN ({', '.join('?' for _ in wanted)})", wanted)
+        }
+        return [found[i] for i in wanted if i in found]
+
+    def query(
+        self,
+        types: Optional[Iterable[ArtifactType]] = None,
+        status: Optional[ArtifactStatus] = None,
+        created_by: Optional[str] = None,
+        related_to: Optional[str] = None
+    ) -> List[Artifact]:
+        """Load artifacts matching all given filters using the indexes."""
+        clauses: List[str] = []
+        params: List[str] = []
+
+        if types is not None:
+            type_values = [t.value for t in types]
+            if not type_values:
+                return []
+            clauses.append(f"type IN ({', '.join('?' for _ in type_values)})")
+            params.extend(type_values)
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status.value)
+        if created_by is not None:
+            clauses.append("created_by = ?")
+            params.append(created_by)
+        if related_to is not None:
+            clauses.append("id IN (SELECT artifact_id FROM artifact_relations WHERE related_id = ?)")
+            params.append(related_to)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._select(where, params)
+
+    def count_by_category(self) -> Dict[str, int]:
+        """Get counts of artifacts by wall category."""
+        counts = {category: 0 for category in WALL_CATEGORIES}
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT category, COUNT(*) FROM artifacts GROUP BY category"
+            ).fetchall()
+        for category, count in rows:
+            if category in counts:
+                counts[category] = count
+        return counts
+
+    def titles_by_category(self) -> Dict[str, List[str]]:
+        """Get artifact titles grouped by wall category."""
+        wall_data: Dict[str, List[str]] = {category: [] for category in WALL_CATEGORIES}
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT category, title FROM artifacts ORDER BY created_at, id"
+            ).fetchall()
+        for category, title in rows:
+            if category in wall_data:
+                wall_data[category].append(title)
+        return wall_data
+
+    def clear(self) -> None:
+        """Delete all artifacts from the database."""
+        if not self.db_path.exists():
+            return
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM artifact_relations")
+                conn.execute("DELETE FROM artifacts")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_store_name(self) -> str:
+        """Return store name."""
+        return "SQLite"
@@ -0,0 +1,165 @@
+"""Abstract base class for artifact storage backends."""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from src.discovery.models import Artifact, ArtifactHeader, ArtifactType, ArtifactStatus, WALL_CATEGORIES
+
+
+class ArtifactStore(ABC):
+    """Abstract base class for all artifact storage backends.
+
+    Provides a unified interface for different storage layouts
+    (markdown files, SQLite, etc.). The query methods have generic
+    implementations on top of load_headers(), so only matching artifacts
+    have their bodies loaded; backends with indexes override them to
+    avoid touching unrelated artifacts at all.
+    """
+
+    @abstractmethod
+    def save(self, artifact: Artifact) -> Path:
+        """Save an artifact.
+
+        Args:
+            artifact: The artifact to save
+
+        Returns:
+            Path of the file the artifact was written to
+        """
+        pass
+
+    def save_many(self, artifacts: Iterable[Artifact]) -> List[Path]:
+        """Save several artifacts.
+
+        Backends override this to batch the writes.
+
+        Args:
+            artifacts: The artifacts to save
+
+        Returns:
+            Paths the artifacts were written to, in input order
+        """
+        return [self.save(artifact) for artifact in artifacts]
+
+    @abstractmethod
+    def load_all(self) -> List[Artifact]:
+        """Load all artifacts.
+
+        Returns:
+            List of all artifacts
+        """
+        pass
+
+    def load_headers(self) -> List[ArtifactHeader]:
+        """Load metadata and titles of all artifacts.
+
+        Backends that can read headers without bodies override this.
+
+        Returns:
+            List of all artifact headers
+        """
+        return [ArtifactHeader.from_artifact(a) for a in self.load_all()]
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Delete all artifacts."""
+        pass
+
+    @abstractmethod
+    def get_store_name(self) -> str:
+        """Return the backend name for display purposes."""
+        pass
+
+    def get(self, artifact_id: str) -> Optional[Artifact]:
+        """Get a single artifact by ID.
+
+        Args:
+            artifact_id: Artifact identifier
+
+        Returns:
+            Artifact or None if not found
+        """
+        for header in self.load_headers():
+            if header.id == artifact_id:
+                return header.to_artifact()
+        return None
+
+    def get_many(self, artifact_ids: Iterable[str]) -> List[Artifact]:
+        """Get several artifacts by ID.
+
+        Args:
+            artifact_ids: Artifact identifiers
+
+        Returns:
+            Found artifacts in the order of artifact_ids
+        """
+        wanted = list(dict.fromkeys(artifact_ids))
+        if not wanted:
+            return []
+        headers = {h.id: h for h in self.load_headers() if h.id in set(wanted)}
+        return [headers[i].to_artifact() for i in wanted if i in headers]
+
+    def query(
+        self,
+        types: Optional[Iterable[ArtifactType]] = None,
+        status: Optional[ArtifactStatus] = None,
+        created_by: Optional[str] = None,
+        related_to: Optional[str] = None
+    ) -> List[Artifact]:
+        """Load artifacts matching all given filters.
+
+        Args:
+            types: Only artifacts of these types
+            status: Only artifacts with this status
+            created_by: Only artifacts created by this agent
+            related_to: Only artifacts that link to this artifact ID
+
+        Returns:
+            List of matching artifacts
+        """
+        type_set = set(types) if types is not None else None
+        return [
+            h.to_artifact() for h in self.load_headers()
+            if (type_set is None or h.type in type_set)
+            and (status is None or h.status == status)
+            and (created_by is None or h.created_by == created_by)
+            and (related_to is None or related_to in h.related_to)
+        ]
+
+    def by_type(self, *artifact_types: ArtifactType) -> List[Artifact]:
+        """Load artifacts of the given types.
+
+        Args:
+            artifact_types: Types to filter by
+
+        Returns:
+            List of matching artifacts
+        """
+        return self.query(types=artifact_types)
+
+    def count_by_category(self) -> Dict[str, int]:
+        """Get counts of artifacts by wall category.
+
+        Returns:
+            Dict with category names and counts
+        """
+        counts = {category: 0 for category in WALL_CATEGORIES}
+        for header in self.load_headers():
+            category = header.get_category()
+            if category in counts:
+                counts[category] += 1
+        return counts
+
+    def titles_by_category(self) -> Dict[str, List[str]]:
+        """Get artifact titles grouped by wall category.
+
+        Returns:
+            Dict with category names and list of artifact titles
+        """
+        wall_data: Dict[str, List[str]] = {category: [] for category in WALL_CATEGORIES}
+        for header in self.load_headers():
+            category = header.get_category()
+            if category in wall_data:
+                wall_data[category].append(header.title)
+        return wall_data
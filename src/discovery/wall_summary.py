@@ -0,0 +1,268 @@
+"""Materialized Discovery Wall summary - counts and titles without rescanning.
+
+The summary is updated incrementally by save_artifact() and
+clear_all_artifacts() and persisted in the wall directory, so the wall
+tab and Nora's counters never need to load the artifacts themselves.
+
+Files edited by hand are not tracked; rebuild the summary from disk with:
+
+    python -m src.discovery.wall_summary [session-id]
+"""
+
+import json
+import sys
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from src.discovery.models import Artifact, ArtifactHeader, ArtifactType, WALL_CATEGORIES
+from src.discovery.store import ArtifactStore
+from src.utils.files import atomic_write_text
+
+
+# Summary file inside the discovery wall directory
+SUMMARY_FILENAME = "wall-summary.json"
+
+# Number of most recently updated artifacts to keep
+RECENT_LIMIT = 5
+
+
+@dataclass
+class WallSummary:
+    """Per-category counts, titles and recent artifacts of one wall."""
+    version: int = 0
+    # category -> {artifact id -> title}, in insertion order
+    entries: Dict[str, Dict[str, str]] = field(
+        default_factory=lambda: {category: {} for category in WALL_CATEGORIES}
+    )
+    # Most recently updated first: {id, title, type, category, updated_at}
+    recent: List[Dict[str, str]] = field(default_factory=list)
+
+    def counts(self) -> Dict[str, int]:
+        """Get artifact counts per wall category."""
+        return {category: len(self.entries.get(category, {})) for category in WALL_CATEGORIES}
+
+    def titles(self) -> Dict[str, List[str]]:
+        """Get artifact titles per wall category."""
+        return {category: list(self.entries.get(category, {}).values()) for category in WALL_CATEGORIES}
+
+    def _remove(self, artifact_id: str) -> None:
+        """Remove an artifact from all categories and the recent list."""
+        for titles in self.entries.values():
+            titles.pop(artifact_id, None)
+        self.recent = [r for r in self.recent if r["id"] != artifact_id]
+
+    def _add(self, artifact: Union[Artifact, ArtifactHeader], updated_at: datetime) -> None:
+        """Add an artifact without touching the version."""
+        category = artifact.get_category()
+
+        # There is only one mandat per wall (mirrors mandat.md)
+        if artifact.type == ArtifactType.MANDAT:
+            for artifact_id in list(self.entries.get("mandat", {})):
+                self._remove(artifact_id)
+        else:
+            self._remove(artifact.id)
+
+        self.entries.setdefault(category, {})[artifact.id] = artifact.title
+        self.recent.insert(0, {
+            "id": artifact.id,
+            "title": artifact.title,
+            "type": artifact.type.value,
+            "category": category,
+            "updated_at": updated_at.isoformat()
+        })
+        del self.recent[RECENT_LIMIT:]
+
+    def record_save(self, artifact: Artifact, updated_at: Optional[datetime] = None) -> None:
+        """Apply a saved artifact and bump the version.
+
+        Args:
+            artifact: The artifact that was saved
+            updated_at: Time of the save (defaults to now)
+        """
+        self.record_saves([artifact], updated_at)
+
+    def record_saves(self, artifacts: Iterable[Artifact], updated_at: Optional[datetime] = None) -> None:
+        """Apply several saved artifacts with a single version bump.
+
+        Args:
+            artifacts: The artifacts that were saved, in save order
+            updated_at: Time of the save (defaults to now)
+        """
+        updated_at = updated_at or datetime.now()
+        for artifact in artifacts:
+            self._add(artifact, updated_at)
+        self.version += 1
+
+    def record_clear(self) -> None:
+        """Empty the wall and bump the version."""
+        self.entries = {category: {} for category in WALL_CATEGORIES}
+        self.recent = []
+        self.version += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the summary."""
+        return {
+            "version": self.version,
+            "counts": self.counts(),
+            "entries": self.entries,
+            "recent": self.recent
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WallSummary":
+        """Deserialize a summary written by to_dict()."""
+        entries = {category: {} for category in WALL_CATEGORIES}
+        entries.update(data.get("entries", {}))
+        return cls(
+            version=data.get("version", 0),
+            entries=entries,
+            recent=data.get("recent", [])
+        )
+
+
+class WallSummaryFile:
+    """A wall summary persisted as JSON and cached in memory."""
+
+    def __init__(self, path: Path):
+        """Initialize the summary file.
+
+        Args:
+            path: Path of the summary JSON file
+        """
+        self.path = path
+        self._summary: Optional[WallSummary] = None
+        self._mtime_ns: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _read(self) -> Optional[WallSummary]:
+        """Read the summary from disk, reusing the cached copy if unchanged."""
+        try:
+            mtime_ns = self.path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+        if self._summary is not None and self._mtime_ns == mtime_ns:
+            return self._summary
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                summary = WallSummary.from_dict(json.load(f))
+        except (OSError, ValueError):
+            return None
+
+        self._summary = summary
+        self._mtime_ns = mtime_ns
+        return summary
+
+    def _write(self, summary: WallSummary) -> None:
+        """Persist the summary and remember it as the cached copy."""
+        content = json.dumps(summary.to_dict(), ensure_ascii=False)
+        atomic_write_text(self.path, content, create_parents=True)
+        self._summary = summary
+        self._mtime_ns = self.path.stat().st_mtime_ns
+
+    def get(self, store: ArtifactStore) -> WallSummary:
+        """Get the current summary, building it from the store if missing.
+
+        Args:
+            store: Store to rebuild from when no summary exists yet
+
+        Returns:
+            The wall summary (treat as read-only)
+        """
+        with self._lock:
+            summary = self._read()
+            if summary is None:
+                summary = self._build(store, version=1)
+                self._write(summary)
+            return summary
+
+    def record_save(self, store: ArtifactStore, artifact: Artifact) -> WallSummary:
+        """Apply a saved artifact and persist the summary."""
+        return self.record_saves(store, [artifact])
+
+    def record_saves(self, store: ArtifactStore, artifacts: List[Artifact]) -> WallSummary:
+        """Apply several saved artifacts as one version and persist the summary."""
+        with self._lock:
+            summary = self._read()
+            if summary is None:
+                # Store already contains the artifacts
+                summary = self._build(store, version=1)
+            else:
+                summary.record_saves(artifacts)
+            self._write(summary)
+            return summary
+
+    def record_clear(self) -> WallSummary:
+        """Empty the summary and persist it."""
+        with self._lock:
+            summary = self._read() or WallSummary()
+            summary.record_clear()
+            self._write(summary)
+            return summary
+
+    def rebuild(self, store: ArtifactStore) -> WallSummary:
+        """Rebuild the summary from the store, keeping the version monotonic."""
+        with self._lock:
+            previous = self._read()
+            version = (previous.version if previous else 0) + 1
+            summary = self._build(store, version=version)
+            self._write(summary)
+            return summary
+
+    def _build(self, store: ArtifactStore, version: int) -> WallSummary:
+        """Build a summary from the artifact headers in the store."""
+        summary = WallSummary(version=version)
+        for header in sorted(store.load_headers(), key=lambda h: h.updated_at):
+            summary._add(header, header.updated_at)
+        return summary
+
+
+# One summary file per discovery wall directory
+_SUMMARIES: Dict[Path, WallSummaryFile] = {}
+_SUMMARIES_LOCK = threading.Lock()
+
+
+def get_wall_summary_file(root: Path) -> WallSummaryFile:
+    """Get the shared summary file for a discovery wall directory.
+
+    Args:
+        root: Discovery wall directory
+
+    Returns:
+        WallSummaryFile for the directory
+    """
+    path = (root / SUMMARY_FILENAME).resolve()
+    with _SUMMARIES_LOCK:
+        summary_file = _SUMMARIES.get(path)
+        if summary_file is None:
+            summary_file = WallSummaryFile(root / SUMMARY_FILENAME)
+            _SUMMARIES[path] = summary_file
+        return summary_file
+
+
+def main() -> None:
+    """Rebuild the wall summary of a session workspace (or the legacy wall) from disk."""
+    from src.discovery.factory import create_artifact_store
+    from src.discovery.workspace import open_workspace
+    from src.utils.config import load_config
+
+    config = load_config()
+    if len(sys.argv) > 1:
+        workspace = open_workspace(sys.argv[1], config=config)
+        store, root = workspace.store, workspace.root
+    else:
+        store = create_artifact_store(config)
+        root = Path(config.get("paths", {}).get("output", "_hansel-output/discovery-wall"))
+
+    summary = get_wall_summary_file(root).rebuild(store)
+    counts = summary.counts()
+    print(f"Wall summary rebuilt (version {summary.version}): "
+          + ", ".join(f"{category}={counts[category]}" for category in WALL_CATEGORIES))
+
+
+if __name__ == "__main__":
+    main()
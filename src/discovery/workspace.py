@@ -0,0 +1,131 @@
+"""Session workspaces - one directory with chat and wall per discovery session.
+
+Every session ID from generate_session_id() maps to its own directory
+under the sessions directory, holding the session files and the artifact
+store of that session, so concurrent users never share files.
+
+The persistence functions in artifacts.py and session.py take an optional
+workspace argument. Without one they use the current workspace set with
+set_current_workspace() (the Streamlit app sets it at the start of every
+script run), and fall back to the single legacy wall directory if none
+is set.
+"""
+
+import re
+import uuid
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.discovery.factory import create_artifact_store
+from src.discovery.store import ArtifactStore
+
+
+# Default base directory holding one subdirectory per session
+WORKSPACES_DIR = Path("_hansel-output/sessions")
+
+# Session IDs double as directory names
+SESSION_ID_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_-]*$")
+
+# Workspace of the current script run / thread
+_current_workspace: ContextVar[Optional["Workspace"]] = ContextVar("current_workspace", default=None)
+
+
+def generate_session_id() -> str:
+    """Generate a unique session ID."""
+    return f"session-{uuid.uuid4().hex[:8]}"
+
+
+@dataclass
+class Workspace:
+    """Storage handle of a single discovery session."""
+    session_id: str
+    root: Path
+    store: ArtifactStore
+
+
+def get_workspaces_dir(config: Optional[Dict[str, Any]] = None) -> Path:
+    """Get the base directory for session workspaces.
+
+    Args:
+        config: Application config (uses paths.sessions if set)
+
+    Returns:
+        Base directory path
+    """
+    sessions = (config or {}).get("paths", {}).get("sessions")
+    return Path(sessions) if sessions else WORKSPACES_DIR
+
+
+def open_workspace(
+    session_id: str,
+    config: Optional[Dict[str, Any]] = None,
+    base_dir: Optional[Path] = None
+) -> Workspace:
+    """Open the workspace of a session, creating its directory if needed.
+
+    Args:
+        session_id: Session identifier
+        config: Application config (selects the artifact store backend)
+        base_dir: Base directory (defaults to get_workspaces_dir(config))
+
+    Returns:
+        Workspace for the session
+
+    Raises:
+        ValueError: If the session ID is not a valid directory name
+    """
+    if not SESSION_ID_PATTERN.match(session_id):
+        raise ValueError(f"Invalid session ID: {session_id!r}")
+
+    root = (base_dir or get_workspaces_dir(config)) / session_id
+    root.mkdir(parents=True, exist_ok=True)
+    return Workspace(
+        session_id=session_id,
+        root=root,
+        store=create_artifact_store(config or {}, root=root)
+    )
+
+
+def create_workspace(
+    config: Optional[Dict[str, Any]] = None,
+    base_dir: Optional[Path] = None
+) -> Workspace:
+    """Create a workspace for a new session.
+
+    Args:
+        config: Application config (selects the artifact store backend)
+        base_dir: Base directory (defaults to get_workspaces_dir(config))
+
+    Returns:
+        Workspace with a fresh session ID
+    """
+    return open_workspace(generate_session_id(), config=config, base_dir=base_dir)
+
+
+def workspace_exists(
+    session_id: str,
+    config: Optional[Dict[str, Any]] = None,
+    base_dir: Optional[Path] = None
+) -> bool:
+    """Check whether a workspace directory exists for a session."""
+    if not SESSION_ID_PATTERN.match(session_id):
+        return False
+    return ((base_dir or get_workspaces_dir(config)) / session_id).is_dir()
+
+
+def set_current_workspace(workspace: Optional[Workspace]) -> None:
+    """Set the workspace used when no workspace is passed explicitly.
+
+    The setting is local to the current thread / context.
+
+    Args:
+        workspace: Workspace, or None to use the legacy wall directory
+    """
+    _current_workspace.set(workspace)
+
+
+def get_current_workspace() -> Optional[Workspace]:
+    """Get the workspace set with set_current_workspace()."""
+    return _current_workspace.get()
@@ -0,0 +1,212 @@
+"""Background persistence writer - debounced disk writes off the UI thread.
+
+Callers submit write tasks under a key. Tasks with the same key are
+coalesced: only the latest one runs, so a burst of persist_chat() calls
+during one script run (user message, agent reply, greeting) becomes a
+single write. A worker thread runs the pending tasks at most every
+interval_ms and on flush()/stop(); the process flushes on exit.
+
+Tasks must capture everything they need (workspace, a snapshot of the
+data) because they run on the writer thread.
+"""
+
+import atexit
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+# Default debounce interval and bound on pending keys
+DEFAULT_INTERVAL_MS = 200
+DEFAULT_MAX_PENDING = 256
+
+
+@dataclass
+class WriterStats:
+    """Counters of a background writer."""
+    submitted: int = 0
+    coalesced: int = 0
+    written: int = 0
+    errors: int = 0
+    flushes: int = 0
+    queue_depth: int = 0
+    last_flush_ms: float = 0.0
+    max_flush_ms: float = 0.0
+    last_error: Optional[str] = None
+
+
+class BackgroundWriter:
+    """Worker thread running coalesced write tasks."""
+
+    def __init__(self, interval_ms: int = DEFAULT_INTERVAL_MS, max_pending: int = DEFAULT_MAX_PENDING):
+        """Initialize and start the writer.
+
+        Args:
+            interval_ms: Minimum time between two flushes
+            max_pending: Maximum number of pending keys; submitting a new
+                key beyond this blocks until the writer caught up
+        """
+        self.interval = interval_ms / 1000
+        self.max_pending = max_pending
+
+        self._pending: Dict[Hashable, Tuple[Callable[..., Any], tuple, dict]] = {}
+        self._in_flight = 0
+        self._stats = WriterStats()
+        self._stopping = False
+        self._flush_requested = False
+        self._condition = threading.Condition()
+
+        self._thread = threading.Thread(target=self._run, name="persistence-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, key: Hashable, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """Schedule fn(*args, **kwargs), replacing a pending task with the same key.
+
+        Args:
+            key: Coalescing key (e.g. the file being written)
+            fn: Write function
+            args: Positional arguments for fn
+            kwargs: Keyword arguments for fn
+        """
+        with self._condition:
+            if self._stopping:
+                raise RuntimeError("Background writer is stopped")
+
+            # Bounded: wait for the worker instead of growing without limit
+            while key not in self._pending and len(self._pending) >= self.max_pending:
+                self._condition.wait()
+
+            self._stats.submitted += 1
+            if key in self._pending:
+                self._stats.coalesced += 1
+            self._pending[key] = (fn, args, kwargs)
+            self._stats.queue_depth = len(self._pending)
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Run all pending tasks now and wait until they are written.
+
+        Args:
+            timeout: Maximum seconds to wait (None = no limit)
+
+        Returns:
+            True if everything was written within the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            if self._pending:
+                self._flush_requested = True
+                self._condition.notify_all()
+            while self._pending or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Flush pending tasks and stop the worker thread."""
+        self.flush(timeout)
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+
+    def stats(self) -> WriterStats:
+        """Get a snapshot of the writer counters (flush latency, queue depth, ...)."""
+        with self._condition:
+            return WriterStats(**vars(self._stats))
+
+    def _run(self) -> None:
+        """Worker loop: wait for tasks, debounce, write."""
+        last_flush = 0.0
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopping:
+                    self._condition.wait()
+                if self._stopping and not self._pending:
+                    return
+
+                # Debounce: collect more tasks until the interval has passed
+                while not self._stopping and not self._flush_requested:
+                    remaining = last_flush + self.interval - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                self._flush_requested = False
+                batch = self._pending
+                self._pending = {}
+                self._in_flight = len(batch)
+                self._stats.queue_depth = 0
+                self._condition.notify_all()
+
+            started = time.monotonic()
+            for fn, args, kwargs in batch.values():
+                try:
+                    fn(*args, **kwargs)
+                    error = None
+                except Exception as e:  # Keep writing the other tasks
+                    error = f"{type(e).__name__}: {e}"
+                with self._condition:
+                    self._in_flight -= 1
+                    if error is None:
+                        self._stats.written += 1
+                    else:
+                        self._stats.errors += 1
+                        self._stats.last_error = error
+            last_flush = time.monotonic()
+
+            with self._condition:
+                elapsed_ms = (last_flush - started) * 1000
+                self._stats.flushes += 1
+                self._stats.last_flush_ms = elapsed_ms
+                self._stats.max_flush_ms = max(self._stats.max_flush_ms, elapsed_ms)
+                self._condition.notify_all()
+
+
+# Process-wide writer (None = write synchronously)
+_writer: Optional[BackgroundWriter] = None
+_writer_lock = threading.Lock()
+
+
+def start_background_writer(
+    interval_ms: int = DEFAULT_INTERVAL_MS,
+    max_pending: int = DEFAULT_MAX_PENDING
+) -> BackgroundWriter:
+    """Start the process-wide background writer (once).
+
+    The writer is flushed when the process exits.
+
+    Args:
+        interval_ms: Minimum time between two flushes
+        max_pending: Maximum number of pending keys
+
+    Returns:
+        The running writer
+    """
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = BackgroundWriter(interval_ms=interval_ms, max_pending=max_pending)
+            atexit.register(_writer.stop)
+        return _writer
+
+
+def get_background_writer() -> Optional[BackgroundWriter]:
+    """Get the process-wide background writer, if started."""
+    return _writer
+
+
+def flush_background_writer(timeout: Optional[float] = None) -> bool:
+    """Flush the process-wide writer (no-op if none is running).
+
+    Args:
+        timeout: Maximum seconds to wait
+
+    Returns:
+        True if everything was written
+    """
+    writer = _writer
+    return writer.flush(timeout) if writer is not None else True
@@ -1,5 +1,27 @@
 # LLM Client modules
-from .factory import create_llm_client
-from .base import BaseLLMClient
+from .factory import create_llm_client, get_llm_client
+from .base import BaseLLMClient, UsageStats
+from .prompt import PromptBlock, SystemPrompt
+from .runtime import run_async, iterate_async, submit_async, get_event_loop_thread
+from .cache import ResponseCache, CacheStats, cached_complete, get_response_cache
+from .tokens import TokenCounter, TokenCounterStats, get_token_counter
 
-__all__ = ["create_llm_client", "BaseLLMClient"]
+__all__ = [
+    "create_llm_client",
+    "get_llm_client",
+    "BaseLLMClient",
+    "UsageStats",
+    "PromptBlock",
+    "SystemPrompt",
+    "run_async",
+    "iterate_async",
+    "submit_async",
+    "get_event_loop_thread",
+    "ResponseCache",
+    "CacheStats",
+    "cached_complete",
+    "get_response_cache",
+    "TokenCounter",
+    "TokenCounterStats",
+    "get_token_counter"
+]
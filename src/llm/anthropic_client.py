@@ -1,10 +1,17 @@
 """Anthropic Claude LLM client implementation."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import anthropic
 
-from .base import BaseLLMClient
+from .base import BaseLLMClient, parse_retry_after
+from .prompt import SystemPrompt
+
+
+# The API accepts at most this many cache breakpoints per request
+MAX_CACHE_BREAKPOINTS = 4
+
+CACHE_CONTROL = {"type": "ephemeral"}
 
 
 class AnthropicClient(BaseLLMClient):
@@ -17,10 +24,26 @@ class AnthropicClient(BaseLLMClient):
         """Initialize Anthropic client.
 
         Args:
-            config: Configuration dict with model, max_tokens, temperature
+            config: Configuration dict with model, max_tokens, temperature,
+                prompt_caching and optional connection pool limits
+                (max_connections, max_keepalive_connections, keepalive_expiry)
         """
         super().__init__(config)
-        self.client = anthropic.AsyncAnthropic()
+        self.prompt_caching = config.get("prompt_caching", True)
+        # Clients are shared per config (see get_llm_client()), so the pool
+        # serves all sessions; keep idle connections open between turns
+        defaults = anthropic.DEFAULT_CONNECTION_LIMITS
+        # Limits class of the HTTP library the SDK is built on
+        limits = type(defaults)(
+            max_connections=config.get("max_connections", defaults.max_connections),
+            max_keepalive_connections=config.get("max_keepalive_connections", defaults.max_keepalive_connections),
+            keepalive_expiry=config.get("keepalive_expiry", defaults.keepalive_expiry)
+        )
+        # Retries and deadlines are handled by BaseLLMClient
+        self.client = anthropic.AsyncAnthropic(
+            http_client=anthropic.DefaultAsyncHttpxClient(limits=limits),
+            max_retries=0
+        )
         # Default to Claude Sonnet if not specified
         if not self.model:
             self.model = "claude-sonnet-4-20250514"
@@ -39,13 +62,130 @@ class AnthropicClient(BaseLLMClient):
         Returns:
             Response text from Claude
         """
-        response = await self.client.messages.create(
+        async def create() -> str:
+            response = await self.client.messages.create(**self._request_params(messages, system_prompt))
+            self._record_response_usage(response.usage, self._prompt_text(messages, system_prompt))
+            return response.content[0].text
+
+        return await self._call_resilient(create, messages, system_prompt)
+
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Send messages to Claude and yield the response text as it arrives.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            system_prompt: Optional system prompt
+
+        Yields:
+            Text deltas of Claude's response
+        """
+        async def open_stream() -> AsyncIterator[str]:
+            async with self.client.messages.stream(**self._request_params(messages, system_prompt)) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                message = await stream.get_final_message()
+                self._record_response_usage(message.usage, self._prompt_text(messages, system_prompt))
+
+        async for text in self._stream_resilient(open_stream, messages, system_prompt):
+            yield text
+
+    def _request_params(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the Messages API parameters, with cache breakpoints if enabled.
+
+        With prompt caching, the system prompt is sent as one text block
+        per SystemPrompt block, with a breakpoint after each cacheable
+        block, and a breakpoint on the last message, so the history up to
+        this turn is read from the cache on the next one.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            system_prompt: Optional system prompt (str or SystemPrompt)
+
+        Returns:
+            Keyword arguments for messages.create() / messages.stream()
+        """
+        params = {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "system": str(system_prompt or ""),
+            "messages": messages
+        }
+        if not self.prompt_caching:
+            return params
+
+        if isinstance(system_prompt, SystemPrompt) and system_prompt.blocks:
+            # Keep one breakpoint for the messages; drop the earliest ones if needed
+            cached = [i for i, block in enumerate(system_prompt.blocks) if block.cache]
+            cached = set(cached[-(MAX_CACHE_BREAKPOINTS - 1):])
+            system = []
+            for index, text in enumerate(system_prompt.block_texts()):
+                block = {"type": "text", "text": text}
+                if index in cached:
+                    block["cache_control"] = CACHE_CONTROL
+                system.append(block)
+            params["system"] = system
+
+        if messages and isinstance(messages[-1].get("content"), str) and messages[-1]["content"]:
+            last = messages[-1]
+            params["messages"] = messages[:-1] + [{
+                "role": last["role"],
+                "content": [{"type": "text", "text": last["content"], "cache_control": CACHE_CONTROL}]
+            }]
+
+        return params
+
+    def _record_response_usage(self, usage: Any, prompt: Optional[str] = None) -> None:
+        """Record the token usage of a response, including prompt cache reads/writes."""
+        if usage is None:
+            return
+        self._record_usage(
+            input_tokens=getattr(usage, "input_tokens", 0),
+            output_tokens=getattr(usage, "output_tokens", 0),
+            cache_read_tokens=getattr(usage, "cache_read_input_tokens", 0),
+            cache_write_tokens=getattr(usage, "cache_creation_input_tokens", 0),
+            prompt=prompt
+        )
+
+    async def count_tokens(self, text: str) -> Optional[int]:
+        """Count the tokens of a text with the Messages count_tokens API.
+
+        Args:
+            text: Text to count (as a single user message)
+
+        Returns:
+            Input tokens of the text
+        """
+        result = await self.client.messages.count_tokens(
             model=self.model,
-            max_tokens=self.max_tokens,
-            system=system_prompt or "",
-            messages=messages
+            messages=[{"role": "user", "content": text}]
         )
-        return response.content[0].text
+        return result.input_tokens
+
+    def get_retry_delay(self, error: Exception) -> Optional[float]:
+        """Retry connection errors, rate limits (429), overload and server errors.
+
+        Args:
+            error: Exception raised by the Anthropic SDK
+
+        Returns:
+            Seconds requested by retry-after (0 = use backoff), or None
+            if the error is permanent
+        """
+        if isinstance(error, anthropic.APIConnectionError):
+            return 0.0
+        if isinstance(error, anthropic.APIStatusError):
+            if error.status_code == 429 or error.status_code >= 500:
+                return parse_retry_after(error.response.headers.get("retry-after"))
+        return None
 
     def get_provider_name(self) -> str:
         """Return provider name."""
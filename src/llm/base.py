@@ -1,7 +1,166 @@
-"""Abstract base class for LLM clients."""
+"""Abstract base class for LLM clients.
 
+Besides the client interface, this module holds the resilience layer
+shared by all providers: every call runs with a deadline, waits for a
+free slot (max in-flight calls) and for the request and token budgets
+(token buckets per minute), and is retried with jittered exponential
+backoff on rate limits and server errors, honoring retry-after. The
+settings come from llm.resilience in config.yaml.
+"""
+
+import asyncio
+import random
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from .tokens import TokenCounter
+
+
+class LLMTimeoutError(TimeoutError):
+    """An LLM call did not finish within its deadline."""
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the number of tokens of a text (~4 characters each).
+
+    Fallback for clients without a TokenCounter (see tokens.py).
+    """
+    return max(1, len(text) // 4)
+
+
+def parse_retry_after(value: Optional[str]) -> float:
+    """Parse a retry-after header (seconds or HTTP date).
+
+    Args:
+        value: Header value, if any
+
+    Returns:
+        Seconds to wait (0 if missing or unparsable)
+    """
+    if not value:
+        return 0.0
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0.0
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+@dataclass
+class ResilienceConfig:
+    """Deadline, retry and rate limit settings of an LLM client."""
+    timeout_seconds: float = 180.0  # Deadline per call, including retries and waiting
+    max_retries: int = 3
+    backoff_base_seconds: float = 1.0
+    backoff_max_seconds: float = 30.0
+    requests_per_minute: Optional[int] = None  # None = unlimited
+    tokens_per_minute: Optional[int] = None  # None = unlimited
+    max_in_flight: int = 8  # Concurrent calls per client
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "ResilienceConfig":
+        """Build the settings from a config section, ignoring unknown keys."""
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in (data or {}).items() if key in known})
+
+
+@dataclass
+class UsageStats:
+    """Token usage reported by the provider, summed over all calls."""
+    calls: int = 0
+    input_tokens: int = 0  # Uncached input tokens
+    output_tokens: int = 0
+    cache_read_tokens: int = 0  # Input tokens read from the prompt cache
+    cache_write_tokens: int = 0  # Input tokens written to the prompt cache
+
+
+class TokenBucket:
+    """Token bucket refilling a per-minute budget continuously.
+
+    Not thread-safe: use it from a single event loop.
+    """
+
+    def __init__(self, per_minute: int):
+        """Initialize a full bucket.
+
+        Args:
+            per_minute: Budget per minute (also the bucket capacity)
+        """
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, amount: float, deadline: Optional[float] = None) -> None:
+        """Wait until amount is available and take it.
+
+        Args:
+            amount: Budget to take (capped at the capacity)
+            deadline: time.monotonic() value to give up at
+
+        Raises:
+            LLMTimeoutError: If the budget is not available before the deadline
+        """
+        amount = min(amount, self.capacity)
+        while True:
+            self._refill()
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return
+            wait = (amount - self.tokens) / self.rate
+            if deadline is not None and time.monotonic() + wait > deadline:
+                raise LLMTimeoutError("Rate limit budget not available before the deadline")
+            await asyncio.sleep(wait)
+
+    def debit(self, amount: float) -> None:
+        """Take budget after the fact (may go below zero)."""
+        self._refill()
+        self.tokens -= amount
+
+
+class RateLimiter:
+    """Request and token budgets and the in-flight limit of LLM calls.
+
+    Every client has one; clients of the same provider share it (see
+    get_llm_client()), so together they stay within the configured limits.
+    """
+
+    def __init__(self, resilience: ResilienceConfig):
+        """Initialize the limits from the resilience settings."""
+        self.request_bucket = (
+            TokenBucket(resilience.requests_per_minute)
+            if resilience.requests_per_minute else None
+        )
+        self.token_bucket = (
+            TokenBucket(resilience.tokens_per_minute)
+            if resilience.tokens_per_minute else None
+        )
+        self.max_in_flight = resilience.max_in_flight
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    @property
+    def slots(self) -> asyncio.Semaphore:
+        """Semaphore of the in-flight calls (created on first use)."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+        return self._slots
 
 
 class BaseLLMClient(ABC):
@@ -15,12 +174,22 @@ class BaseLLMClient(ABC):
         """Initialize the LLM client.
 
         Args:
-            config: Provider-specific configuration dict
+            config: Provider-specific configuration dict, optionally with a
+                'resilience' section (see ResilienceConfig)
         """
         self.model = config.get("model", "")
         self.max_tokens = config.get("max_tokens", 4096)
         self.temperature = config.get("temperature", 0.7)
 
+        self.resilience = ResilienceConfig.from_dict(config.get("resilience"))
+        self.limiter = RateLimiter(self.resilience)
+
+        self._usage = UsageStats()
+        self._usage_lock = threading.Lock()
+
+        # Set by the factory: budgets count with it, responses calibrate it
+        self.token_counter: Optional["TokenCounter"] = None
+
     @abstractmethod
     async def complete(
         self,
@@ -38,7 +207,236 @@ class BaseLLMClient(ABC):
         """
         pass
 
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Send messages to LLM and yield the response text as it arrives.
+
+        Providers override this to stream tokens; the default yields the
+        complete() response as a single chunk.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            system_prompt: Optional system prompt
+
+        Yields:
+            Chunks of the response text; joined they equal complete()
+        """
+        yield await self.complete(messages, system_prompt)
+
     @abstractmethod
     def get_provider_name(self) -> str:
         """Return the provider name for display purposes."""
         pass
+
+    async def count_tokens(self, text: str) -> Optional[int]:
+        """Count the tokens of a text exactly with the provider's API.
+
+        Providers override this if they offer a count API.
+
+        Args:
+            text: Text to count (as a single user message)
+
+        Returns:
+            Token count, or None if the provider cannot count
+        """
+        return None
+
+    def usage_stats(self) -> UsageStats:
+        """Get a snapshot of the token usage (incl. prompt cache reads/writes)."""
+        with self._usage_lock:
+            return UsageStats(**vars(self._usage))
+
+    def _record_usage(
+        self,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
+        prompt: Optional[str] = None
+    ) -> None:
+        """Add the usage of one call to the totals.
+
+        Args:
+            input_tokens: Uncached input tokens
+            output_tokens: Generated tokens
+            cache_read_tokens: Input tokens read from the prompt cache
+            cache_write_tokens: Input tokens written to the prompt cache
+            prompt: Text of the request (see _prompt_text()); calibrates
+                the token counter with the total input tokens
+        """
+        with self._usage_lock:
+            self._usage.calls += 1
+            self._usage.input_tokens += input_tokens or 0
+            self._usage.output_tokens += output_tokens or 0
+            self._usage.cache_read_tokens += cache_read_tokens or 0
+            self._usage.cache_write_tokens += cache_write_tokens or 0
+
+        total_input = (input_tokens or 0) + (cache_read_tokens or 0) + (cache_write_tokens or 0)
+        if prompt and total_input and self.token_counter is not None:
+            self.token_counter.record_text(prompt, total_input)
+
+    @staticmethod
+    def _prompt_text(messages: List[Dict[str, str]], system_prompt: Optional[str] = None) -> str:
+        """The text of a request: system prompt and message contents."""
+        return (system_prompt or "") + "".join(msg.get("content") or "" for msg in messages)
+
+    def _count_tokens(self, text: str) -> int:
+        """Estimate the tokens of a request or response for the rate limits."""
+        if self.token_counter is None:
+            return estimate_tokens(text)
+        return self.token_counter.count(text, cache=False)
+
+    def get_retry_delay(self, error: Exception) -> Optional[float]:
+        """Decide whether a failed call is retried.
+
+        Providers override this to recognize their rate limit and server
+        errors.
+
+        Args:
+            error: Exception raised by the provider call
+
+        Returns:
+            None if the error is permanent; otherwise the delay requested
+            by the provider (retry-after) in seconds, or 0 to use backoff
+        """
+        return None
+
+    async def _call_resilient(
+        self,
+        call: Callable[[], Awaitable[str]],
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None
+    ) -> str:
+        """Run a provider call with deadline, limits and retries.
+
+        Args:
+            call: Starts one attempt of the provider request
+            messages: Messages of the request (for the token budget)
+            system_prompt: System prompt of the request
+
+        Returns:
+            Response text
+
+        Raises:
+            LLMTimeoutError: If the deadline passed
+        """
+        deadline = time.monotonic() + self.resilience.timeout_seconds
+        attempt = 0
+        while True:
+            await self._acquire(messages, system_prompt, deadline)
+            try:
+                response = await asyncio.wait_for(call(), self._remaining(deadline))
+            except asyncio.TimeoutError:
+                raise LLMTimeoutError(
+                    f"LLM call did not finish within {self.resilience.timeout_seconds:.0f} s"
+                ) from None
+            except Exception as e:
+                error = e
+            else:
+                self._debit_output(response)
+                return response
+            finally:
+                self.limiter.slots.release()
+
+            attempt += 1
+            await self._backoff(error, attempt, deadline)
+
+    async def _stream_resilient(
+        self,
+        open_stream: Callable[[], AsyncIterator[str]],
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Run a provider stream with deadline, limits and retries.
+
+        A stream is only retried until its first chunk was yielded.
+
+        Args:
+            open_stream: Starts one attempt of the provider stream
+            messages: Messages of the request (for the token budget)
+            system_prompt: System prompt of the request
+
+        Yields:
+            Chunks of the response text
+
+        Raises:
+            LLMTimeoutError: If the deadline passed
+        """
+        deadline = time.monotonic() + self.resilience.timeout_seconds
+        attempt = 0
+        while True:
+            await self._acquire(messages, system_prompt, deadline)
+            chunks = open_stream()
+            output = []
+            try:
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(chunks.__anext__(), self._remaining(deadline))
+                    except StopAsyncIteration:
+                        return
+                    output.append(chunk)
+                    yield chunk
+            except asyncio.TimeoutError:
+                raise LLMTimeoutError(
+                    f"LLM stream did not finish within {self.resilience.timeout_seconds:.0f} s"
+                ) from None
+            except Exception as e:
+                if output:
+                    raise  # Part of the answer is already shown
+                error = e
+            finally:
+                self.limiter.slots.release()
+                self._debit_output("".join(output))
+                aclose = getattr(chunks, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+
+            attempt += 1
+            await self._backoff(error, attempt, deadline)
+
+    async def _acquire(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str],
+        deadline: float
+    ) -> None:
+        """Wait for the rate limit budgets and a free in-flight slot."""
+        limiter = self.limiter
+        if limiter.request_bucket is not None:
+            await limiter.request_bucket.acquire(1, deadline)
+        if limiter.token_bucket is not None:
+            prompt = self._prompt_text(messages, system_prompt)
+            await limiter.token_bucket.acquire(self._count_tokens(prompt), deadline)
+
+        try:
+            await asyncio.wait_for(limiter.slots.acquire(), self._remaining(deadline))
+        except asyncio.TimeoutError:
+            raise LLMTimeoutError("No free LLM slot before the deadline") from None
+
+    def _debit_output(self, response: str) -> None:
+        """Charge the generated tokens to the token budget."""
+        if self.limiter.token_bucket is not None and response:
+            self.limiter.token_bucket.debit(self._count_tokens(response))
+
+    async def _backoff(self, error: Exception, attempt: int, deadline: float) -> None:
+        """Sleep before the next attempt, or re-raise if the error is final."""
+        retry_after = self.get_retry_delay(error)
+        if retry_after is None or attempt > self.resilience.max_retries:
+            raise error
+
+        backoff = min(
+            self.resilience.backoff_max_seconds,
+            self.resilience.backoff_base_seconds * 2 ** (attempt - 1)
+        )
+        delay = max(retry_after, backoff * random.uniform(0.5, 1.0))
+        if time.monotonic() + delay >= deadline:
+            raise error
+        await asyncio.sleep(delay)
+
+    @staticmethod
+    def _remaining(deadline: float) -> float:
+        """Seconds left until the deadline (at least a tiny positive value)."""
+        return max(deadline - time.monotonic(), 0.001)
@@ -0,0 +1,339 @@
+"""LLM response cache - an in-memory LRU with an optional disk tier.
+
+Caching is opt-in per call site: wrap a call in cached_complete() where
+the same prompt must give the same answer (e.g. compiling the mandat
+from the chat). Responses are keyed by a hash of provider, model,
+temperature, max_tokens, system prompt and messages; only role and
+content of each message are part of the key, with surrounding
+whitespace removed.
+
+The disk tier keeps one JSON file per response, so replayed demos and
+regression runs hit the cache across restarts. Entries expire after
+ttl_seconds; when the directory grows beyond max_disk_bytes the least
+recently used files are deleted.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.utils.files import atomic_write_text
+
+from .base import BaseLLMClient
+
+
+# Default tier sizes
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_DISK_MB = 50
+
+
+@dataclass
+class CacheStats:
+    """Counters of a response cache."""
+    hits: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0  # Entries dropped from the disk tier (expired or over the size cap)
+    entries: int = 0  # Entries in the memory tier
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """LRU cache of LLM responses with an optional disk tier."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        directory: Optional[Path] = None,
+        ttl_seconds: Optional[float] = None,
+        max_disk_bytes: Optional[int] = DEFAULT_MAX_DISK_MB * 1024 * 1024
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Responses kept in memory
+            directory: Directory of the disk tier (None = memory only)
+            ttl_seconds: Maximum age of a response (None = no expiry)
+            max_disk_bytes: Size cap of the disk tier (None = unlimited)
+        """
+        self.max_entries = max_entries
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_bytes = max_disk_bytes
+
+        # key -> (created_at, response), least recently used first
+        self._memory: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self._disk_bytes: Optional[int] = None  # Estimate, scanned on demand
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        client: BaseLLMClient,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None
+    ) -> str:
+        """Build the cache key of a completion request.
+
+        Args:
+            client: Client the request is sent with
+            messages: List of message dicts with 'role' and 'content'
+            system_prompt: Optional system prompt
+
+        Returns:
+            Hex digest identifying the request
+        """
+        request = {
+            "provider": client.get_provider_name(),
+            "model": client.model,
+            "temperature": client.temperature,
+            "max_tokens": client.max_tokens,
+            "system": (system_prompt or "").strip(),
+            "messages": [
+                [msg.get("role"), (msg.get("content") or "").strip()]
+                for msg in messages
+            ]
+        }
+        canonical = json.dumps(request, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a response.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            The cached response, or None on a miss
+        """
+        with self._lock:
+            now = time.time()
+            entry = self._memory.get(key)
+            if entry is not None and not self._expired(entry[0], now):
+                self._memory.move_to_end(key)
+                self._stats.hits += 1
+                self._stats.memory_hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._memory[key]
+
+            entry = self._read_disk(key, now)
+            if entry is not None:
+                self._remember(key, entry)
+                self._stats.hits += 1
+                self._stats.disk_hits += 1
+                return entry[1]
+
+            self._stats.misses += 1
+            return None
+
+    def put(self, key: str, response: str) -> None:
+        """Store a response in both tiers.
+
+        Args:
+            key: Key from make_key()
+            response: Response text
+        """
+        with self._lock:
+            entry = (time.time(), response)
+            self._remember(key, entry)
+            self._write_disk(key, entry)
+            self._stats.stores += 1
+
+    def clear(self) -> None:
+        """Drop all cached responses (memory and disk)."""
+        with self._lock:
+            self._memory.clear()
+            self._stats.entries = 0
+            if self.directory is not None and self.directory.is_dir():
+                for path in self.directory.glob("*.json"):
+                    path.unlink(missing_ok=True)
+            self._disk_bytes = 0
+
+    def stats(self) -> CacheStats:
+        """Get a snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(**vars(self._stats))
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        """Whether an entry created at created_at is past the TTL."""
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _remember(self, key: str, entry: tuple) -> None:
+        """Put an entry into the memory tier, evicting the oldest."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+        self._stats.entries = len(self._memory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _read_disk(self, key: str, now: float) -> Optional[tuple]:
+        """Read an entry from the disk tier (None if missing or expired)."""
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            entry = (float(data["created_at"]), data["response"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if self._expired(entry[0], now):
+            self._unlink(path)
+            return None
+        try:
+            os.utime(path)  # Mark as recently used for the size cap
+        except OSError:
+            pass
+        return entry
+
+    def _write_disk(self, key: str, entry: tuple) -> None:
+        """Write an entry to the disk tier and enforce the size cap."""
+        if self.directory is None:
+            return
+        content = json.dumps({"created_at": entry[0], "response": entry[1]}, ensure_ascii=False)
+        path = self._path(key)
+        try:
+            atomic_write_text(path, content, create_parents=True)
+        except OSError:
+            return  # The disk tier is best effort
+
+        if self.max_disk_bytes is None:
+            return
+        if self._disk_bytes is None:
+            self._disk_bytes = self._scan_disk_bytes()
+        else:
+            self._disk_bytes += len(content.encode("utf-8"))
+        if self._disk_bytes > self.max_disk_bytes:
+            self._prune_disk()
+
+    def _scan_disk_bytes(self) -> int:
+        """Sum the sizes of all cache files."""
+        total = 0
+        for path in self.directory.glob("*.json"):
+            try:
+                total += path.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def _prune_disk(self) -> None:
+        """Delete expired, then least recently used files until under the cap."""
+        now = time.time()
+        files = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+
+        total = sum(size for _, size, _ in files)
+        for mtime, size, path in files:
+            expired = self.ttl_seconds is not None and now - mtime > self.ttl_seconds
+            if total <= self.max_disk_bytes and not expired:
+                continue
+            self._unlink(path)
+            total -= size
+        self._disk_bytes = total
+
+    def _unlink(self, path: Path) -> None:
+        """Delete a cache file and count the eviction."""
+        try:
+            path.unlink()
+        except OSError:
+            return
+        self._stats.evictions += 1
+
+
+async def cached_complete(
+    client: BaseLLMClient,
+    messages: List[Dict[str, str]],
+    system_prompt: Optional[str] = None,
+    cache: Optional[ResponseCache] = None
+) -> str:
+    """Call client.complete() through the response cache.
+
+    Empty responses are not cached. Lookups and stores run in a worker
+    thread, so disk reads and fsync'd writes do not block the event loop
+    (and with it every other LLM call on the shared loop).
+
+    Args:
+        client: LLM client
+        messages: List of message dicts with 'role' and 'content'
+        system_prompt: Optional system prompt
+        cache: Cache to use (defaults to get_response_cache())
+
+    Returns:
+        Response text, from the cache if the same request was seen before
+    """
+    cache = cache if cache is not None else get_response_cache()
+    key = cache.make_key(client, messages, system_prompt)
+    response = await asyncio.to_thread(cache.get, key)
+    if response is None:
+        response = await client.complete(messages, system_prompt)
+        if response:
+            await asyncio.to_thread(cache.put, key, response)
+    return response
+
+
+def create_response_cache(config: Dict[str, Any]) -> ResponseCache:
+    """Create a response cache from the llm.cache config section.
+
+    Args:
+        config: Full application config dict
+
+    Returns:
+        Configured ResponseCache (memory only if no directory is set)
+    """
+    cache_config = config.get("llm", {}).get("cache", {}) or {}
+    directory = cache_config.get("directory")
+    ttl_hours = cache_config.get("ttl_hours")
+    max_disk_mb = cache_config.get("max_disk_mb", DEFAULT_MAX_DISK_MB)
+    return ResponseCache(
+        max_entries=cache_config.get("max_entries", DEFAULT_MAX_ENTRIES),
+        directory=Path(directory) if directory else None,
+        ttl_seconds=ttl_hours * 3600 if ttl_hours else None,
+        max_disk_bytes=int(max_disk_mb * 1024 * 1024) if max_disk_mb else None
+    )
+
+
+# Process-wide cache (created on first use)
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache(config: Optional[Dict[str, Any]] = None) -> ResponseCache:
+    """Get the process-wide response cache, creating it once.
+
+    Args:
+        config: Application config used when the cache is created
+            (later calls return the existing cache)
+
+    Returns:
+        The shared ResponseCache
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = create_response_cache(config or {})
+        return _cache
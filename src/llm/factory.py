@@ -1,10 +1,25 @@
 """LLM client factory for provider selection."""
 
-from typing import Any, Dict
+import json
+import threading
+from typing import Any, Dict, Tuple
 
-from .base import BaseLLMClient
+from .base import BaseLLMClient, RateLimiter
 from .anthropic_client import AnthropicClient
 from .google_client import GoogleClient
+from .tokens import get_token_counter
+
+
+def _provider_config(llm_config: Dict[str, Any], provider: str) -> Dict[str, Any]:
+    """Get the provider section with the shared llm.resilience settings.
+
+    Keys in the provider's own 'resilience' section take precedence.
+    """
+    provider_config = dict(llm_config.get(provider, {}) or {})
+    resilience = dict(llm_config.get("resilience", {}) or {})
+    resilience.update(provider_config.get("resilience", {}) or {})
+    provider_config["resilience"] = resilience
+    return provider_config
 
 
 def create_llm_client(config: Dict[str, Any]) -> BaseLLMClient:
@@ -32,14 +47,61 @@ def create_llm_client(config: Dict[str, Any]) -> BaseLLMClient:
         )
 
     # Get provider-specific config
-    provider_config = llm_config.get(provider, {})
+    provider_config = _provider_config(llm_config, provider)
 
     if provider == "anthropic":
-        return AnthropicClient(provider_config)
+        client = AnthropicClient(provider_config)
     elif provider == "google":
-        return GoogleClient(provider_config)
+        client = GoogleClient(provider_config)
     else:
         raise ValueError(
             f"Unknown LLM provider: {provider}. "
             "Supported providers: 'anthropic', 'google'"
         )
+
+    # Budgets are counted with the shared counter; responses calibrate it
+    counter = get_token_counter(config)
+    client.token_counter = counter
+    if (llm_config.get("tokens", {}) or {}).get("exact_counting") and counter.count_api is None:
+        counter.count_api = client.count_tokens
+    return client
+
+
+# Shared clients by (provider, provider config)
+_CLIENTS: Dict[Tuple[str, str], BaseLLMClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+# Rate limits shared by all clients of a provider (e.g. chat and summary)
+_LIMITERS: Dict[str, RateLimiter] = {}
+
+
+def get_llm_client(config: Dict[str, Any]) -> BaseLLMClient:
+    """Get the shared LLM client for a configuration.
+
+    All browser sessions with the same provider settings use one client,
+    and with it one connection pool. Its coroutines must run on the
+    process-wide loop (see runtime.py), since the pool is bound to the
+    loop it was first used on. Clients of the same provider with other
+    settings (e.g. a cheaper model for summaries) share the rate limits
+    of the first one, so their calls count against the same budgets.
+
+    Args:
+        config: Full application config dict containing 'llm' section
+
+    Returns:
+        Configured LLM client instance
+
+    Raises:
+        ValueError: If provider is unknown or not configured
+    """
+    llm_config = config.get("llm", {})
+    provider = llm_config.get("provider", "").lower()
+    key = (provider, json.dumps(_provider_config(llm_config, provider), sort_keys=True, default=str))
+
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            client = create_llm_client(config)
+            client.limiter = _LIMITERS.setdefault(provider, client.limiter)
+            _CLIENTS[key] = client
+        return client
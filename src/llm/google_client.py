@@ -1,13 +1,26 @@
 """Google Gemini LLM client implementation."""
 
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 
 from .base import BaseLLMClient
 
 
+# Errors worth another attempt (rate limits, overload, server errors)
+RETRYABLE_ERRORS = (
+    google_exceptions.TooManyRequests,
+    google_exceptions.ResourceExhausted,
+    google_exceptions.InternalServerError,
+    google_exceptions.BadGateway,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.GatewayTimeout,
+    google_exceptions.DeadlineExceeded
+)
+
+
 class GoogleClient(BaseLLMClient):
     """Google Gemini API client.
 
@@ -47,25 +60,114 @@ class GoogleClient(BaseLLMClient):
         Returns:
             Response text from Gemini
         """
+        async def send() -> str:
+            chat, last_message = self._start_chat(messages, system_prompt)
+            response = await chat.send_message_async(
+                last_message,
+                generation_config=self._generation_config()
+            )
+            self._record_response_usage(response, self._prompt_text(messages, system_prompt))
+            return response.text
+
+        return await self._call_resilient(send, messages, system_prompt)
+
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Send messages to Gemini and yield the response text as it arrives.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            system_prompt: Optional system prompt
+
+        Yields:
+            Text chunks of Gemini's response
+        """
+        async def open_stream() -> AsyncIterator[str]:
+            chat, last_message = self._start_chat(messages, system_prompt)
+            response = await chat.send_message_async(
+                last_message,
+                generation_config=self._generation_config(),
+                stream=True
+            )
+            async for chunk in response:
+                if chunk.parts:
+                    yield chunk.text
+            self._record_response_usage(response, self._prompt_text(messages, system_prompt))
+
+        async for text in self._stream_resilient(open_stream, messages, system_prompt):
+            yield text
+
+    def _record_response_usage(self, response: Any, prompt: Optional[str] = None) -> None:
+        """Record the token usage reported with a response."""
+        usage = getattr(response, "usage_metadata", None)
+        if usage is None:
+            return
+        # prompt_token_count includes the cached tokens
+        cached = getattr(usage, "cached_content_token_count", 0) or 0
+        self._record_usage(
+            input_tokens=(getattr(usage, "prompt_token_count", 0) or 0) - cached,
+            output_tokens=getattr(usage, "candidates_token_count", 0),
+            cache_read_tokens=cached,
+            prompt=prompt
+        )
+
+    async def count_tokens(self, text: str) -> Optional[int]:
+        """Count the tokens of a text with the Gemini count_tokens API.
+
+        Args:
+            text: Text to count
+
+        Returns:
+            Total tokens of the text
+        """
+        result = await self.genai_model.count_tokens_async(text)
+        return result.total_tokens
+
+    def get_retry_delay(self, error: Exception) -> Optional[float]:
+        """Retry rate limits, overload and server errors (with backoff).
+
+        Args:
+            error: Exception raised by the Gemini SDK
+
+        Returns:
+            0 for retryable errors, None if the error is permanent
+        """
+        return 0.0 if isinstance(error, RETRYABLE_ERRORS) else None
+
+    def _start_chat(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None
+    ) -> Tuple[Any, str]:
+        """Start a Gemini chat with all but the last message as history.
+
+        Args:
+            messages: Messages in standard format
+            system_prompt: Optional system prompt
+
+        Returns:
+            Tuple of (chat session, last message text to send)
+        """
         # Convert messages to Gemini format
         history = self._convert_history(messages[:-1], system_prompt)
 
         # Start chat with history
         chat = self.genai_model.start_chat(history=history)
 
-        # Send the last message
+        # The last message is sent separately
         last_message = messages[-1]["content"] if messages else ""
+        return chat, last_message
 
-        response = await chat.send_message_async(
-            last_message,
-            generation_config=genai.GenerationConfig(
-                max_output_tokens=self.max_tokens,
-                temperature=self.temperature
-            )
+    def _generation_config(self) -> genai.GenerationConfig:
+        """Build the generation config from the client settings."""
+        return genai.GenerationConfig(
+            max_output_tokens=self.max_tokens,
+            temperature=self.temperature
         )
 
-        return response.text
-
     def _convert_history(
         self,
         messages: List[Dict[str, str]],
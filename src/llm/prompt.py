@@ -0,0 +1,49 @@
+"""Structured system prompts - ordered blocks for provider-side caching.
+
+A SystemPrompt is a plain string (the blocks joined by blank lines), so
+every client and helper that expects a str keeps working. Clients that
+support prompt caching (see AnthropicClient) read .blocks instead and
+place cache breakpoints after the blocks marked as cacheable, so the
+stable prefix (persona, knowledge, artifacts) is only processed once and
+then read from the provider's cache on every following turn.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, Tuple
+
+
+# Separator between blocks in the joined prompt
+BLOCK_SEPARATOR = "\n\n"
+
+
+@dataclass(frozen=True)
+class PromptBlock:
+    """One section of a system prompt."""
+    name: str  # e.g. "persona", "knowledge", "artifacts"
+    text: str
+    cache: bool = False  # Stable across turns: put a cache breakpoint after it
+
+
+class SystemPrompt(str):
+    """A system prompt made of ordered blocks."""
+
+    blocks: Tuple[PromptBlock, ...]
+
+    def __new__(cls, blocks: Iterable[PromptBlock]) -> "SystemPrompt":
+        """Create the prompt from its blocks (empty blocks are dropped).
+
+        Args:
+            blocks: Blocks in prompt order, most stable first
+        """
+        blocks = tuple(block for block in blocks if block.text)
+        prompt = super().__new__(cls, BLOCK_SEPARATOR.join(block.text for block in blocks))
+        prompt.blocks = blocks
+        return prompt
+
+    def block_texts(self) -> Tuple[str, ...]:
+        """Get the block texts with their separators, so that joined they equal the prompt."""
+        last = len(self.blocks) - 1
+        return tuple(
+            block.text + (BLOCK_SEPARATOR if index < last else "")
+            for index, block in enumerate(self.blocks)
+        )
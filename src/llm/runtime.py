@@ -0,0 +1,176 @@
+"""Process-wide event loop for LLM calls.
+
+Streamlit runs every script in its own thread without an event loop.
+Instead of asyncio.run() per call, which creates and closes a loop each
+turn, all LLM coroutines run on one long-lived loop in a background
+thread. The shared clients from get_llm_client() keep their HTTP
+connection pools on that loop, so connections are reused across turns
+and browser sessions.
+
+Script code submits coroutines with run_async() and consumes async
+generators (e.g. BaseLLMClient.stream()) with iterate_async(); both
+block the calling thread only, never the loop. Background work is
+scheduled with submit_async(), which does not wait at all.
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import threading
+from typing import Any, AsyncIterator, Awaitable, Iterator, Optional, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+
+class EventLoopThread:
+    """An asyncio event loop running forever in a daemon thread."""
+
+    def __init__(self):
+        """Create the loop and start its thread."""
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name="llm-event-loop", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Thread target: run the loop until stop()."""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Run a coroutine on the loop and wait for its result.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Maximum seconds to wait (None = no limit)
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            TimeoutError: If the timeout passed (the coroutine is cancelled)
+            RuntimeError: If called from the loop thread itself
+        """
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("EventLoopThread.run() must not be called from the loop thread")
+
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Coroutine did not finish within {timeout} s") from None
+
+    def submit(self, coro: Awaitable[T]) -> "concurrent.futures.Future[T]":
+        """Schedule a coroutine on the loop without waiting for it.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            Future of the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def iterate(self, agen: AsyncIterator[T], timeout: Optional[float] = None) -> Iterator[T]:
+        """Consume an async generator on the loop as a regular generator.
+
+        Closing the returned generator early also closes agen on the loop.
+
+        Args:
+            agen: Async generator to consume
+            timeout: Maximum seconds to wait for each item
+
+        Yields:
+            The items of agen
+        """
+        try:
+            while True:
+                has_item, item = self.run(_next_item(agen), timeout)
+                if not has_item:
+                    return
+                yield item
+        finally:
+            aclose = getattr(agen, "aclose", None)
+            if aclose is not None and self.is_running():
+                self.run(aclose(), timeout)
+
+    def is_running(self) -> bool:
+        """Whether the loop thread is alive."""
+        return self._thread.is_alive()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the loop and wait for its thread."""
+        if self.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout)
+
+
+async def _next_item(agen: AsyncIterator[T]) -> Tuple[bool, Optional[T]]:
+    """Get the next item of an async iterator as (has_item, item)."""
+    try:
+        return True, await agen.__anext__()
+    except StopAsyncIteration:
+        return False, None
+
+
+# Process-wide loop (started on first use)
+_loop_thread: Optional[EventLoopThread] = None
+_loop_thread_lock = threading.Lock()
+
+
+def get_event_loop_thread() -> EventLoopThread:
+    """Get the process-wide event loop thread, starting it once.
+
+    The loop is stopped when the process exits.
+
+    Returns:
+        The running EventLoopThread
+    """
+    global _loop_thread
+    with _loop_thread_lock:
+        if _loop_thread is None or not _loop_thread.is_running():
+            _loop_thread = EventLoopThread()
+            atexit.register(_loop_thread.stop)
+        return _loop_thread
+
+
+def run_async(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """Run a coroutine on the process-wide loop and wait for its result.
+
+    Args:
+        coro: Coroutine to run
+        timeout: Maximum seconds to wait (None = no limit)
+
+    Returns:
+        The coroutine's result
+    """
+    return get_event_loop_thread().run(coro, timeout)
+
+
+def submit_async(coro: Awaitable[T]) -> "concurrent.futures.Future[T]":
+    """Schedule a coroutine on the process-wide loop without waiting for it.
+
+    Used for background work (e.g. the rolling history summary) that must
+    not block the script thread.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        Future of the coroutine's result
+    """
+    return get_event_loop_thread().submit(coro)
+
+
+def iterate_async(agen: AsyncIterator[Any], timeout: Optional[float] = None) -> Iterator[Any]:
+    """Consume an async generator on the process-wide loop.
+
+    Args:
+        agen: Async generator to consume (e.g. BaseLLMClient.stream())
+        timeout: Maximum seconds to wait for each item
+
+    Yields:
+        The items of agen
+    """
+    return get_event_loop_thread().iterate(agen, timeout)
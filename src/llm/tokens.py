@@ -0,0 +1,220 @@
+"""Token counting service for context and history budgets.
+
+len(text) // 4 misjudges German text with umlauts and markdown: the
+tokenizers work on UTF-8 bytes, where every umlaut takes two. The
+counter estimates tokens from the UTF-8 size with a provider-specific
+bytes-per-token ratio and calibrates the estimate against the input
+token counts reported in provider responses (see
+BaseLLMClient._record_usage()), so budgets converge on real tokens.
+
+Optionally, stable texts such as knowledge files are counted exactly
+through the provider's count API (llm.tokens.exact_counting). Counts are
+kept in an LRU cache keyed by a hash of the text, so the same file is
+never counted twice.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .runtime import run_async
+
+
+# UTF-8 bytes per token before calibration, per provider
+PROVIDER_BYTES_PER_TOKEN = {
+    "anthropic": 3.5,
+    "google": 4.0
+}
+
+DEFAULT_BYTES_PER_TOKEN = 3.8
+
+# Counts kept in the cache
+DEFAULT_MAX_ENTRIES = 4096
+
+# Weight (in tokens) of the uncalibrated ratio against recorded counts
+CALIBRATION_PRIOR_TOKENS = 2000
+
+# Seconds to wait for the count API before falling back to the estimate
+COUNT_API_TIMEOUT = 10.0
+
+
+@dataclass
+class TokenCounterStats:
+    """Counters of a token counter."""
+    lookups: int = 0
+    hits: int = 0  # Lookups answered from the cache
+    exact_counts: int = 0  # Texts counted through the count API
+    samples: int = 0  # Provider counts used for calibration
+    scale: float = 1.0  # Calibration factor applied to the estimate
+    entries: int = 0  # Texts in the cache
+
+
+class TokenCounter:
+    """Estimates token counts, calibrated against provider counts."""
+
+    def __init__(
+        self,
+        provider: str = "",
+        bytes_per_token: Optional[float] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        count_api: Optional[Callable[[str], Awaitable[Optional[int]]]] = None
+    ):
+        """Initialize the counter.
+
+        Args:
+            provider: Provider name from the config ("anthropic", "google")
+            bytes_per_token: Uncalibrated ratio (defaults to the provider's)
+            max_entries: Counts kept in the cache
+            count_api: Counts a text exactly (e.g. BaseLLMClient.count_tokens)
+        """
+        self.provider = provider
+        self.bytes_per_token = bytes_per_token or PROVIDER_BYTES_PER_TOKEN.get(provider, DEFAULT_BYTES_PER_TOKEN)
+        self.max_entries = max_entries
+        self.count_api = count_api
+
+        # hash -> (raw estimate, exact count or None), least recently used first
+        self._cache: "OrderedDict[str, tuple[float, Optional[int]]]" = OrderedDict()
+        self._raw_total = 0.0  # Estimates of the calibration samples
+        self._actual_total = 0  # Provider counts of the calibration samples
+        self._stats = TokenCounterStats()
+        self._lock = threading.Lock()
+
+    def raw_estimate(self, text: str) -> float:
+        """Uncalibrated token estimate of a text."""
+        return len(text.encode("utf-8")) / self.bytes_per_token
+
+    @property
+    def scale(self) -> float:
+        """Calibration factor: recorded tokens per estimated token."""
+        with self._lock:
+            return self._scale()
+
+    def _scale(self) -> float:
+        return (CALIBRATION_PRIOR_TOKENS + self._actual_total) / (CALIBRATION_PRIOR_TOKENS + self._raw_total)
+
+    def count(self, text: str, exact: bool = False, cache: bool = True) -> int:
+        """Count the tokens of a text.
+
+        Args:
+            text: Text to count
+            exact: Use the count API if available (blocks for the request;
+                do not use on the event loop thread). Falls back to the
+                estimate if the API fails.
+            cache: Keep the count (off for one-off texts like whole requests)
+
+        Returns:
+            Token count (at least 1 for a non-empty text, 0 for an empty one)
+        """
+        if not text:
+            return 0
+
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest() if cache else None
+        with self._lock:
+            self._stats.lookups += 1
+            entry = self._cache.get(key) if key else None
+            if entry is not None:
+                self._cache.move_to_end(key)
+                self._stats.hits += 1
+            if entry is not None and (entry[1] is not None or not exact or self.count_api is None):
+                return entry[1] if entry[1] is not None else self._estimate(entry[0])
+
+        raw = entry[0] if entry is not None else self.raw_estimate(text)
+        actual = self._count_exact(text) if exact and self.count_api is not None else None
+        if actual is not None:
+            self.record(raw, actual)
+
+        with self._lock:
+            if key:
+                self._remember(key, (raw, actual))
+            if actual is not None:
+                self._stats.exact_counts += 1
+                return actual
+            return self._estimate(raw)
+
+    def record(self, raw: float, actual: int) -> None:
+        """Add a provider count to the calibration.
+
+        Args:
+            raw: raw_estimate() of the counted text
+            actual: Tokens the provider counted for it
+        """
+        if raw <= 0 or not actual or actual <= 0:
+            return
+        with self._lock:
+            self._raw_total += raw
+            self._actual_total += actual
+            self._stats.samples += 1
+
+    def record_text(self, text: str, actual: int) -> None:
+        """Add the provider count of a text (e.g. a request's input tokens) to the calibration."""
+        self.record(self.raw_estimate(text), actual)
+
+    def stats(self) -> TokenCounterStats:
+        """Get a snapshot of the counters."""
+        with self._lock:
+            stats = TokenCounterStats(**vars(self._stats))
+            stats.scale = self._scale()
+            stats.entries = len(self._cache)
+            return stats
+
+    def _estimate(self, raw: float) -> int:
+        """Calibrated estimate from a raw estimate (lock held)."""
+        return max(1, round(raw * self._scale()))
+
+    def _count_exact(self, text: str) -> Optional[int]:
+        """Count a text with the count API (None if it fails)."""
+        try:
+            actual = run_async(self.count_api(text), timeout=COUNT_API_TIMEOUT)
+        except Exception:
+            return None
+        return actual if isinstance(actual, int) and actual > 0 else None
+
+    def _remember(self, key: str, entry: tuple) -> None:
+        """Put a count into the cache, evicting the least recently used."""
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+
+def create_token_counter(config: Dict[str, Any]) -> TokenCounter:
+    """Create a token counter from the llm config section.
+
+    Args:
+        config: Full application config dict
+
+    Returns:
+        TokenCounter for the configured provider (without count API;
+        see get_llm_client())
+    """
+    llm_config = config.get("llm", {}) or {}
+    tokens_config = llm_config.get("tokens", {}) or {}
+    return TokenCounter(
+        provider=llm_config.get("provider", "").lower(),
+        bytes_per_token=tokens_config.get("bytes_per_token"),
+        max_entries=tokens_config.get("cache_entries", DEFAULT_MAX_ENTRIES)
+    )
+
+
+# Process-wide counter (created on first use)
+_counter: Optional[TokenCounter] = None
+_counter_lock = threading.Lock()
+
+
+def get_token_counter(config: Optional[Dict[str, Any]] = None) -> TokenCounter:
+    """Get the process-wide token counter, creating it once.
+
+    Args:
+        config: Application config used when the counter is created
+            (later calls return the existing counter)
+
+    Returns:
+        The shared TokenCounter
+    """
+    global _counter
+    with _counter_lock:
+        if _counter is None:
+            _counter = create_token_counter(config or {})
+        return _counter
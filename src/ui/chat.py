@@ -3,29 +3,128 @@
 from typing import Dict, List, Optional
 import streamlit as st
 
-from src.discovery.session import load_session, save_session, session_exists
+from src.context.history import WINDOW_STEP, get_history_budget, window_history
+from src.context.summary import create_history_summarizer
+from src.discovery.session import (
+    count_messages,
+    derive_session_name,
+    get_session_dir,
+    load_messages,
+    load_session,
+    recover_session,
+    save_session,
+    session_exists
+)
+from src.discovery.workspace import get_current_workspace
+from src.discovery.writer import flush_background_writer, get_background_writer
+
+# Messages loaded on resume and per "load older" click
+CHAT_PAGE_SIZE = 50
 
 
 def init_chat_state():
     """Initialize chat-related session state, loading from disk if available."""
     if "messages" not in st.session_state:
+        # Queued writes of this session must land before it is read back
+        flush_background_writer()
+
+        # Repair what a crash may have left behind before reading
+        st.session_state.recovery_notice = None
+        if session_exists():
+            report = recover_session()
+            if report.has_issues:
+                st.session_state.recovery_notice = format_recovery_notice(report)
+
         # Try to load existing session
         if session_exists():
-            messages, session_meta = load_session()
+            # Only the most recent page; older messages load on demand
+            messages, session_meta = load_session(limit=CHAT_PAGE_SIZE)
             st.session_state.messages = messages
+            st.session_state.messages_offset = count_messages() - len(messages)
             st.session_state.session_meta = session_meta
         else:
             st.session_state.messages = []
+            st.session_state.messages_offset = 0
             st.session_state.session_meta = {}
 
+        # Rolling summary of the turns that fall out of the history window
+        st.session_state.history_summarizer = create_history_summarizer(
+            st.session_state.get("config", {}),
+            workspace=get_current_workspace()
+        )
+
+
+def format_recovery_notice(report) -> str:
+    """Describe a session recovery for the user.
+
+    Args:
+        report: RecoveryReport from recover_session()
+
+    Returns:
+        German notice text
+    """
+    parts = []
+    if report.torn_tail_bytes:
+        parts.append("eine unvollständig geschriebene letzte Nachricht wurde entfernt")
+    if report.corrupt_records:
+        parts.append(f"{report.corrupt_records} beschädigte Nachricht(en) wurden übersprungen")
+    if report.meta_rebuilt:
+        parts.append("die Session-Daten wurden aus dem Chat-Verlauf wiederhergestellt")
+    if report.legacy_unreadable:
+        parts.append("die alte Session-Datei (session-meta.yaml) konnte nicht gelesen werden")
+    return "Session wiederhergestellt: " + "; ".join(parts) + "."
+
+
+def load_older_messages():
+    """Prepend the previous page of the chat history."""
+    offset = st.session_state.get("messages_offset", 0)
+    if offset <= 0:
+        return
+
+    start = max(offset - CHAT_PAGE_SIZE, 0)
+    older = load_messages(start, offset - start)
+    st.session_state.messages = older + st.session_state.messages
+    st.session_state.messages_offset = start
+
+
+def get_session_name() -> Optional[str]:
+    """Get the name to save the current session under.
+
+    The mandat title once there is one, else the first user message. A
+    resumed chat whose start is not loaded keeps its saved name.
+
+    Returns:
+        Session name, or None to keep the saved one
+    """
+    mandat_titles = (st.session_state.get("artifacts") or {}).get("mandat") or []
+    mandat_title = mandat_titles[0] if mandat_titles else None
+    messages = st.session_state.messages if st.session_state.get("messages_offset", 0) == 0 else []
+    return derive_session_name(messages, mandat_title)
+
 
 def persist_chat():
-    """Save current chat state to disk."""
-    save_session(
-        messages=st.session_state.messages,
-        current_agent=st.session_state.get("current_agent", "nora"),
-        mandat_complete=st.session_state.get("mandat_complete", False)
-    )
+    """Save current chat state to disk.
+
+    Only messages added since the last save are appended to the chat log.
+    The session is named after get_session_name().
+    If the background writer is running, the save is queued and bursts of
+    calls are coalesced into one write.
+    """
+    workspace = get_current_workspace()
+    kwargs = {
+        "messages": list(st.session_state.messages),
+        "session_name": get_session_name(),
+        "current_agent": st.session_state.get("current_agent", "nora"),
+        "mandat_complete": st.session_state.get("mandat_complete", False),
+        "workspace": workspace,
+        "offset": st.session_state.get("messages_offset", 0)
+    }
+
+    writer = get_background_writer()
+    if writer is None:
+        save_session(**kwargs)
+    else:
+        writer.submit(("chat", get_session_dir(workspace)), save_session, **kwargs)
 
 
 def add_message(
@@ -66,17 +165,104 @@ def add_message(
 
 
 def get_chat_history() -> List[Dict[str, str]]:
-    """Get chat history in LLM-compatible format.
+    """Get the whole chat history in LLM-compatible format.
+
+    Pages not loaded into the session (see load_older_messages()) are
+    read from the chat log, so the history starts with the first message
+    of the conversation.
 
     Returns:
         List of message dicts with 'role' and 'content' keys
     """
+    total = st.session_state.get("messages_offset", 0) + len(st.session_state.messages)
     return [
         {"role": msg["role"], "content": msg["content"]}
-        for msg in st.session_state.messages
+        for msg in get_history_slice(0, total)
     ]
 
 
+def get_extraction_history(agent_id: str) -> List[Dict[str, str]]:
+    """Get the whole conversation for a one-off extraction (e.g. the mandat).
+
+    If the conversation outgrows the agent's history budget and the
+    rolling summary covers every turn left out, those turns are replaced
+    by the summary; otherwise the whole history is returned.
+
+    Args:
+        agent_id: Agent doing the extraction (selects the budget)
+
+    Returns:
+        List of message dicts with 'role' and 'content' keys
+    """
+    history = get_chat_history()
+    summarizer = st.session_state.get("history_summarizer")
+    summary = summarizer.summary if summarizer is not None else None
+    if summary is None:
+        return history
+
+    window = window_history(history, get_history_budget(agent_id), summary=summary)
+    if window.recent_start > summary.covered:
+        return history  # The summary lags behind: turns would be lost
+    return window.messages
+
+
+def get_windowed_history(agent_id: str) -> List[Dict[str, str]]:
+    """Get the chat history to send to an agent, within its token budget.
+
+    The window is stored in st.session_state.history_window for reporting.
+
+    Args:
+        agent_id: Agent the history is sent to (selects the budget)
+
+    Returns:
+        List of message dicts with 'role' and 'content' keys
+    """
+    offset = st.session_state.get("messages_offset", 0)
+    summarizer = st.session_state.get("history_summarizer")
+    window = window_history(
+        st.session_state.messages,
+        get_history_budget(agent_id),
+        # Earlier pages are not loaded: messages[0] is not the greeting
+        pin_first=offset == 0,
+        summary=summarizer.summary if summarizer is not None else None,
+        offset=offset,
+        # Drop turns in the chunks the summary condenses them in
+        step=summarizer.every_messages if summarizer is not None else WINDOW_STEP
+    )
+    st.session_state.history_window = window
+
+    # Summarize what fell out, for the next turns (does not wait)
+    if summarizer is not None:
+        summarizer.refresh(window.recent_start, get_history_slice)
+    return window.messages
+
+
+def get_history_slice(offset: int, limit: int) -> List[Dict]:
+    """Get messages of the full chat history, from memory where loaded.
+
+    Args:
+        offset: Index of the first message
+        limit: Maximum number of messages
+
+    Returns:
+        List of messages in chronological order
+    """
+    loaded_from = st.session_state.get("messages_offset", 0)
+    if offset >= loaded_from:
+        start = offset - loaded_from
+        return list(st.session_state.messages[start:start + limit])
+    # Older pages: read from the chat log, the rest from memory
+    older = load_messages(offset, min(limit, loaded_from - offset))
+    return older + list(st.session_state.messages[:limit - len(older)])
+
+
+def reset_history_summary():
+    """Forget the rolling history summary (e.g. when the session is cleared)."""
+    summarizer = st.session_state.get("history_summarizer")
+    if summarizer is not None:
+        summarizer.reset()
+
+
 def render_message(message: Dict):
     """Render a single chat message.
 
@@ -103,6 +289,16 @@ def render_chat():
     """Render the chat interface with message history."""
     init_chat_state()
 
-    # Render all messages
+    if st.session_state.get("recovery_notice"):
+        st.warning(st.session_state.recovery_notice)
+
+    # Older messages are only loaded on request
+    hidden = st.session_state.get("messages_offset", 0)
+    if hidden > 0:
+        if st.button(f"Ältere Nachrichten laden ({hidden} weitere)"):
+            load_older_messages()
+            st.rerun()
+
+    # Render all loaded messages
     for message in st.session_state.messages:
         render_message(message)
@@ -3,7 +3,7 @@
 from typing import Dict, List, Optional
 import streamlit as st
 
-from src.discovery.artifacts import get_artifacts_for_wall
+from src.discovery.artifacts import get_wall_summary
 from src.agents.orchestrator import get_available_agents
 
 
@@ -97,12 +97,20 @@ def render_agent_overview():
 
 
 def init_wall_state():
-    """Initialize Discovery Wall state by loading artifacts from disk."""
+    """Initialize Discovery Wall state from the wall summary."""
     if "artifacts" not in st.session_state:
-        # Load artifacts from filesystem
-        st.session_state.artifacts = get_artifacts_for_wall()
+        refresh_wall_state()
 
 
 def refresh_wall_state():
-    """Refresh wall state from disk (call after saving new artifacts)."""
-    st.session_state.artifacts = get_artifacts_for_wall()
+    """Refresh wall state (call after saving new artifacts).
+
+    Only copies the titles when the wall version changed since the last
+    refresh.
+    """
+    summary = get_wall_summary()
+    if "artifacts" in st.session_state and st.session_state.get("wall_version") == summary.version:
+        return
+
+    st.session_state.artifacts = summary.titles()
+    st.session_state.wall_version = summary.version
@@ -1,4 +1,5 @@
 # Utility modules
 from .config import load_config
+from .files import atomic_write_text
 
-__all__ = ["load_config"]
+__all__ = ["load_config", "atomic_write_text"]
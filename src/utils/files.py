@@ -0,0 +1,71 @@
+"""File writing utilities."""
+
+import os
+import secrets
+import stat
+from pathlib import Path
+
+
+def _create_temp_file(path: Path) -> tuple:
+    """Create a new, uniquely named temporary file next to path.
+
+    Created with mode 0666 like open() does, so the kernel applies the
+    process umask (tempfile.mkstemp would create it 0600).
+
+    Returns:
+        (file descriptor, temporary file name)
+    """
+    while True:
+        tmp_name = str(path.parent / f".{path.name}.{secrets.token_hex(6)}.tmp")
+        try:
+            return os.open(tmp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), tmp_name
+        except FileExistsError:
+            continue
+
+
+def atomic_write_text(
+    path: Path,
+    content: str,
+    encoding: str = "utf-8",
+    create_parents: bool = False
+) -> None:
+    """Write a text file atomically.
+
+    The content is written to a temporary file in the same directory and
+    renamed over the target, so readers see either the old or the new
+    file but never a truncated one. The file keeps the mode of the file
+    it replaces; new files get the usual umask-based mode. The umask is
+    never changed, not even briefly, since other threads may create
+    files at the same time.
+
+    Args:
+        path: Target file path
+        content: Text to write
+        encoding: Text encoding
+        create_parents: Create the parent directory if it is missing
+            (only checked when the first attempt fails)
+    """
+    try:
+        fd, tmp_name = _create_temp_file(path)
+    except FileNotFoundError:
+        if not create_parents:
+            raise
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = _create_temp_file(path)
+
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp_name, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass  # New file: keeps the umask-based mode it was created with
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
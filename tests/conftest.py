@@ -0,0 +1,49 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from src.discovery import artifacts, session
+from src.discovery.models import Artifact, ArtifactType
+
+
+@pytest.fixture
+def wall_dir(tmp_path, monkeypatch):
+    """Point the discovery wall at a temporary directory."""
+    wall = tmp_path / "discovery-wall"
+    monkeypatch.setattr(artifacts, "DISCOVERY_DIR", wall)
+    return wall
+
+
+@pytest.fixture
+def session_dir(tmp_path, monkeypatch):
+    """Point the session files at a temporary directory."""
+    directory = tmp_path / "session"
+    monkeypatch.setattr(session, "SESSION_DIR", directory)
+    return directory
+
+
+def build_artifact(artifact_id: str, artifact_type: ArtifactType = ArtifactType.INSIGHT, **fields) -> Artifact:
+    """Create an artifact for tests.
+
+    Args:
+        artifact_id: Artifact ID
+        artifact_type: Artifact type (an insight by default)
+        **fields: Other Artifact fields; title, content and created_by
+            default to "Titel <id>", "Inhalt <id>" and "finn"
+
+    Returns:
+        The artifact (not saved)
+    """
+    defaults = {
+        "title": f"Titel {artifact_id}",
+        "content": f"Inhalt {artifact_id}",
+        "created_by": "finn"
+    }
+    defaults.update(fields)
+    return Artifact(id=artifact_id, type=artifact_type, **defaults)
+
+
+@pytest.fixture
+def make_artifact():
+    """Factory for test artifacts (see build_artifact())."""
+    return build_artifact
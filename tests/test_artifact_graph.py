@@ -0,0 +1,113 @@
+"""Tests for the related_to relationship graph."""
+
+import pytest
+
+from src.context.loader import AgentContextLoader
+from src.discovery.artifacts import (
+    clear_all_artifacts,
+    get_artifact_graph,
+    load_related_artifacts,
+    rebuild_artifact_graph,
+    save_artifact
+)
+from src.discovery.graph import ArtifactGraph, INCOMING, OUTGOING
+from src.discovery.markdown_store import MarkdownArtifactStore
+from src.discovery.models import ArtifactType
+
+
+@pytest.fixture
+def chain(make_artifact) -> list:
+    """Insight <- HMW <- idea <- test card, plus a second insight on the idea."""
+    return [
+        make_artifact("insight-1", ArtifactType.INSIGHT),
+        make_artifact("insight-2", ArtifactType.INSIGHT),
+        make_artifact("hmw-1", ArtifactType.HMW_CHALLENGE, related_to=["insight-1"]),
+        make_artifact("idea-1", ArtifactType.IDEA, related_to=["hmw-1", "insight-2"]),
+        make_artifact("test-1", ArtifactType.TEST_CARD, related_to=["idea-1"]),
+    ]
+
+
+class TestArtifactGraph:
+    """Tests for the in-memory adjacency index."""
+
+    @pytest.fixture(autouse=True)
+    def build_graph(self, chain):
+        """Build the example chain."""
+        self.graph = ArtifactGraph()
+        for artifact in chain:
+            self.graph.add(artifact)
+
+    def test_neighbors_by_direction(self):
+        """Test forward, reverse and undirected neighbours."""
+        assert self.graph.neighbors("idea-1", OUTGOING) == ["hmw-1", "insight-2"]
+        assert self.graph.neighbors("idea-1", INCOMING) == ["test-1"]
+        assert self.graph.neighbors("idea-1") == ["hmw-1", "insight-2", "test-1"]
+
+    def test_closure_respects_hops(self):
+        """Test multi-hop traversal with distances."""
+        assert self.graph.closure("test-1", max_hops=1) == {"idea-1": 1}
+        assert self.graph.closure("test-1", max_hops=3) == {
+            "idea-1": 1, "hmw-1": 2, "insight-2": 2, "insight-1": 3
+        }
+
+    def test_typed_queries(self):
+        """Test the supports/validates helpers."""
+        assert self.graph.supporting_insights("idea-1") == ["insight-2"]
+        assert self.graph.validating_test_cards("hmw-1") == ["test-1"]
+
+    def test_resave_replaces_links(self, make_artifact):
+        """Test that re-adding an artifact drops its old edges."""
+        self.graph.add(make_artifact("idea-1", ArtifactType.IDEA, related_to=["insight-1"]))
+        assert self.graph.neighbors("hmw-1", INCOMING) == []
+        assert self.graph.neighbors("insight-1", INCOMING) == ["hmw-1", "idea-1"]
+
+    def test_dangling_links_are_skipped(self, make_artifact):
+        """Test that links to unknown artifacts are not returned."""
+        self.graph.add(make_artifact("idea-2", ArtifactType.IDEA, related_to=["missing"]))
+        assert self.graph.neighbors("idea-2") == []
+
+    def test_roundtrip(self):
+        """Test that a serialized graph answers the same queries."""
+        restored = ArtifactGraph.from_dict(self.graph.to_dict())
+        assert restored.closure("test-1", max_hops=3) == self.graph.closure("test-1", max_hops=3)
+
+
+class TestRelatedArtifacts:
+    """Tests for the persisted graph and related loading."""
+
+    def test_graph_follows_saves_and_clear(self, wall_dir, chain):
+        """Test that saving and clearing keep the graph current."""
+        for artifact in chain:
+            save_artifact(artifact)
+
+        related = load_related_artifacts("test-1", max_hops=2, types=[ArtifactType.INSIGHT])
+        assert [a.id for a in related] == ["insight-2"]
+        assert related[0].content == "Inhalt insight-2"
+
+        clear_all_artifacts()
+        assert "idea-1" not in get_artifact_graph()
+
+    def test_rebuild_after_hand_edit(self, wall_dir, make_artifact):
+        """Test that a rebuild picks up links written outside save_artifact."""
+        save_artifact(make_artifact("insight-1", ArtifactType.INSIGHT))
+        MarkdownArtifactStore(wall_dir).save(make_artifact("idea-1", ArtifactType.IDEA, related_to=["insight-1"]))
+
+        rebuild_artifact_graph()
+
+        assert get_artifact_graph().supporting_insights("idea-1") == ["insight-1"]
+
+    def test_context_loader_uses_focus(self, wall_dir, chain, make_artifact):
+        """Test that a focus artifact limits the context to connected artifacts."""
+        for artifact in chain:
+            save_artifact(artifact)
+        save_artifact(make_artifact("idea-2", ArtifactType.IDEA))
+
+        focused = AgentContextLoader("ida", focus_id="hmw-1").load()
+        unfocused = AgentContextLoader("ida").load()
+
+        assert [a.id for a in focused.artifacts] == ["hmw-1", "idea-1"]
+        assert {a.id for a in unfocused.artifacts} == {"hmw-1", "idea-1", "idea-2"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
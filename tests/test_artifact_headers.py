@@ -0,0 +1,79 @@
+"""Tests for header-only artifact loading."""
+
+import pytest
+from unittest.mock import patch
+
+from src.discovery import markdown_store
+from src.discovery.artifacts import save_artifact, load_artifacts_by_type
+from src.discovery.markdown_store import MarkdownArtifactStore, read_artifact_header
+from src.discovery.models import ArtifactType, ArtifactStatus
+
+
+class TestReadArtifactHeader:
+    """Tests for reading frontmatter and title only."""
+
+    def test_header_fields(self, wall_dir, make_artifact):
+        """Test that the header carries metadata and title."""
+        path = save_artifact(make_artifact(
+            "insight-1", ArtifactType.INSIGHT, status=ArtifactStatus.IN_PROGRESS, related_to=["mandat"]
+        ))
+
+        header = read_artifact_header(path)
+
+        assert header.id == "insight-1"
+        assert header.type == ArtifactType.INSIGHT
+        assert header.status == ArtifactStatus.IN_PROGRESS
+        assert header.title == "Titel insight-1"
+        assert header.related_to == ["mandat"]
+
+    def test_body_is_loaded_lazily(self, wall_dir, make_artifact):
+        """Test that the body is only read when .content is accessed."""
+        long_body = "Transkript. " * 50_000
+        path = save_artifact(make_artifact("insight-1", ArtifactType.INSIGHT, content=long_body))
+
+        with patch.object(markdown_store, "_load_body", wraps=markdown_store._load_body) as load_body:
+            header = read_artifact_header(path)
+            load_body.assert_not_called()
+
+            assert header.content == long_body.strip()
+            assert header.content == long_body.strip()
+
+        load_body.assert_called_once()
+
+    def test_missing_frontmatter(self, tmp_path):
+        """Test that files without frontmatter are skipped."""
+        path = tmp_path / "notiz.md"
+        path.write_text("# Nur eine Notiz\n\nText", encoding="utf-8")
+
+        assert read_artifact_header(path) is None
+
+    def test_untitled(self, tmp_path):
+        """Test the fallback title when the body has no heading."""
+        path = tmp_path / "insight.md"
+        path.write_text("---\nid: insight-1\ntype: insight\n---\n\nKein Titel", encoding="utf-8")
+
+        assert read_artifact_header(path).title == "Untitled"
+
+
+class TestHeaderQueries:
+    """Tests for queries on top of headers."""
+
+    def test_by_type_reads_only_matching_bodies(self, wall_dir, make_artifact):
+        """Test that filtering by type does not load other bodies."""
+        save_artifact(make_artifact("insight-1", ArtifactType.INSIGHT))
+        save_artifact(make_artifact("idea-1", ArtifactType.IDEA))
+        save_artifact(make_artifact("idea-2", ArtifactType.IDEA))
+
+        # Start from a cold index so nothing is cached from the saves
+        MarkdownArtifactStore(wall_dir).index.clear()
+
+        with patch.object(markdown_store, "load_artifact_from_file",
+                          wraps=markdown_store.load_artifact_from_file) as load_file:
+            ideas = load_artifacts_by_type(ArtifactType.IDEA)
+
+        assert sorted(a.id for a in ideas) == ["idea-1", "idea-2"]
+        assert sorted(call.args[0].stem for call in load_file.call_args_list) == ["idea-1", "idea-2"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,169 @@
+"""Tests for the in-process artifact index."""
+
+import os
+from datetime import datetime
+
+import pytest
+from unittest.mock import patch
+
+from src.discovery import artifacts, markdown_store
+from src.discovery.artifacts import save_artifact, load_artifacts, clear_all_artifacts
+from src.discovery.factory import create_artifact_store
+from src.discovery.index import ArtifactIndex
+from src.discovery.markdown_store import (
+    MarkdownArtifactStore,
+    parse_header_block,
+    read_header_block,
+    render_artifact
+)
+from src.discovery.models import Artifact, ArtifactType
+
+
+class TestArtifactIndex:
+    """Tests for mtime-based artifact caching."""
+
+    def test_unchanged_files_are_not_reparsed(self, wall_dir, make_artifact):
+        """Test that a second load serves artifacts from the index."""
+        save_artifact(make_artifact("insight-1"))
+        save_artifact(make_artifact("insight-2"))
+
+        with patch.object(markdown_store, "parse_artifact", wraps=markdown_store.parse_artifact) as spy:
+            assert len(load_artifacts()) == 2
+            assert len(load_artifacts()) == 2
+
+        spy.assert_not_called()
+
+    def test_changed_file_is_reparsed(self, wall_dir, make_artifact):
+        """Test that hand-edited files are picked up on the next load."""
+        path = save_artifact(make_artifact("insight-1", title="Alt"))
+        load_artifacts()
+
+        text = path.read_text(encoding="utf-8").replace("# Alt", "# Neuer Titel")
+        path.write_text(text, encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        titles = [a.title for a in load_artifacts()]
+        assert titles == ["Neuer Titel"]
+
+    def test_deleted_file_is_dropped(self, wall_dir, make_artifact):
+        """Test that removed files disappear from the index."""
+        path = save_artifact(make_artifact("insight-1"))
+        save_artifact(make_artifact("insight-2"))
+        load_artifacts()
+
+        path.unlink()
+
+        assert [a.id for a in load_artifacts()] == ["insight-2"]
+
+    def test_saved_artifact_matches_parsed_file(self, wall_dir, make_artifact):
+        """Test that the indexed copy equals a fresh parse of the file."""
+        path = save_artifact(make_artifact("insight-1", title="Meetings"))
+
+        indexed = load_artifacts()[0]
+        parsed = artifacts.load_artifact_from_file(path)
+
+        assert indexed == parsed
+
+    def test_clear_all_artifacts_empties_index(self, wall_dir, make_artifact):
+        """Test that clearing the wall also clears the index."""
+        save_artifact(make_artifact("insight-1"))
+        load_artifacts()
+
+        clear_all_artifacts()
+
+        assert load_artifacts() == []
+
+
+class TestParallelScan:
+    """Tests for thread-pool scanning."""
+
+    def test_parallel_matches_serial(self, tmp_path, make_artifact):
+        """Test that parallel scans return the same headers in the same order."""
+        store = MarkdownArtifactStore(tmp_path / "wall")
+        for i in range(20):
+            store.save(make_artifact(f"insight-{i:02d}", title=f"Insight {i}"))
+        (tmp_path / "wall" / "notiz.md").write_text("# Keine Frontmatter", encoding="utf-8")
+
+        serial = ArtifactIndex(store.root, read_header_block, parse_header_block).headers(workers=1)
+        parallel = ArtifactIndex(store.root, read_header_block, parse_header_block).headers(workers=8)
+
+        assert [h.id for h in parallel] == [h.id for h in serial]
+        assert len(parallel) == 20
+
+    def test_store_uses_configured_workers(self, tmp_path):
+        """Test that scan_workers from config reaches the markdown store."""
+        store = create_artifact_store({
+            "discovery": {"scan_workers": 4},
+            "paths": {"output": str(tmp_path)}
+        })
+        assert store.scan_workers == 4
+
+
+class TestTypeScopedScan:
+    """Tests for scanning only the directories of the requested types."""
+
+    def test_scoped_query_skips_unrelated_directories(self, wall_dir, make_artifact):
+        """Test that a mandat query only scans the wall root."""
+        store = MarkdownArtifactStore(wall_dir)
+        store.save(Artifact(id="mandat", type=ArtifactType.MANDAT, title="Mandat",
+                            content="Ziel", created_by="arthur"))
+        for i in range(5):
+            store.save(make_artifact(f"insight-{i}"))
+        store.load_headers()  # Initial full scan
+
+        index = store.index
+        with patch.object(index, "_scan", wraps=index._scan) as scan:
+            mandats = store.by_type(ArtifactType.MANDAT)
+
+        assert [a.id for a in mandats] == ["mandat"]
+        assert [call.args[0].name for call in scan.call_args_list] == ["mandat.md"]
+
+    def test_misplaced_file_is_found(self, wall_dir):
+        """Test that an idea stored in the research folder is still found."""
+        store = MarkdownArtifactStore(wall_dir)
+        path = store.save(Artifact(id="idea-1", type=ArtifactType.IDEA, title="Idee",
+                                   content="Text", created_by="ida"))
+        path.rename(wall_dir / "research" / "idea-1.md")
+        store.index.clear()
+
+        assert [a.id for a in store.by_type(ArtifactType.IDEA)] == ["idea-1"]
+        assert [a.id for a in store.by_type(ArtifactType.IDEA)] == ["idea-1"]
+
+    def test_misplaced_file_added_after_scoped_query(self, wall_dir, make_artifact):
+        """Test that a file dropped into another type's folder later is found."""
+        store = MarkdownArtifactStore(wall_dir)
+        store.save(make_artifact("insight-1"))
+        assert [a.id for a in store.by_type(ArtifactType.INSIGHT)] == ["insight-1"]
+
+        misplaced = wall_dir / "ideen" / "insight-2.md"
+        misplaced.write_text(render_artifact(make_artifact("insight-2"), datetime.now()), encoding="utf-8")
+
+        assert sorted(a.id for a in store.by_type(ArtifactType.INSIGHT)) == ["insight-1", "insight-2"]
+
+    def test_own_saves_keep_scoped_scan(self, wall_dir, make_artifact):
+        """Test that saving through the store does not force full scans."""
+        store = MarkdownArtifactStore(wall_dir)
+        store.save(make_artifact("insight-1"))
+        store.by_type(ArtifactType.INSIGHT)
+        store.save(make_artifact("insight-2"))
+
+        with patch.object(store.index, "_refresh_all", wraps=store.index._refresh_all) as refresh_all:
+            insights = store.by_type(ArtifactType.INSIGHT)
+
+        refresh_all.assert_not_called()
+        assert [a.id for a in insights] == ["insight-1", "insight-2"]
+
+    def test_research_question_scan_is_not_recursive(self, wall_dir, make_artifact):
+        """Test that research questions do not pull in research/insights."""
+        store = MarkdownArtifactStore(wall_dir)
+        store.save(make_artifact("insight-1"))
+        store.save(Artifact(id="rq-1", type=ArtifactType.RESEARCH_QUESTION, title="Frage",
+                            content="Warum?", created_by="finn"))
+        store.load_headers()
+
+        assert [a.id for a in store.by_type(ArtifactType.RESEARCH_QUESTION)] == ["rq-1"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,123 @@
+"""Tests for the pluggable artifact store backends."""
+
+import pytest
+
+from src.discovery.factory import create_artifact_store
+from src.discovery.markdown_store import MarkdownArtifactStore
+from src.discovery.sqlite_store import SqliteArtifactStore
+from src.discovery.models import ArtifactType, ArtifactStatus
+
+
+@pytest.fixture(params=["markdown", "sqlite"])
+def store(request, tmp_path):
+    """Provide each store backend on an empty wall."""
+    if request.param == "markdown":
+        yield MarkdownArtifactStore(tmp_path / "wall")
+    else:
+        sqlite_store = SqliteArtifactStore(tmp_path / "wall")
+        yield sqlite_store
+        sqlite_store.close()
+
+
+@pytest.fixture
+def filled_store(store, make_artifact):
+    """Store with a small discovery wall."""
+    store.save(make_artifact("mandat", ArtifactType.MANDAT, created_by="arthur",
+                             status=ArtifactStatus.COMPLETE))
+    store.save(make_artifact("insight-1", ArtifactType.INSIGHT, related_to=["mandat"]))
+    store.save(make_artifact("insight-2", ArtifactType.INSIGHT))
+    store.save(make_artifact("idea-1", ArtifactType.IDEA, created_by="ida",
+                             related_to=["insight-1"]))
+    return store
+
+
+class TestArtifactStoreContract:
+    """Behavior shared by all store backends."""
+
+    def test_save_and_load_roundtrip(self, store, make_artifact):
+        """Test that a saved artifact loads back unchanged."""
+        artifact = make_artifact("insight-1", ArtifactType.INSIGHT, related_to=["mandat"])
+        store.save(artifact)
+
+        loaded = store.get("insight-1")
+
+        assert loaded.title == artifact.title
+        assert loaded.content == artifact.content
+        assert loaded.related_to == ["mandat"]
+        assert loaded.created_at == artifact.created_at
+
+    def test_by_type(self, filled_store):
+        """Test filtering by artifact type."""
+        ids = sorted(a.id for a in filled_store.by_type(ArtifactType.INSIGHT))
+        assert ids == ["insight-1", "insight-2"]
+
+    def test_query_filters(self, filled_store):
+        """Test status, created_by and related_to filters."""
+        assert [a.id for a in filled_store.query(status=ArtifactStatus.COMPLETE)] == ["mandat"]
+        assert [a.id for a in filled_store.query(created_by="ida")] == ["idea-1"]
+        assert [a.id for a in filled_store.query(related_to="insight-1")] == ["idea-1"]
+
+    def test_get_many_keeps_order(self, filled_store):
+        """Test loading several artifacts by ID."""
+        loaded = filled_store.get_many(["idea-1", "missing", "insight-1"])
+        assert [a.id for a in loaded] == ["idea-1", "insight-1"]
+
+    def test_count_by_category(self, filled_store):
+        """Test wall category counts."""
+        assert filled_store.count_by_category() == {
+            "mandat": 1, "problem": 2, "solution": 1, "test": 0
+        }
+
+    def test_titles_by_category(self, filled_store):
+        """Test wall titles per category."""
+        wall = filled_store.titles_by_category()
+        assert wall["mandat"] == ["Titel mandat"]
+        assert sorted(wall["problem"]) == ["Titel insight-1", "Titel insight-2"]
+
+    def test_single_mandat(self, store, make_artifact):
+        """Test that saving a new mandat replaces the old one."""
+        store.save(make_artifact("mandat-alt", ArtifactType.MANDAT))
+        store.save(make_artifact("mandat", ArtifactType.MANDAT))
+
+        assert [a.id for a in store.by_type(ArtifactType.MANDAT)] == ["mandat"]
+
+    def test_save_many(self, store, make_artifact):
+        """Test saving a batch of artifacts."""
+        paths = store.save_many([
+            make_artifact("insight-1", ArtifactType.INSIGHT),
+            make_artifact("insight-2", ArtifactType.INSIGHT)
+        ])
+
+        assert len(paths) == 2
+        assert sorted(a.id for a in store.load_all()) == ["insight-1", "insight-2"]
+
+    def test_clear(self, filled_store):
+        """Test that clear removes all artifacts."""
+        filled_store.clear()
+        assert filled_store.load_all() == []
+
+
+class TestCreateArtifactStore:
+    """Tests for the store factory."""
+
+    def test_default_is_markdown(self, tmp_path):
+        """Test that markdown is the default backend."""
+        store = create_artifact_store({"paths": {"output": str(tmp_path)}})
+        assert isinstance(store, MarkdownArtifactStore)
+
+    def test_sqlite_backend(self, tmp_path):
+        """Test selecting the SQLite backend."""
+        store = create_artifact_store({
+            "discovery": {"store": "sqlite"},
+            "paths": {"output": str(tmp_path)}
+        })
+        assert isinstance(store, SqliteArtifactStore)
+
+    def test_unknown_backend(self):
+        """Test that unknown backends are rejected."""
+        with pytest.raises(ValueError):
+            create_artifact_store({"discovery": {"store": "mongo"}})
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,100 @@
+"""Tests for the chat history handed to the LLM."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.context.history import SUMMARY_HEADING, HistorySummary
+from src.discovery.session import save_session
+from src.ui import chat
+
+
+class SessionState(dict):
+    """Dict with attribute access, like st.session_state."""
+
+    __getattr__ = dict.__getitem__
+    __setattr__ = dict.__setitem__
+
+
+def message(index):
+    role = "assistant" if index % 2 == 0 else "user"
+    return {"role": role, "content": f"Nachricht {index}"}
+
+
+@pytest.fixture
+def resumed_session(session_dir, monkeypatch):
+    """A 120-message session of which only the last page is loaded."""
+    messages = [message(i) for i in range(120)]
+    save_session(messages)
+    state = SessionState(messages=messages[-chat.CHAT_PAGE_SIZE:], messages_offset=120 - chat.CHAT_PAGE_SIZE)
+    monkeypatch.setattr(chat, "st", SimpleNamespace(session_state=state))
+    return messages
+
+
+class TestGetChatHistory:
+    """Tests for get_chat_history() after a resume."""
+
+    def test_includes_pages_not_loaded(self, resumed_session):
+        """The history starts with the first message of the conversation."""
+        history = chat.get_chat_history()
+
+        assert len(history) == 120
+        assert history[0] == {"role": "assistant", "content": "Nachricht 0"}
+        assert history[-1] == {"role": "user", "content": "Nachricht 119"}
+
+    def test_history_slice_spans_log_and_memory(self, resumed_session):
+        """A slice across the loaded page boundary joins log and memory."""
+        start = 120 - chat.CHAT_PAGE_SIZE - 2
+        contents = [msg["content"] for msg in chat.get_history_slice(start, 4)]
+        assert contents == [f"Nachricht {i}" for i in range(start, start + 4)]
+
+
+class TestGetSessionName:
+    """Tests for the name persist_chat() saves the session under."""
+
+    def test_resumed_chat_keeps_saved_name(self, resumed_session):
+        """Without the first page loaded, no name is derived."""
+        assert chat.get_session_name() is None
+
+    def test_first_user_message(self, resumed_session):
+        """A chat loaded from its start is named after the first user message."""
+        chat.st.session_state.update(messages=resumed_session, messages_offset=0)
+        assert chat.get_session_name() == "Nachricht 1"
+
+    def test_mandat_title(self, resumed_session):
+        """Once there is a mandat, the session is named after it."""
+        chat.st.session_state.artifacts = {"mandat": ["Mandat: Kundenportal"]}
+        assert chat.get_session_name() == "Mandat: Kundenportal"
+
+
+class TestGetExtractionHistory:
+    """Tests for the history used to compile the mandat."""
+
+    def test_whole_history_without_summary(self, resumed_session):
+        """Without a summary nothing is left out."""
+        assert len(chat.get_extraction_history("arthur")) == 120
+
+    def test_summary_replaces_covered_turns(self, resumed_session, monkeypatch):
+        """Over budget, the turns the summary covers are replaced by it."""
+        monkeypatch.setattr(chat, "get_history_budget", lambda agent_id: 200)
+        summary = HistorySummary(text="Ziel: Onboarding verbessern.", covered=110)
+        chat.st.session_state.history_summarizer = SimpleNamespace(summary=summary)
+
+        history = chat.get_extraction_history("arthur")
+
+        assert any(msg["content"].startswith(SUMMARY_HEADING) for msg in history)
+        assert history[-1]["content"] == "Nachricht 119"
+        assert len(history) < 120
+
+    def test_lagging_summary_is_not_used(self, resumed_session, monkeypatch):
+        """If the summary does not reach the recent turns, the whole history is sent."""
+        monkeypatch.setattr(chat, "get_history_budget", lambda agent_id: 200)
+        chat.st.session_state.history_summarizer = SimpleNamespace(
+            summary=HistorySummary(text="Alt", covered=10)
+        )
+
+        assert len(chat.get_extraction_history("arthur")) == 120
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
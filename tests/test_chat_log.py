@@ -0,0 +1,133 @@
+"""Tests for the chat log with snapshots and paged loading."""
+
+import json
+
+import pytest
+
+from src.discovery.chat_log import (
+    CHECKPOINT_INTERVAL,
+    SNAPSHOT_INTERVAL,
+    SNAPSHOT_RECENT,
+    ChatLog
+)
+from src.discovery.session import count_messages, load_messages, load_session, save_session
+
+
+def make_records(start: int, count: int) -> list:
+    """Create numbered message records."""
+    return [{"role": "user", "content": f"Nachricht {i}"} for i in range(start, start + count)]
+
+
+def contents(records: list) -> list:
+    """Get the message numbers of records."""
+    return [int(r["content"].split()[1]) for r in records]
+
+
+class TestChatLog:
+    """Tests for ChatLog."""
+
+    def test_append_and_count(self, tmp_path):
+        """Test appending in several batches."""
+        chat_log = ChatLog(tmp_path)
+        chat_log.append(make_records(0, 3))
+        chat_log.append(make_records(3, 2))
+
+        assert chat_log.count() == 5
+        assert contents(list(chat_log)) == [0, 1, 2, 3, 4]
+
+    def test_snapshot_written_periodically(self, tmp_path):
+        """Test that the snapshot follows the log every SNAPSHOT_INTERVAL messages."""
+        chat_log = ChatLog(tmp_path)
+        chat_log.append(make_records(0, SNAPSHOT_INTERVAL - 1))
+        assert not chat_log.snapshot_path.exists()
+
+        chat_log.append(make_records(SNAPSHOT_INTERVAL - 1, 1))
+        snapshot = json.loads(chat_log.snapshot_path.read_text(encoding="utf-8"))
+        assert snapshot["message_count"] == SNAPSHOT_INTERVAL
+        assert snapshot["log_offset"] == chat_log.path.stat().st_size
+
+    def test_pages_across_checkpoints(self, tmp_path):
+        """Test reading old pages by seeking to checkpoints."""
+        chat_log = ChatLog(tmp_path)
+        chat_log.append(make_records(0, 3 * CHECKPOINT_INTERVAL + 17))
+
+        reopened = ChatLog(tmp_path)
+        assert contents(reopened.read(0, 5)) == [0, 1, 2, 3, 4]
+        assert contents(reopened.read(CHECKPOINT_INTERVAL - 2, 4)) == [98, 99, 100, 101]
+        assert contents(reopened.read(2 * CHECKPOINT_INTERVAL + 50, 3)) == [250, 251, 252]
+        assert contents(reopened.read(3 * CHECKPOINT_INTERVAL + 15)) == [315, 316]
+        assert reopened.read(1000, 10) == []
+
+    def test_resume_does_not_read_old_messages(self, tmp_path):
+        """Test that reopening reads only the snapshot and the tail."""
+        total = 5 * SNAPSHOT_INTERVAL + 7
+        ChatLog(tmp_path).append(make_records(0, total))
+
+        # Garble everything before the recent messages (same length, lines kept)
+        raw = (tmp_path / "chat-log.jsonl").read_bytes()
+        lines = raw.split(b"\n")
+        old = len(lines) - 1 - SNAPSHOT_RECENT
+        garbled = [b"x" * len(line) for line in lines[:old]] + lines[old:]
+        (tmp_path / "chat-log.jsonl").write_bytes(b"\n".join(garbled))
+
+        reopened = ChatLog(tmp_path)
+        assert reopened.count() == total
+        assert contents(reopened.read(total - 3, 3)) == [total - 3, total - 2, total - 1]
+
+    def test_torn_tail_is_not_counted(self, tmp_path):
+        """Test that a partly written line is ignored and not glued to the next one."""
+        chat_log = ChatLog(tmp_path)
+        chat_log.append(make_records(0, 2))
+        with open(chat_log.path, "ab") as f:
+            f.write(b'{"role": "us')
+
+        reopened = ChatLog(tmp_path)
+        assert reopened.count() == 2
+        reopened.append(make_records(2, 1))
+        assert contents(list(ChatLog(tmp_path))) == [0, 1, 2]
+
+    def test_rewrite_and_clear(self, tmp_path):
+        """Test replacing and deleting the log."""
+        chat_log = ChatLog(tmp_path)
+        chat_log.append(make_records(0, SNAPSHOT_INTERVAL + 5))
+        chat_log.rewrite(make_records(100, 2))
+
+        assert contents(ChatLog(tmp_path).read()) == [100, 101]
+
+        chat_log.clear()
+        assert chat_log.count() == 0
+        assert not chat_log.snapshot_path.exists()
+
+
+class TestPagedSession:
+    """Tests for the paged session API."""
+
+    def test_load_recent_and_older_pages(self, session_dir):
+        """Test resuming with a limit and loading older pages."""
+        save_session(make_records(0, 120))
+
+        messages, meta = load_session(limit=20)
+        assert contents(messages) == list(range(100, 120))
+        assert meta["message_count"] == count_messages() == 120
+        assert contents(load_messages(80, 20)) == list(range(80, 100))
+
+    def test_save_partial_history(self, session_dir):
+        """Test that saving a partially loaded history appends only new messages."""
+        save_session(make_records(0, 30))
+        messages, _ = load_session(limit=10)
+
+        save_session(messages + make_records(30, 2), offset=20)
+
+        assert count_messages() == 32
+        assert contents(load_session()[0]) == list(range(32))
+
+    def test_partial_history_must_line_up(self, session_dir):
+        """Test that a partial history cannot truncate the log."""
+        save_session(make_records(0, 30))
+
+        with pytest.raises(ValueError):
+            save_session(make_records(20, 5), offset=20)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
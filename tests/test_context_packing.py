@@ -0,0 +1,130 @@
+"""Tests for packing artifacts into an agent's context budget."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.context import loader as loader_module
+from src.context.loader import AgentContextLoader
+from src.context.packing import mandat_distances, pack_context, score_artifacts
+from src.discovery.artifacts import get_artifact_graph, save_artifact
+from src.discovery.models import ArtifactStatus, ArtifactType
+
+
+NOW = datetime(2026, 3, 1, 12, 0)
+
+
+class TestPackContext:
+    """Tests for the greedy packing."""
+
+    def test_takes_highest_priority_first(self):
+        """Items are chosen by priority, highest first."""
+        assert pack_context([10, 10, 10], [1.0, 3.0, 2.0], 20) == [1, 2]
+
+    def test_skips_items_that_do_not_fit(self):
+        """A large item does not keep smaller, lower-priority ones out."""
+        assert pack_context([50, 100, 30], [1.0, 3.0, 2.0], 90) == [2, 0]
+
+    def test_ties_keep_input_order(self):
+        """Equal priorities keep the input order."""
+        assert pack_context([1, 1, 1], [0.0, 0.0, 0.0], 10) == [0, 1, 2]
+
+    def test_nothing_fits(self):
+        """An exhausted budget gives an empty context."""
+        assert pack_context([10], [1.0], 5) == []
+        assert pack_context([10], [1.0], -3) == []
+
+
+class TestScoreArtifacts:
+    """Tests for the priority score."""
+
+    def test_complete_over_draft(self, make_artifact):
+        """Finished artifacts outrank drafts of the same age."""
+        scores = score_artifacts(
+            [
+                make_artifact("a", status=ArtifactStatus.DRAFT, updated_at=NOW),
+                make_artifact("b", status=ArtifactStatus.COMPLETE, updated_at=NOW)
+            ],
+            {}
+        )
+        assert scores[1] > scores[0]
+
+    def test_recent_over_old(self, make_artifact):
+        """Recently updated artifacts outrank old ones."""
+        old = make_artifact("alt", updated_at=NOW - timedelta(days=30))
+        scores = score_artifacts([old, make_artifact("neu", updated_at=NOW)], {})
+        assert scores[1] > scores[0]
+
+    def test_mandat_link(self, make_artifact):
+        """Artifacts linked to the mandat outrank unlinked ones, nearer ones more."""
+        artifacts = [make_artifact(artifact_id, updated_at=NOW) for artifact_id in ("fern", "nah", "ohne")]
+        scores = score_artifacts(artifacts, {"fern": 2, "nah": 1})
+        assert scores[1] > scores[0] > scores[2]
+
+    def test_mandat_distances(self, wall_dir, make_artifact):
+        """Distances are measured to the nearest mandat."""
+        save_artifact(make_artifact("mandat", ArtifactType.MANDAT))
+        save_artifact(make_artifact("insight-1", ArtifactType.INSIGHT, related_to=["mandat"]))
+        save_artifact(make_artifact("idea-1", ArtifactType.IDEA, related_to=["insight-1"]))
+        save_artifact(make_artifact("idea-2", ArtifactType.IDEA))
+
+        distances = mandat_distances(get_artifact_graph(), max_hops=2)
+        assert distances == {"mandat": 0, "insight-1": 1, "idea-1": 2}
+
+
+class TestLoaderPacking:
+    """Tests for the context loader's use of the packer."""
+
+    def test_keeps_most_important_artifacts(self, wall_dir, monkeypatch, make_artifact):
+        """Over budget, the complete, mandat-linked and recent artifacts are kept."""
+        # Saving stamps updated_at: later saves are more recent
+        save_artifact(make_artifact("mandat", ArtifactType.MANDAT))
+        save_artifact(make_artifact("alt-entwurf", ArtifactType.IDEA, content="x" * 800))
+        save_artifact(make_artifact("fertig", ArtifactType.IDEA, status=ArtifactStatus.COMPLETE, content="x" * 800))
+        save_artifact(make_artifact("verlinkt", ArtifactType.IDEA, related_to=["mandat"], content="x" * 800))
+        save_artifact(make_artifact("neu", ArtifactType.IDEA, content="x" * 800))
+
+        loader = AgentContextLoader("ida")
+        monkeypatch.setattr(loader, "token_budget", 600)
+        context = loader.load()
+
+        ids = [artifact.id for artifact in context.artifacts]
+        assert "alt-entwurf" not in ids
+        assert ids[0] == "fertig"
+        assert context.token_estimate <= 600
+        assert context.artifacts_text.startswith(loader_module.ARTIFACTS_HEADING)
+        for artifact_id in ids:
+            assert f"Titel {artifact_id}" in context.summary
+
+    def test_sizes_each_block_once(self, wall_dir, monkeypatch, make_artifact):
+        """Each artifact is counted once, however many are dropped."""
+        for index in range(40):
+            save_artifact(make_artifact(f"idea-{index}", ArtifactType.IDEA, content="x" * 400))
+
+        counted = []
+        original = AgentContextLoader._estimate_tokens
+
+        def counting(self, text, exact=False):
+            counted.append(text)
+            return original(self, text, exact=exact)
+
+        monkeypatch.setattr(AgentContextLoader, "_estimate_tokens", counting)
+        loader = AgentContextLoader("ida")
+        monkeypatch.setattr(loader, "token_budget", 500)
+        context = loader.load()
+
+        assert 0 < len(context.artifacts) < 40
+        assert len(counted) == 40 + 2  # Blocks, plus knowledge and section frame
+        assert context.artifacts[0].id == "idea-39"  # Saved last = most recent
+
+    def test_everything_fits(self, wall_dir, make_artifact):
+        """Within the budget all artifacts are kept."""
+        save_artifact(make_artifact("idea-1", ArtifactType.IDEA))
+        save_artifact(make_artifact("idea-2", ArtifactType.IDEA))
+
+        context = AgentContextLoader("ida").load()
+        assert {a.id for a in context.artifacts} == {"idea-1", "idea-2"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,61 @@
+"""Tests for the fixed-schema frontmatter codec."""
+
+import pytest
+import yaml
+from unittest.mock import patch
+
+from src.discovery import frontmatter
+from src.discovery.frontmatter import dump_frontmatter, load_frontmatter
+
+
+SAMPLE = {
+    "id": "insight-1",
+    "type": "insight",
+    "status": "draft",
+    "created_by": "finn",
+    "created_at": "2025-01-01T09:00:00.123456",
+    "updated_at": "2025-01-02T10:30:00",
+    "related_to": ["mandat", "insight-0"]
+}
+
+
+class TestFrontmatterCodec:
+    """Tests for encoding and decoding."""
+
+    def test_roundtrip(self):
+        """Test that encoded frontmatter decodes to the same dict."""
+        assert load_frontmatter(dump_frontmatter(SAMPLE)) == SAMPLE
+
+    def test_output_is_valid_yaml(self):
+        """Test that any YAML loader reads the encoded frontmatter."""
+        fields = dict(SAMPLE, created_by="Team: Ida's Gruppe", id="idee-über-123")
+        assert yaml.safe_load(dump_frontmatter(fields)) == fields
+
+    def test_reads_yaml_dump_output(self):
+        """Test that files written by yaml.dump take the fast path."""
+        text = yaml.dump(SAMPLE, default_flow_style=False, allow_unicode=True)
+
+        with patch.object(frontmatter.yaml, "load") as yaml_load:
+            assert load_frontmatter(text) == SAMPLE
+
+        yaml_load.assert_not_called()
+
+    @pytest.mark.parametrize("text", [
+        "id: insight-1\ntype: insight  # von Hand\n",
+        "id: insight-1\ntype: insight\nrelated_to: [mandat, idea-1]\n",
+        "id: insight-1\ntype: insight\ntags:\n- neu\n",
+        "id: 123\ntype: insight\n",
+        "id: insight-1\ntype: insight\ncreated_at: 2025-01-01 09:00:00\n",
+        "id: insight-1\ntype: insight\nstatus: \"in\\u0020progress\"\n",
+    ])
+    def test_hand_edited_falls_back_to_yaml(self, text):
+        """Test that anything outside the fast path matches yaml.safe_load."""
+        assert load_frontmatter(text) == yaml.safe_load(text)
+
+    def test_empty_list(self):
+        """Test an empty related_to list."""
+        assert load_frontmatter("id: a\nrelated_to: []\n") == {"id": "a", "related_to": []}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
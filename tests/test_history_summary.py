@@ -0,0 +1,225 @@
+"""Tests for the rolling history summary."""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.context.history import HistorySummary, SUMMARY_HEADING, window_history
+from src.context.summary import (
+    RollingSummarizer,
+    create_history_summarizer,
+    format_transcript,
+    summary_llm_config
+)
+from src.discovery.session import clear_session, load_history_summary, save_history_summary
+from src.llm.base import BaseLLMClient
+
+
+def conversation(turns, size=400):
+    """Turns of user/assistant messages of ~size characters."""
+    messages = []
+    for i in range(turns):
+        messages.append({"role": "user", "content": f"Frage {i} " + "x" * size})
+        messages.append({"role": "assistant", "content": f"Antwort {i} " + "y" * size, "agent_name": "Nora"})
+    return messages
+
+
+class SummaryClient(BaseLLMClient):
+    """Client returning numbered summaries, optionally waiting for a gate."""
+
+    def __init__(self, gate=None, fail=False):
+        super().__init__({"model": "summary-model"})
+        self.gate = gate
+        self.fail = fail
+        self.requests = []
+
+    async def complete(self, messages, system_prompt=None):
+        self.requests.append(messages[0]["content"])
+        while self.gate is not None and not self.gate.is_set():
+            await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("Modell nicht erreichbar")
+        return f"Zusammenfassung {len(self.requests)}"
+
+    def get_provider_name(self):
+        return "Test"
+
+
+class TestWindowWithSummary:
+    """Tests for splicing the summary into the history window."""
+
+    def test_summary_replaces_dropped_turns(self):
+        """The summary is sent right before the recent turns."""
+        messages = conversation(20)
+        summary = HistorySummary(text="Bisher: Onboarding-Problem.", covered=10)
+        window = window_history(messages, 1000, pin_first=False, summary=summary)
+
+        assert window.summarized
+        assert window.tokens <= 1000
+        position = window.messages.index(summary.as_message())
+        assert position == 0
+        assert window.messages[1:] == [
+            {"role": m["role"], "content": m["content"]} for m in messages[window.recent_start:]
+        ]
+        assert window.kept_messages == len(messages) - window.recent_start
+
+    def test_no_summary_if_everything_fits(self):
+        """A conversation within the budget is sent without the summary."""
+        messages = conversation(2)
+        summary = HistorySummary(text="Alt", covered=2)
+        window = window_history(messages, 10000, summary=summary)
+
+        assert not window.summarized
+        assert window.recent_start == 0
+        assert len(window.messages) == len(messages)
+
+    def test_unloaded_pages_count_as_dropped(self):
+        """With an offset the summary stands in for the unloaded messages."""
+        messages = conversation(2)
+        summary = HistorySummary(text="Frühere Seiten", covered=40)
+        window = window_history(messages, 10000, pin_first=False, summary=summary, offset=40)
+
+        assert window.summarized
+        assert window.messages[0]["content"].startswith(SUMMARY_HEADING)
+        assert window.recent_start == 40
+        assert window.total_messages == 44
+
+
+class TestRollingSummarizer:
+    """Tests for the background refresh."""
+
+    def test_refresh_summarizes_dropped_messages(self):
+        """A due refresh condenses the dropped messages and saves the result."""
+        messages = conversation(10)
+        saved = []
+        summarizer = RollingSummarizer(SummaryClient(), every_messages=4, save=saved.append)
+
+        future = summarizer.refresh(6, lambda offset, limit: messages[offset:offset + limit])
+        result = future.result(timeout=5)
+
+        assert result.covered == 6
+        assert summarizer.summary == result
+        assert saved == [result.to_dict()]
+        assert "Frage 0" in summarizer.client.requests[0]
+        assert "Frage 3" not in summarizer.client.requests[0]
+
+    def test_not_due(self):
+        """No refresh before enough messages have fallen out."""
+        summarizer = RollingSummarizer(
+            SummaryClient(), every_messages=10, summary=HistorySummary(text="Alt", covered=20)
+        )
+        assert summarizer.refresh(25, lambda offset, limit: conversation(20)) is None
+
+    def test_incremental_refresh(self):
+        """The next refresh starts from the previous summary."""
+        messages = conversation(20)
+        summarizer = RollingSummarizer(
+            SummaryClient(), every_messages=4, summary=HistorySummary(text="Alte Zusammenfassung", covered=10)
+        )
+
+        summarizer.refresh(16, lambda offset, limit: messages[offset:offset + limit]).result(timeout=5)
+
+        request = summarizer.client.requests[0]
+        assert "Alte Zusammenfassung" in request
+        assert "Frage 5" in request and "Frage 4" not in request
+        assert summarizer.covered == 16
+
+    def test_previous_summary_used_while_refreshing(self):
+        """The refresh does not block; the old summary stays current until it is done."""
+        gate = threading.Event()
+        messages = conversation(10)
+        old = HistorySummary(text="Alt", covered=2)
+        summarizer = RollingSummarizer(SummaryClient(gate=gate), every_messages=2, summary=old)
+
+        future = summarizer.refresh(8, lambda offset, limit: messages[offset:offset + limit])
+        assert summarizer.is_refreshing()
+        assert summarizer.summary == old
+        # A second refresh is not started while one is running
+        assert summarizer.refresh(10, lambda offset, limit: messages[offset:offset + limit]) is None
+
+        gate.set()
+        assert future.result(timeout=5).covered == 8
+        assert summarizer.summary.covered == 8
+
+    def test_failure_keeps_previous_summary(self):
+        """A failed refresh leaves the previous summary in place."""
+        messages = conversation(10)
+        old = HistorySummary(text="Alt", covered=2)
+        summarizer = RollingSummarizer(SummaryClient(fail=True), every_messages=2, summary=old)
+
+        assert summarizer.refresh(8, lambda offset, limit: messages[offset:offset + limit]).result(timeout=5) is None
+        assert summarizer.summary == old
+        assert "nicht erreichbar" in summarizer.last_error
+
+    def test_reset_discards_running_refresh(self):
+        """A refresh finishing after reset() is not stored."""
+        gate = threading.Event()
+        messages = conversation(10)
+        saved = []
+        summarizer = RollingSummarizer(SummaryClient(gate=gate), every_messages=2, save=saved.append)
+
+        future = summarizer.refresh(8, lambda offset, limit: messages[offset:offset + limit])
+        summarizer.reset()
+        gate.set()
+
+        assert future.result(timeout=5) is None
+        assert summarizer.summary is None
+        assert saved == []
+
+    def test_batch_is_capped(self):
+        """A long backlog is condensed over several refreshes."""
+        messages = conversation(50)
+        summarizer = RollingSummarizer(SummaryClient(), every_messages=2, max_batch_messages=30)
+
+        summarizer.refresh(90, lambda offset, limit: messages[offset:offset + limit]).result(timeout=5)
+        assert summarizer.covered == 30
+
+
+class TestPersistence:
+    """Tests for storing the summary with the session."""
+
+    def test_round_trip(self, session_dir):
+        """A saved summary is loaded back and removed with the session."""
+        summary = HistorySummary(text="Bisher", covered=12, updated_at="2026-01-01T10:00:00")
+        save_history_summary(summary.to_dict())
+
+        assert HistorySummary.from_dict(load_history_summary()) == summary
+        clear_session()
+        assert load_history_summary() == {}
+
+    def test_missing_summary(self, session_dir):
+        """Without a summary file there is no summary."""
+        assert HistorySummary.from_dict(load_history_summary()) is None
+
+
+class TestConfig:
+    """Tests for the summary client configuration."""
+
+    def test_summary_model_overrides_provider(self):
+        """The llm.summary section overlays the provider section."""
+        config = {"llm": {
+            "provider": "anthropic",
+            "anthropic": {"model": "gross", "max_tokens": 4096, "temperature": 0.7},
+            "summary": {"anthropic": {"model": "klein", "max_tokens": 512}}
+        }}
+        provider_config = summary_llm_config(config)["llm"]["anthropic"]
+
+        assert provider_config == {"model": "klein", "max_tokens": 512, "temperature": 0.7}
+        assert config["llm"]["anthropic"]["model"] == "gross"
+
+    def test_disabled(self):
+        """No summarizer without a provider or when disabled."""
+        assert create_history_summarizer({}) is None
+        config = {"llm": {"provider": "anthropic", "summary": {"enabled": False}}}
+        assert create_history_summarizer(config) is None
+
+    def test_transcript_names_speakers(self):
+        """The transcript names the user and the agents."""
+        transcript = format_transcript(conversation(1, size=0))
+        assert transcript.startswith("Nutzer: Frage 0")
+        assert "Nora: Antwort 0" in transcript
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,129 @@
+"""Tests for the token-budgeted chat history window."""
+
+import pytest
+
+from src.context.history import (
+    DEFAULT_HISTORY_BUDGET,
+    find_pinned,
+    get_history_budget,
+    message_tokens,
+    window_history
+)
+
+
+def msg(role, content):
+    return {"role": role, "content": content}
+
+
+def conversation(turns, size=400):
+    """Greeting followed by turns of user/assistant messages of ~size characters."""
+    messages = [msg("assistant", "Hallo, ich bin Nora.")]
+    for i in range(turns):
+        messages.append(msg("user", f"Frage {i} " + "x" * size))
+        messages.append(msg("assistant", f"Antwort {i} " + "y" * size))
+    return messages
+
+
+class TestFindPinned:
+    """Tests for the pinned message selection."""
+
+    def test_greeting_is_pinned(self):
+        """The greeting at the start of the conversation is pinned."""
+        assert find_pinned(conversation(1)) == {0}
+
+    def test_greeting_not_pinned_without_start(self):
+        """Without the start of the conversation nothing is pinned."""
+        assert find_pinned(conversation(1), pin_first=False) == set()
+
+    def test_command_outputs_are_pinned(self):
+        """Assistant messages answering a *command are pinned."""
+        messages = [
+            msg("user", "Hallo"),
+            msg("assistant", "Hi"),
+            msg("user", "*status"),
+            msg("assistant", "Status: 3 Insights"),
+            msg("user", "Weiter"),
+            msg("assistant", "Gerne")
+        ]
+        assert find_pinned(messages) == {3}
+
+
+class TestWindowHistory:
+    """Tests for window_history()."""
+
+    def test_empty(self):
+        """An empty history gives an empty window."""
+        window = window_history([], 1000)
+        assert window.messages == []
+        assert window.tokens == 0
+
+    def test_everything_fits(self):
+        """A short conversation is sent completely."""
+        messages = conversation(2)
+        window = window_history(messages, 10000)
+        assert window.messages == messages
+        assert window.dropped_messages == 0
+        assert window.tokens == sum(message_tokens(m) for m in messages)
+
+    def test_keeps_recent_turns_within_budget(self):
+        """Older turns are dropped, the most recent ones kept in order."""
+        messages = conversation(20)
+        budget = 1000
+        window = window_history(messages, budget)
+
+        assert window.tokens <= budget
+        assert window.dropped_messages > 0
+        assert window.messages[0] == messages[0]  # Greeting
+        assert window.messages[-1] == messages[-1]
+        # Apart from the greeting, a contiguous tail of the conversation
+        tail = window.messages[1:]
+        assert tail == messages[len(messages) - len(tail):]
+
+    def test_last_message_always_kept(self):
+        """The current message is sent even if it exceeds the budget."""
+        messages = [msg("user", "a" * 100), msg("user", "b" * 10000)]
+        window = window_history(messages, 50, pin_first=False)
+        assert window.messages == [messages[-1]]
+        assert window.dropped_messages == 1
+
+    def test_command_output_kept_beyond_recent_turns(self):
+        """Pinned command outputs survive when older turns are dropped."""
+        messages = [msg("user", "*status"), msg("assistant", "Status: 3 Insights")]
+        messages += conversation(20)[1:]
+        window = window_history(messages, 1000, pin_first=False)
+
+        assert msg("assistant", "Status: 3 Insights") in window.messages
+        assert msg("user", "*status") not in window.messages
+        assert window.tokens <= 1000
+
+    def test_start_moves_in_steps(self):
+        """Once saturated, the window start only changes at step boundaries."""
+        messages = conversation(60)
+        starts = []
+        for end in range(61, len(messages) + 1):
+            window = window_history(messages[:end], 3000, step=10)
+            assert window.tokens <= 3000
+            assert window.messages[-1] == messages[end - 1]
+            starts.append(window.recent_start)
+
+        assert all(start % 10 == 0 for start in starts)
+        assert starts == sorted(starts)
+        assert len(set(starts)) < len(starts) / 5
+
+    def test_strips_extra_fields(self):
+        """Only role and content are returned."""
+        messages = [{"role": "user", "content": "Hallo", "agent": "nora", "timestamp": "x"}]
+        assert window_history(messages, 1000).messages == [msg("user", "Hallo")]
+
+
+class TestHistoryBudget:
+    """Tests for the per-agent budgets."""
+
+    def test_known_and_unknown_agents(self):
+        """Arthur gets the largest budget, unknown agents the default."""
+        assert get_history_budget("arthur") > get_history_budget("nora")
+        assert get_history_budget("unbekannt") == DEFAULT_HISTORY_BUDGET
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,202 @@
+"""Tests for the LLM response cache."""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from src.llm.base import BaseLLMClient
+from src.llm.cache import ResponseCache, cached_complete, create_response_cache
+
+
+MESSAGES = [
+    {"role": "user", "content": "Wir wollen das Onboarding verbessern."},
+    {"role": "assistant", "content": "Warum jetzt?"}
+]
+
+
+class CountingClient(BaseLLMClient):
+    """Client returning numbered responses."""
+
+    def __init__(self, config=None):
+        super().__init__(config or {"model": "test-model", "temperature": 0})
+        self.calls = 0
+
+    async def complete(self, messages, system_prompt=None):
+        self.calls += 1
+        return f"Antwort {self.calls}"
+
+    def get_provider_name(self):
+        return "Counting"
+
+
+def complete(client, cache, messages=MESSAGES, system_prompt="Extrahiere das Mandat."):
+    """Run cached_complete() synchronously."""
+    return asyncio.run(cached_complete(client, messages, system_prompt, cache=cache))
+
+
+class TestCacheKey:
+    """Tests for ResponseCache.make_key()."""
+
+    def test_whitespace_and_extra_fields_ignored(self):
+        """Test that only role and trimmed content are part of the key."""
+        client = CountingClient()
+        decorated = [dict(msg, content=f"  {msg['content']}\n", agent="nora") for msg in MESSAGES]
+
+        assert ResponseCache.make_key(client, MESSAGES, "S") == ResponseCache.make_key(client, decorated, "S ")
+
+    def test_settings_change_key(self):
+        """Test that model settings, prompt and messages are part of the key."""
+        client = CountingClient()
+        key = ResponseCache.make_key(client, MESSAGES, "S")
+
+        assert key != ResponseCache.make_key(CountingClient({"model": "test-model", "temperature": 1}), MESSAGES, "S")
+        assert key != ResponseCache.make_key(client, MESSAGES, "T")
+        assert key != ResponseCache.make_key(client, MESSAGES[:1], "S")
+
+
+class TestMemoryTier:
+    """Tests for the in-memory LRU."""
+
+    def test_hit_skips_llm(self):
+        """Test that a repeated request is answered from the cache."""
+        client = CountingClient()
+        cache = ResponseCache()
+
+        assert complete(client, cache) == "Antwort 1"
+        assert complete(client, cache) == "Antwort 1"
+        assert client.calls == 1
+
+        stats = cache.stats()
+        assert (stats.hits, stats.memory_hits, stats.misses) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is dropped."""
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        cache.get("a")
+        cache.put("c", "C")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "A"
+        assert cache.stats().entries == 2
+
+    def test_ttl(self):
+        """Test that expired entries are misses."""
+        cache = ResponseCache(ttl_seconds=60)
+        cache.put("a", "A")
+        cache._memory["a"] = (time.time() - 120, "A")
+
+        assert cache.get("a") is None
+
+    def test_empty_response_not_cached(self):
+        """Test that empty responses are requested again."""
+        class EmptyClient(CountingClient):
+            async def complete(self, messages, system_prompt=None):
+                self.calls += 1
+                return ""
+
+        client = EmptyClient()
+        cache = ResponseCache()
+        complete(client, cache)
+        complete(client, cache)
+
+        assert client.calls == 2
+
+
+class TestDiskTier:
+    """Tests for the on-disk tier."""
+
+    def test_survives_restart(self, tmp_path):
+        """Test that a new cache instance reads responses from disk."""
+        client = CountingClient()
+        complete(client, ResponseCache(directory=tmp_path))
+
+        cache = ResponseCache(directory=tmp_path)
+        assert complete(client, cache) == "Antwort 1"
+        assert client.calls == 1
+        assert cache.stats().disk_hits == 1
+
+    def test_expired_file_is_deleted(self, tmp_path):
+        """Test that files past the TTL are misses and removed."""
+        ResponseCache(directory=tmp_path).put("a", "A")
+        path = tmp_path / "a.json"
+        path.write_text('{"created_at": 0, "response": "A"}', encoding="utf-8")
+
+        cache = ResponseCache(directory=tmp_path, ttl_seconds=60)
+        assert cache.get("a") is None
+        assert not path.exists()
+        assert cache.stats().evictions == 1
+
+    def test_size_cap_evicts_least_recently_used(self, tmp_path):
+        """Test that the oldest files are deleted when over the size cap."""
+        cache = ResponseCache(directory=tmp_path, max_disk_bytes=300)
+        for index, key in enumerate(("a", "b")):
+            cache.put(key, "x" * 100)
+            os.utime(tmp_path / f"{key}.json", (1000 + index, 1000 + index))
+
+        cache.put("c", "x" * 100)
+
+        assert not (tmp_path / "a.json").exists()
+        assert (tmp_path / "b.json").exists()
+        assert (tmp_path / "c.json").exists()
+
+    def test_disk_access_off_the_event_loop(self, tmp_path):
+        """Test that lookups and stores do not run on the event loop thread."""
+        threads = []
+
+        class RecordingCache(ResponseCache):
+            def get(self, key):
+                threads.append(threading.get_ident())
+                return super().get(key)
+
+            def put(self, key, response):
+                threads.append(threading.get_ident())
+                super().put(key, response)
+
+        async def run():
+            loop_thread = threading.get_ident()
+            await cached_complete(CountingClient(), MESSAGES, "S", cache=RecordingCache(directory=tmp_path))
+            return loop_thread
+
+        loop_thread = asyncio.run(run())
+        assert len(threads) == 2
+        assert loop_thread not in threads
+
+    def test_clear(self, tmp_path):
+        """Test clearing both tiers."""
+        cache = ResponseCache(directory=tmp_path)
+        cache.put("a", "A")
+        cache.clear()
+
+        assert cache.get("a") is None
+        assert list(tmp_path.glob("*.json")) == []
+
+
+class TestConfig:
+    """Tests for create_response_cache()."""
+
+    def test_from_config(self, tmp_path):
+        """Test reading the llm.cache section."""
+        cache = create_response_cache({"llm": {"cache": {
+            "max_entries": 10, "directory": str(tmp_path), "ttl_hours": 2, "max_disk_mb": 1
+        }}})
+
+        assert cache.max_entries == 10
+        assert cache.directory == tmp_path
+        assert cache.ttl_seconds == 7200
+        assert cache.max_disk_bytes == 1024 * 1024
+
+    def test_memory_only_by_default(self):
+        """Test that no disk tier is used without a directory."""
+        cache = create_response_cache({})
+        assert cache.directory is None
+        assert cache.ttl_seconds is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,292 @@
+"""Tests for deadlines, retries and rate limits of the LLM client layer."""
+
+import asyncio
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from google.api_core import exceptions as google_exceptions
+
+from src.llm.base import (
+    BaseLLMClient,
+    LLMTimeoutError,
+    ResilienceConfig,
+    TokenBucket,
+    parse_retry_after
+)
+from src.llm.factory import _provider_config
+from src.llm.google_client import GoogleClient
+
+
+MESSAGES = [{"role": "user", "content": "Hallo"}]
+
+
+class RetryableError(Exception):
+    """Error the scripted client asks to retry."""
+
+    def __init__(self, retry_after: float = 0.0):
+        super().__init__("überlastet")
+        self.retry_after = retry_after
+
+
+class ScriptedClient(BaseLLMClient):
+    """Client whose attempts follow a script of results and errors."""
+
+    def __init__(self, script, **resilience):
+        resilience.setdefault("backoff_base_seconds", 0.001)
+        super().__init__({"resilience": resilience})
+        self.script = list(script)
+        self.attempts = 0
+
+    async def _attempt(self):
+        self.attempts += 1
+        step = self.script.pop(0)
+        if isinstance(step, Exception):
+            raise step
+        if isinstance(step, float):
+            await asyncio.sleep(step)
+            return "spät"
+        return step
+
+    async def complete(self, messages, system_prompt=None):
+        return await self._call_resilient(self._attempt, messages, system_prompt)
+
+    async def stream(self, messages, system_prompt=None):
+        async def open_stream():
+            self.attempts += 1
+            step = self.script.pop(0)
+            for part in step:
+                if isinstance(part, Exception):
+                    raise part
+                yield part
+
+        async for chunk in self._stream_resilient(open_stream, messages, system_prompt):
+            yield chunk
+
+    def get_retry_delay(self, error):
+        return error.retry_after if isinstance(error, RetryableError) else None
+
+    def get_provider_name(self):
+        return "Scripted"
+
+
+def run(coro):
+    """Run a coroutine to completion."""
+    return asyncio.run(coro)
+
+
+async def collect(client):
+    """Collect the chunks of a stream."""
+    return [chunk async for chunk in client.stream(MESSAGES)]
+
+
+class TestRetries:
+    """Tests for retries with backoff."""
+
+    def test_retries_until_success(self):
+        """Test that retryable errors are retried."""
+        client = ScriptedClient([RetryableError(), RetryableError(), "ok"])
+
+        assert run(client.complete(MESSAGES)) == "ok"
+        assert client.attempts == 3
+
+    def test_permanent_error_is_raised(self):
+        """Test that other errors are not retried."""
+        client = ScriptedClient([ValueError("ungültig"), "ok"])
+
+        with pytest.raises(ValueError):
+            run(client.complete(MESSAGES))
+        assert client.attempts == 1
+
+    def test_gives_up_after_max_retries(self):
+        """Test that the last error is raised after max_retries."""
+        client = ScriptedClient([RetryableError()] * 3, max_retries=2)
+
+        with pytest.raises(RetryableError):
+            run(client.complete(MESSAGES))
+        assert client.attempts == 3
+
+    def test_honors_retry_after(self, monkeypatch):
+        """Test that the provider's retry-after is waited at least."""
+        delays = []
+        real_sleep = asyncio.sleep
+
+        async def fake_sleep(delay, *args):
+            delays.append(delay)
+            await real_sleep(0)
+
+        monkeypatch.setattr("src.llm.base.asyncio.sleep", fake_sleep)
+        client = ScriptedClient([RetryableError(retry_after=7), "ok"])
+
+        assert run(client.complete(MESSAGES)) == "ok"
+        assert delays == [7]
+
+    def test_backoff_is_exponential_with_jitter(self, monkeypatch):
+        """Test the backoff delays."""
+        delays = []
+        real_sleep = asyncio.sleep
+
+        async def fake_sleep(delay, *args):
+            delays.append(delay)
+            await real_sleep(0)
+
+        monkeypatch.setattr("src.llm.base.asyncio.sleep", fake_sleep)
+        client = ScriptedClient([RetryableError()] * 3 + ["ok"], backoff_base_seconds=1, backoff_max_seconds=3)
+
+        run(client.complete(MESSAGES))
+
+        assert 0.5 <= delays[0] <= 1
+        assert 1 <= delays[1] <= 2
+        assert 1.5 <= delays[2] <= 3
+
+
+class TestDeadline:
+    """Tests for the per-call deadline."""
+
+    def test_slow_call_times_out(self):
+        """Test that a call exceeding the deadline raises LLMTimeoutError."""
+        client = ScriptedClient([5.0], timeout_seconds=0.05)
+
+        with pytest.raises(LLMTimeoutError):
+            run(client.complete(MESSAGES))
+
+    def test_no_retry_past_deadline(self):
+        """Test that a retry-after beyond the deadline raises the error."""
+        client = ScriptedClient([RetryableError(retry_after=60), "ok"], timeout_seconds=1)
+
+        with pytest.raises(RetryableError):
+            run(client.complete(MESSAGES))
+        assert client.attempts == 1
+
+
+class TestConcurrency:
+    """Tests for the in-flight limit."""
+
+    def test_max_in_flight(self):
+        """Test that no more than max_in_flight calls run at once."""
+        running = 0
+        peak = 0
+
+        class SlowClient(ScriptedClient):
+            async def _attempt(self):
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                return "ok"
+
+        client = SlowClient([], max_in_flight=2)
+
+        async def many():
+            return await asyncio.gather(*(client.complete(MESSAGES) for _ in range(6)))
+
+        assert run(many()) == ["ok"] * 6
+        assert peak == 2
+
+
+class TestTokenBucket:
+    """Tests for the rate limiter."""
+
+    def test_waits_for_refill(self):
+        """Test that an empty bucket delays the caller."""
+        async def wait_for_budget():
+            bucket = TokenBucket(per_minute=1200)  # 20 per second
+            await bucket.acquire(1200)
+            started = time.monotonic()
+            await bucket.acquire(2)
+            return time.monotonic() - started
+
+        assert 0.05 <= run(wait_for_budget()) < 1
+
+    def test_deadline(self):
+        """Test giving up when the budget does not refill in time."""
+        async def exhausted():
+            bucket = TokenBucket(per_minute=60)
+            bucket.debit(60)
+            await bucket.acquire(30, deadline=time.monotonic() + 0.1)
+
+        with pytest.raises(LLMTimeoutError):
+            run(exhausted())
+
+    def test_requests_per_minute(self):
+        """Test that the request budget is taken per call."""
+        client = ScriptedClient(["a", "b"], requests_per_minute=60)
+
+        run(client.complete(MESSAGES))
+
+        assert client.limiter.request_bucket.tokens == pytest.approx(59, abs=0.1)
+
+
+class TestStreamRetries:
+    """Tests for retries of streamed calls."""
+
+    def test_retry_before_first_chunk(self):
+        """Test that a stream failing before output is retried."""
+        client = ScriptedClient([[RetryableError()], ["Hal", "lo"]])
+
+        assert run(collect(client)) == ["Hal", "lo"]
+        assert client.attempts == 2
+
+    def test_no_retry_after_output(self):
+        """Test that a stream failing midway is not repeated."""
+        client = ScriptedClient([["Hal", RetryableError()], ["Hallo"]])
+
+        with pytest.raises(RetryableError):
+            run(collect(client))
+        assert client.attempts == 1
+
+    def test_slot_released_when_stopped_early(self):
+        """Test that closing a stream early frees its slot."""
+        client = ScriptedClient([["a", "b", "c"]], max_in_flight=1)
+
+        async def first_chunk():
+            chunks = client.stream(MESSAGES)
+            chunk = await chunks.__anext__()
+            await chunks.aclose()
+            return chunk
+
+        assert run(first_chunk()) == "a"
+        assert not client.limiter.slots.locked()
+
+
+class TestConfig:
+    """Tests for the configuration."""
+
+    def test_from_dict_ignores_unknown_keys(self):
+        """Test building the settings from config."""
+        config = ResilienceConfig.from_dict({"max_retries": 5, "unbekannt": 1})
+        assert config.max_retries == 5
+        assert config.requests_per_minute is None
+
+    def test_provider_overrides_shared_settings(self):
+        """Test merging llm.resilience into the provider section."""
+        llm_config = {
+            "resilience": {"max_retries": 5, "max_in_flight": 4},
+            "google": {"model": "gemini", "resilience": {"max_in_flight": 2}}
+        }
+
+        provider_config = _provider_config(llm_config, "google")
+
+        assert provider_config["model"] == "gemini"
+        assert provider_config["resilience"] == {"max_retries": 5, "max_in_flight": 2}
+
+    def test_parse_retry_after(self):
+        """Test seconds and HTTP date values."""
+        assert parse_retry_after("3") == 3
+        assert parse_retry_after(None) == 0
+        assert parse_retry_after("bald") == 0
+        later = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+        assert 25 <= parse_retry_after(later) <= 30
+
+    def test_google_retryable_errors(self):
+        """Test which Gemini errors are retried."""
+        client = GoogleClient({})
+        assert client.get_retry_delay(google_exceptions.ResourceExhausted("quota")) == 0
+        assert client.get_retry_delay(google_exceptions.ServiceUnavailable("down")) == 0
+        assert client.get_retry_delay(google_exceptions.InvalidArgument("bad")) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
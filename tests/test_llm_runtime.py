@@ -0,0 +1,151 @@
+"""Tests for the shared event loop and LLM client pool."""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.llm.factory import get_llm_client
+from src.llm.runtime import EventLoopThread, get_event_loop_thread, iterate_async, run_async
+
+
+@pytest.fixture
+def loop_thread():
+    """A private event loop thread."""
+    loop_thread = EventLoopThread()
+    yield loop_thread
+    loop_thread.stop(timeout=5)
+
+
+class TestEventLoopThread:
+    """Tests for running coroutines on the background loop."""
+
+    def test_run_returns_result(self, loop_thread):
+        """Test running a coroutine."""
+        async def add(a, b):
+            await asyncio.sleep(0)
+            return a + b
+
+        assert loop_thread.run(add(1, 2)) == 3
+
+    def test_calls_share_one_loop(self, loop_thread):
+        """Test that every call runs on the same loop."""
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        loops = {loop_thread.run(current_loop()) for _ in range(3)}
+        assert loops == {loop_thread.loop}
+
+    def test_exceptions_propagate(self, loop_thread):
+        """Test that errors of the coroutine are raised in the caller."""
+        async def fail():
+            raise ValueError("kaputt")
+
+        with pytest.raises(ValueError, match="kaputt"):
+            loop_thread.run(fail())
+
+    def test_timeout_cancels(self, loop_thread):
+        """Test that a timed out coroutine is cancelled."""
+        cancelled = threading.Event()
+
+        async def hang():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(TimeoutError):
+            loop_thread.run(hang(), timeout=0.05)
+        assert cancelled.wait(5)
+
+    def test_concurrent_callers(self, loop_thread):
+        """Test that several script threads can wait on the loop at once."""
+        async def slow_echo(value):
+            await asyncio.sleep(0.05)
+            return value
+
+        results = {}
+
+        def call(index):
+            results[index] = loop_thread.run(slow_echo(index))
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == {i: i for i in range(8)}
+
+    def test_iterate(self, loop_thread):
+        """Test consuming an async generator."""
+        async def count(n):
+            for i in range(n):
+                await asyncio.sleep(0)
+                yield i
+
+        assert list(loop_thread.iterate(count(4))) == [0, 1, 2, 3]
+
+    def test_iterate_closes_generator_early(self, loop_thread):
+        """Test that stopping early closes the async generator on the loop."""
+        closed = threading.Event()
+
+        async def endless():
+            try:
+                while True:
+                    yield "x"
+            finally:
+                closed.set()
+
+        chunks = loop_thread.iterate(endless())
+        assert next(chunks) == "x"
+        chunks.close()
+
+        assert closed.is_set()
+
+
+class TestProcessWideLoop:
+    """Tests for the module-level helpers."""
+
+    def test_helpers_use_one_loop(self):
+        """Test that run_async and iterate_async share the process loop."""
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        async def loops():
+            yield asyncio.get_running_loop()
+
+        loop = get_event_loop_thread().loop
+        assert run_async(current_loop()) is loop
+        assert list(iterate_async(loops())) == [loop]
+
+
+class TestClientPool:
+    """Tests for get_llm_client()."""
+
+    def test_same_config_shares_client(self):
+        """Test that equal settings return the same client."""
+        config = {"llm": {"provider": "google", "google": {"model": "gemini-2.0-flash"}}}
+        same = {"llm": {"provider": "google", "google": {"model": "gemini-2.0-flash"}}}
+        other = {"llm": {"provider": "google", "google": {"model": "gemini-2.0-pro"}}}
+
+        assert get_llm_client(config) is get_llm_client(same)
+        assert get_llm_client(config) is not get_llm_client(other)
+
+    def test_clients_of_a_provider_share_rate_limits(self):
+        """Test that e.g. chat and summary clients count against the same budgets."""
+        chat = {"llm": {"provider": "google", "google": {"model": "gemini-2.0-flash"}}}
+        summary = {"llm": {"provider": "google", "google": {"model": "gemini-2.0-flash-lite"}}}
+
+        assert get_llm_client(chat) is not get_llm_client(summary)
+        assert get_llm_client(chat).limiter is get_llm_client(summary).limiter
+
+    def test_unknown_provider(self):
+        """Test that configuration errors are not cached away."""
+        with pytest.raises(ValueError):
+            get_llm_client({"llm": {"provider": "unbekannt"}})
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,117 @@
+"""Tests for streaming LLM completions."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from src.llm.anthropic_client import AnthropicClient
+from src.llm.base import BaseLLMClient
+from src.llm.google_client import GoogleClient
+
+
+MESSAGES = [
+    {"role": "user", "content": "Hallo"},
+    {"role": "assistant", "content": "Hallo! Worum geht es?"},
+    {"role": "user", "content": "Um unser Kundenportal."}
+]
+
+
+def collect(client: BaseLLMClient) -> List[str]:
+    """Run client.stream() and collect the chunks."""
+    async def run():
+        return [chunk async for chunk in client.stream(MESSAGES, "Du bist Nora.")]
+    return asyncio.run(run())
+
+
+class FakeClient(BaseLLMClient):
+    """Client implementing complete() only."""
+
+    async def complete(self, messages, system_prompt=None):
+        return "Komplette Antwort"
+
+    def get_provider_name(self):
+        return "Fake"
+
+
+class FakeAnthropicStream:
+    """Stand-in for the Anthropic MessageStream context manager."""
+
+    def __init__(self, texts):
+        self.texts = texts
+
+    async def __aenter__(self):
+        async def text_stream():
+            for text in self.texts:
+                yield text
+        self.text_stream = text_stream()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def get_final_message(self):
+        return SimpleNamespace(usage=None)
+
+
+class FakeGeminiChat:
+    """Stand-in for a Gemini chat session."""
+
+    def __init__(self, history):
+        self.history = history
+        self.sent = None
+
+    async def send_message_async(self, content, generation_config=None, stream=False):
+        self.sent = (content, stream)
+
+        async def chunks():
+            for text in ("Gern", "", "! Erzähl mehr."):
+                yield SimpleNamespace(parts=[text] if text else [], text=text)
+        return chunks()
+
+
+class TestStream:
+    """Tests for BaseLLMClient.stream() and the provider implementations."""
+
+    def test_default_yields_complete_response(self):
+        """Test that clients without streaming yield one chunk."""
+        assert collect(FakeClient({})) == ["Komplette Antwort"]
+
+    def test_anthropic_yields_text_deltas(self, monkeypatch):
+        """Test that Claude's text deltas are passed through."""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+        client = AnthropicClient({"max_tokens": 100, "prompt_caching": False})
+        calls = []
+
+        def fake_stream(**kwargs):
+            calls.append(kwargs)
+            return FakeAnthropicStream(["Hal", "lo", " Welt"])
+
+        client.client = SimpleNamespace(messages=SimpleNamespace(stream=fake_stream))
+
+        assert "".join(collect(client)) == "Hallo Welt"
+        assert calls[0]["messages"] == MESSAGES
+        assert calls[0]["system"] == "Du bist Nora."
+        assert calls[0]["max_tokens"] == 100
+
+    def test_google_streams_last_message(self):
+        """Test that Gemini gets the history and streams the last message."""
+        client = GoogleClient({})
+        chats = []
+
+        def start_chat(history):
+            chats.append(FakeGeminiChat(history))
+            return chats[-1]
+
+        client.genai_model = SimpleNamespace(start_chat=start_chat)
+
+        assert collect(client) == ["Gern", "! Erzähl mehr."]
+        chat = chats[0]
+        assert chat.sent == ("Um unser Kundenportal.", True)
+        assert chat.history[0]["parts"] == ["System: Du bist Nora."]
+        assert [entry["role"] for entry in chat.history[2:]] == ["user", "model"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,263 @@
+"""Tests for Anthropic prompt caching against a local fake of the Messages API."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.agents.arthur import ArthurAgent
+from src.context.history import window_history
+from src.discovery.artifacts import save_artifact
+from src.discovery.models import Artifact, ArtifactType
+from src.llm.anthropic_client import AnthropicClient
+from src.llm.prompt import PromptBlock, SystemPrompt
+
+
+def tokens(text: str) -> int:
+    """Token count used by the fake API (~4 characters each)."""
+    return len(text) // 4
+
+
+class FakeMessagesAPI:
+    """Local stand-in for messages.create() with prompt cache accounting.
+
+    The prompt is the system blocks followed by the message blocks. The
+    prefix up to each cache breakpoint is a cache entry. Like the API, a
+    breakpoint also finds entries ending up to LOOKBACK_BLOCKS blocks
+    before it: the longest entry seen before is read, the rest written.
+    """
+
+    LOOKBACK_BLOCKS = 20
+
+    def __init__(self):
+        self.cache = set()
+        self.requests = []
+
+    async def create(self, **params):
+        self.requests.append(params)
+        segments = self._segments(params)
+        breakpoints = [index for index, (_, cached) in enumerate(segments) if cached]
+        assert len(breakpoints) <= 4, "The API allows at most 4 cache breakpoints"
+
+        prefixes = ["".join(text for text, _ in segments[:index + 1]) for index in breakpoints]
+        candidates = {
+            "".join(text for text, _ in segments[:start + 1])
+            for index in breakpoints
+            for start in range(max(index - self.LOOKBACK_BLOCKS + 1, 0), index + 1)
+        }
+        total = tokens("".join(text for text, _ in segments))
+        read = max((tokens(prefix) for prefix in candidates if prefix in self.cache), default=0)
+        written = max((tokens(prefix) for prefix in prefixes), default=0) - read
+        self.cache.update(prefixes)
+
+        usage = SimpleNamespace(
+            input_tokens=total - read - max(written, 0),
+            output_tokens=2,
+            cache_read_input_tokens=read,
+            cache_creation_input_tokens=max(written, 0)
+        )
+        return SimpleNamespace(content=[SimpleNamespace(text="Antwort")], usage=usage)
+
+    @staticmethod
+    def _segments(params):
+        """Flatten system and messages into (text, has_breakpoint) pairs."""
+        segments = []
+        system = params["system"]
+        if isinstance(system, str):
+            segments.append((system, False))
+        else:
+            segments.extend((block["text"], "cache_control" in block) for block in system)
+        for message in params["messages"]:
+            content = message["content"]
+            if isinstance(content, str):
+                segments.append((f"{message['role']}:{content}", False))
+            else:
+                segments.extend((f"{message['role']}:{block['text']}", "cache_control" in block) for block in content)
+        return segments
+
+
+def make_client(monkeypatch, **config):
+    """Create an AnthropicClient talking to the fake API."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+    client = AnthropicClient(config)
+    api = FakeMessagesAPI()
+    client.client = SimpleNamespace(messages=api)
+    return client, api
+
+
+def make_prompt(artifacts: str = "## Discovery Context\nMandat: Onboarding") -> SystemPrompt:
+    """Create a prompt with persona, knowledge and artifact blocks."""
+    return SystemPrompt([
+        PromptBlock("persona", "Du bist Arthur. " * 50, cache=True),
+        PromptBlock("knowledge", "Briefing-Wissen. " * 400, cache=True),
+        PromptBlock("artifacts", artifacts, cache=True)
+    ])
+
+
+def complete(client, messages, prompt):
+    """Run client.complete() synchronously."""
+    return asyncio.run(client.complete(messages, prompt))
+
+
+class TestSystemPrompt:
+    """Tests for SystemPrompt."""
+
+    def test_is_the_joined_string(self):
+        """Test that the prompt is usable as a plain string."""
+        prompt = SystemPrompt([PromptBlock("a", "Eins"), PromptBlock("b", ""), PromptBlock("c", "Drei")])
+
+        assert prompt == "Eins\n\nDrei"
+        assert [block.name for block in prompt.blocks] == ["a", "c"]
+        assert "".join(prompt.block_texts()) == prompt
+
+
+class TestRequestParams:
+    """Tests for the cache breakpoints sent to the API."""
+
+    def test_blocks_with_breakpoints(self, monkeypatch):
+        """Test that cacheable blocks and the last message get breakpoints."""
+        client, api = make_client(monkeypatch)
+        prompt = make_prompt()
+        messages = [{"role": "user", "content": "Hallo"}]
+
+        complete(client, messages, prompt)
+
+        request = api.requests[0]
+        assert "".join(block["text"] for block in request["system"]) == prompt
+        assert all(block["cache_control"] == {"type": "ephemeral"} for block in request["system"])
+        assert request["messages"][-1]["content"][0]["cache_control"] == {"type": "ephemeral"}
+        assert messages == [{"role": "user", "content": "Hallo"}]  # Input is not modified
+
+    def test_plain_string_prompt(self, monkeypatch):
+        """Test that a plain string prompt is sent unchanged."""
+        client, api = make_client(monkeypatch)
+
+        complete(client, [{"role": "user", "content": "Hallo"}], "Extrahiere das Mandat.")
+
+        assert api.requests[0]["system"] == "Extrahiere das Mandat."
+
+    def test_breakpoint_limit(self, monkeypatch):
+        """Test that at most four breakpoints are sent."""
+        client, api = make_client(monkeypatch)
+        prompt = SystemPrompt([PromptBlock(f"b{i}", f"Block {i}", cache=True) for i in range(5)])
+
+        complete(client, [{"role": "user", "content": "Hallo"}], prompt)
+
+        flags = ["cache_control" in block for block in api.requests[0]["system"]]
+        assert flags == [False, False, True, True, True]
+
+    def test_sends_temperature(self, monkeypatch):
+        """Test that the configured temperature is part of the request."""
+        client, api = make_client(monkeypatch, temperature=0.2)
+
+        complete(client, [{"role": "user", "content": "Hallo"}], make_prompt())
+
+        assert api.requests[0]["temperature"] == 0.2
+
+    def test_disabled(self, monkeypatch):
+        """Test that prompt_caching: false sends plain strings."""
+        client, api = make_client(monkeypatch, prompt_caching=False)
+        messages = [{"role": "user", "content": "Hallo"}]
+
+        complete(client, messages, make_prompt())
+
+        assert isinstance(api.requests[0]["system"], str)
+        assert api.requests[0]["messages"] == messages
+
+
+class TestCacheUsage:
+    """Tests for cache reads across turns."""
+
+    def test_second_turn_reads_prefix(self, monkeypatch):
+        """Test that the stable prefix and the history are read from the cache."""
+        client, _ = make_client(monkeypatch)
+        prompt = make_prompt()
+        history = [{"role": "user", "content": "Wir wollen das Onboarding verbessern."}]
+
+        complete(client, history, prompt)
+        first = client.usage_stats()
+        assert first.cache_read_tokens == 0
+        assert first.cache_write_tokens > tokens(prompt) * 0.9
+
+        history += [
+            {"role": "assistant", "content": "Warum jetzt?"},
+            {"role": "user", "content": "Weil viele Kunden abspringen."}
+        ]
+        complete(client, history, prompt)
+        second = client.usage_stats()
+
+        assert second.calls == 2
+        assert second.cache_read_tokens - first.cache_read_tokens >= tokens(prompt)
+        assert second.input_tokens - first.input_tokens < 20
+
+    def test_changed_artifacts_keep_stable_prefix(self, monkeypatch):
+        """Test that new artifacts only invalidate the blocks after the knowledge."""
+        client, _ = make_client(monkeypatch)
+        messages = [{"role": "user", "content": "Hallo"}]
+        complete(client, messages, make_prompt())
+
+        prompt = make_prompt(artifacts="## Discovery Context\nMandat: Onboarding, Insight: Abbruch")
+        before = client.usage_stats()
+        complete(client, messages, prompt)
+        after = client.usage_stats()
+
+        stable = tokens("".join(prompt.block_texts()[:2]))
+        assert after.cache_read_tokens - before.cache_read_tokens == stable
+        assert after.cache_write_tokens > before.cache_write_tokens
+
+    def test_saturated_window_reads_history(self, monkeypatch):
+        """Test that the history is read from the cache while the window start stays put."""
+        client, _ = make_client(monkeypatch)
+        prompt = make_prompt()
+        messages = []
+        for i in range(30):
+            messages += [
+                {"role": "user", "content": f"Frage {i} " + "x" * 400},
+                {"role": "assistant", "content": f"Antwort {i} " + "y" * 400}
+            ]
+
+        reads = []
+        starts = []
+        for i in range(30, 45):
+            messages.append({"role": "user", "content": f"Frage {i} " + "x" * 400})
+            window = window_history(messages, 3000, pin_first=False, step=10)
+            assert window.dropped_messages > 0
+
+            before = client.usage_stats()
+            complete(client, window.messages, prompt)
+            reads.append(client.usage_stats().cache_read_tokens - before.cache_read_tokens)
+            starts.append(window.recent_start)
+            messages.append({"role": "assistant", "content": f"Antwort {i} " + "y" * 400})
+
+        history_read = [
+            read > tokens(prompt) + 400
+            for previous, start, read in zip(starts, starts[1:], reads[1:])
+            if start == previous
+        ]
+        assert len(history_read) >= 10
+        assert all(history_read)
+
+
+class TestAgentPrompt:
+    """Tests for the agent system prompt blocks."""
+
+    def test_agent_prompt_blocks(self, wall_dir):
+        """Test that the agent prompt is split into cacheable blocks."""
+        save_artifact(Artifact(
+            id="mandat-1",
+            type=ArtifactType.MANDAT,
+            title="Mandat Onboarding",
+            content="## Kontext\nViele Abbrüche",
+            created_by="arthur"
+        ))
+
+        prompt = ArthurAgent().load_system_prompt()
+
+        assert [block.name for block in prompt.blocks] == ["persona", "knowledge", "artifacts"]
+        assert all(block.cache for block in prompt.blocks)
+        assert prompt.blocks[0].text.startswith("Du bist Arthur")
+        assert "Mandat Onboarding" in prompt.blocks[2].text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,124 @@
+"""Tests for atomic and batched artifact writes."""
+
+import importlib
+import os
+import stat
+from unittest.mock import patch
+
+import pytest
+
+from src.discovery import markdown_store
+from src.discovery.artifacts import (
+    get_artifact_graph,
+    get_wall_summary,
+    load_artifacts,
+    save_artifact,
+    save_artifacts,
+    search_artifacts
+)
+from src.discovery.models import ArtifactType
+from src.utils import files
+from src.utils.files import atomic_write_text
+
+
+class TestAtomicWriteText:
+    """Tests for the atomic file writer."""
+
+    def test_replaces_content(self, tmp_path):
+        """Test that the target ends up with the new content only."""
+        target = tmp_path / "mandat.md"
+        target.write_text("alt", encoding="utf-8")
+
+        atomic_write_text(target, "neu")
+
+        assert target.read_text(encoding="utf-8") == "neu"
+        assert os.listdir(tmp_path) == ["mandat.md"]
+
+    def test_failed_write_keeps_old_file(self, tmp_path):
+        """Test that a crash during the write leaves the old file intact."""
+        target = tmp_path / "mandat.md"
+        target.write_text("alt", encoding="utf-8")
+
+        with patch("src.utils.files.os.replace", side_effect=OSError("crash")):
+            with pytest.raises(OSError):
+                atomic_write_text(target, "neu")
+
+        assert target.read_text(encoding="utf-8") == "alt"
+        assert os.listdir(tmp_path) == ["mandat.md"]
+
+    def test_new_file_gets_umask_mode(self, tmp_path):
+        """Test that a new file is not left with the 0600 of the temporary file."""
+        target = tmp_path / "mandat.md"
+        reference = tmp_path / "reference.md"
+        reference.write_text("", encoding="utf-8")  # Created the usual way
+
+        atomic_write_text(target, "neu")
+
+        assert stat.S_IMODE(target.stat().st_mode) == stat.S_IMODE(reference.stat().st_mode)
+
+    def test_umask_is_left_alone(self, tmp_path):
+        """Test that the process umask is never touched (not thread-safe)."""
+        with patch("os.umask") as umask:
+            importlib.reload(files)
+            files.atomic_write_text(tmp_path / "mandat.md", "neu")
+
+        umask.assert_not_called()
+
+    def test_keeps_mode_of_replaced_file(self, tmp_path):
+        """Test that rewriting a file keeps its permissions."""
+        target = tmp_path / "mandat.md"
+        target.write_text("alt", encoding="utf-8")
+        os.chmod(target, 0o664)
+
+        atomic_write_text(target, "neu")
+
+        assert stat.S_IMODE(target.stat().st_mode) == 0o664
+
+
+class TestSaveArtifacts:
+    """Tests for the bulk save API."""
+
+    def test_batch_is_one_wall_version(self, wall_dir, make_artifact):
+        """Test that a batch updates all indexes with a single version bump."""
+        save_artifact(make_artifact("insight-0"))
+        version = get_wall_summary().version
+
+        batch = [make_artifact(f"insight-{i}") for i in range(1, 21)]
+        batch.append(make_artifact("idea-1", ArtifactType.IDEA, related_to=["insight-1"]))
+        paths = save_artifacts(batch)
+
+        assert len(paths) == 21
+        assert get_wall_summary().version == version + 1
+        assert get_wall_summary().counts()["problem"] == 21
+        assert [r.artifact_id for r in search_artifacts("insight-7")] == ["insight-7"]
+        assert get_artifact_graph().supporting_insights("idea-1") == ["insight-1"]
+        assert len(load_artifacts()) == 22
+
+    def test_directories_ensured_once(self, wall_dir, make_artifact):
+        """Test that directories are created once per process, not per save."""
+        save_artifact(make_artifact("insight-1"))
+
+        with patch("pathlib.Path.mkdir") as mkdir:
+            save_artifacts([make_artifact(f"insight-{i}") for i in range(2, 6)])
+            save_artifact(make_artifact("insight-6"))
+
+        assert mkdir.call_count == 0
+
+    def test_recreates_removed_directory(self, wall_dir, make_artifact):
+        """Test that saving still works after the wall directory was removed."""
+        save_artifact(make_artifact("insight-1"))
+        markdown_store.MarkdownArtifactStore(wall_dir).clear()
+        (wall_dir / "research" / "insights").rmdir()
+
+        save_artifact(make_artifact("insight-2"))
+
+        assert (wall_dir / "research" / "insights" / "insight-2.md").exists()
+
+    def test_empty_batch(self, wall_dir):
+        """Test that an empty batch writes nothing."""
+        assert save_artifacts([]) == []
+        assert not wall_dir.exists()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,152 @@
+"""Tests for full-text artifact search."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.agents.nora import NoraAgent
+from src.discovery.artifacts import save_artifact, search_artifacts, clear_all_artifacts, rebuild_search_index
+from src.discovery.markdown_store import MarkdownArtifactStore
+from src.discovery.models import ArtifactType
+from src.discovery.search import (
+    SEARCH_INDEX_FILENAME,
+    SEARCH_INDEX_LOG_FILENAME,
+    SearchIndex,
+    SearchIndexFile,
+    tokenize
+)
+
+
+class TestTokenize:
+    """Tests for German text normalization."""
+
+    def test_umlaut_folding(self):
+        """Test that umlauts and their transliterations match."""
+        assert tokenize("Bedürfnis") == tokenize("Beduerfnis")
+        assert tokenize("Straße") == tokenize("Strasse")
+
+    def test_stemming(self):
+        """Test that word forms share a stem."""
+        assert tokenize("Nutzerinnen") == tokenize("Nutzer") == tokenize("nutzern")
+
+    def test_stopwords(self):
+        """Test that stopwords are dropped."""
+        assert tokenize("die und der") == []
+
+
+class TestSearchIndex:
+    """Tests for the in-memory inverted index."""
+
+    @pytest.fixture(autouse=True)
+    def build_index(self, make_artifact):
+        """Build a small index."""
+        self.index = SearchIndex()
+        self.index.add(make_artifact("insight-1", ArtifactType.INSIGHT, title="Onboarding dauert zu lange",
+                                     content="Nutzerinnen brechen im Interview-Prozess ab."))
+        self.index.add(make_artifact("idea-1", ArtifactType.IDEA, title="Geführtes Onboarding",
+                                     content="Ein Assistent führt durch die ersten Schritte."))
+
+    def test_all_terms_must_match(self):
+        """Test AND semantics across query terms."""
+        assert [r.artifact_id for r in self.index.search("onboarding nutzer")] == ["insight-1"]
+
+    def test_prefix_on_last_term(self):
+        """Test that the last term matches as a prefix."""
+        assert [r.artifact_id for r in self.index.search("interv")] == ["insight-1"]
+
+    def test_type_filter(self):
+        """Test restricting results to types."""
+        results = self.index.search("onboarding", types=[ArtifactType.IDEA])
+        assert [r.artifact_id for r in results] == ["idea-1"]
+
+    def test_title_outranks_body(self, make_artifact):
+        """Test that title matches score higher."""
+        self.index.add(make_artifact("insight-2", ArtifactType.INSIGHT, title="Preise",
+                                     content="Beim Onboarding fragen viele nach Preisen."))
+        assert self.index.search("onboarding")[-1].artifact_id == "insight-2"
+
+    def test_update_replaces_terms(self, make_artifact):
+        """Test that re-adding an artifact drops its old terms."""
+        self.index.add(make_artifact("idea-1", ArtifactType.IDEA, title="Chatbot", content="Hilfe im Chat"))
+        assert self.index.search("assistent") == []
+        assert [r.artifact_id for r in self.index.search("chatbot")] == ["idea-1"]
+
+    def test_roundtrip(self):
+        """Test that a serialized index answers the same queries."""
+        restored = SearchIndex.from_dict(self.index.to_dict())
+        assert restored.search("onboarding") == self.index.search("onboarding")
+
+
+class TestSearchArtifacts:
+    """Tests for the persisted index and the Nora command."""
+
+    def test_search_follows_saves_and_clear(self, wall_dir, make_artifact):
+        """Test that saving and clearing keep the index current."""
+        save_artifact(make_artifact("insight-1", ArtifactType.INSIGHT, title="Preise", content="Zu teuer für Teams"))
+        assert [r.artifact_id for r in search_artifacts("teuer")] == ["insight-1"]
+
+        clear_all_artifacts()
+        assert search_artifacts("teuer") == []
+
+    def test_rebuild_after_hand_edit(self, wall_dir, make_artifact):
+        """Test that a rebuild picks up files written outside save_artifact."""
+        save_artifact(make_artifact("insight-1", ArtifactType.INSIGHT, title="Preise", content="Zu teuer"))
+        MarkdownArtifactStore(wall_dir).save(
+            make_artifact("insight-2", ArtifactType.INSIGHT, title="Support", content="Antworten kommen zu langsam"))
+
+        rebuild_search_index()
+
+        assert [r.artifact_id for r in search_artifacts("langsam")] == ["insight-2"]
+
+    def test_save_appends_without_rewriting_index(self, wall_dir, make_artifact):
+        """Test that a single save only appends to the change log."""
+        save_artifact(make_artifact("insight-1", ArtifactType.INSIGHT, title="Preise", content="Zu teuer"))
+        snapshot = (wall_dir / SEARCH_INDEX_FILENAME).read_text(encoding="utf-8")
+        log = (wall_dir / SEARCH_INDEX_LOG_FILENAME).read_text(encoding="utf-8")
+
+        with patch("src.discovery.search.atomic_write_text") as write:
+            save_artifact(make_artifact("insight-2", ArtifactType.INSIGHT, title="Support", content="Zu langsam"))
+
+        write.assert_not_called()
+        assert (wall_dir / SEARCH_INDEX_FILENAME).read_text(encoding="utf-8") == snapshot
+        appended = (wall_dir / SEARCH_INDEX_LOG_FILENAME).read_text(encoding="utf-8")[len(log):]
+        assert len(appended.splitlines()) == 1
+        assert '"insight-2"' in appended
+
+    def test_log_is_replayed_on_load(self, wall_dir, make_artifact):
+        """Test that a fresh index file sees the logged saves."""
+        save_artifact(make_artifact("mandat-1", ArtifactType.MANDAT, title="Mandat: Alt", content="Portal"))
+        save_artifact(make_artifact("mandat-2", ArtifactType.MANDAT, title="Mandat: Neu", content="Portal"))
+        save_artifact(make_artifact("insight-1", ArtifactType.INSIGHT, title="Preise", content="Zu teuer"))
+
+        index_file = SearchIndexFile(wall_dir / SEARCH_INDEX_FILENAME)
+        with patch.object(MarkdownArtifactStore, "load_all") as load_all:
+            mandats = index_file.search(MarkdownArtifactStore(wall_dir), "mandat")
+            insights = index_file.search(MarkdownArtifactStore(wall_dir), "teuer")
+
+        load_all.assert_not_called()
+        assert [r.artifact_id for r in mandats] == ["mandat-2"]
+        assert [r.artifact_id for r in insights] == ["insight-1"]
+
+    def test_log_is_compacted(self, wall_dir, make_artifact):
+        """Test that a long log is folded into the index file."""
+        with patch("src.discovery.search.COMPACT_AFTER_CHANGES", 3):
+            for number in range(4):
+                save_artifact(make_artifact(f"insight-{number}", ArtifactType.INSIGHT, title="Preise", content="Zu teuer"))
+
+        assert len((wall_dir / SEARCH_INDEX_LOG_FILENAME).read_text(encoding="utf-8").splitlines()) == 1
+        fresh = SearchIndexFile(wall_dir / SEARCH_INDEX_FILENAME)
+        assert len(fresh.search(MarkdownArtifactStore(wall_dir), "teuer")) == 4
+
+    def test_nora_suche_command(self, wall_dir, make_artifact):
+        """Test the *suche command."""
+        save_artifact(make_artifact("insight-1", ArtifactType.INSIGHT, title="Preise", content="Zu teuer für Teams"))
+        nora = NoraAgent()
+
+        assert "Preise" in nora.handle_command("*suche teuer")
+        assert "Keine Artefakte" in nora.handle_command("*suche kundenservice")
+        assert "Was soll ich suchen" in nora.handle_command("*suche")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
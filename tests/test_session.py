@@ -0,0 +1,186 @@
+"""Tests for the append-only chat log session persistence."""
+
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from src.discovery.session import (
+    DEFAULT_SESSION_NAME,
+    SESSION_NAME_MAX_LENGTH,
+    append_message,
+    clear_session,
+    derive_session_name,
+    load_session,
+    save_session,
+    session_exists
+)
+from src.utils.files import atomic_write_text
+
+
+def make_messages(count: int) -> list:
+    """Create alternating user/assistant messages."""
+    return [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": f"Nachricht {i}"}
+        for i in range(count)
+    ]
+
+
+class TestSaveSession:
+    """Tests for saving and loading sessions."""
+
+    def test_roundtrip(self, session_dir):
+        """Test that messages and metadata load back."""
+        messages = make_messages(3)
+        messages[1].update(agent="nora", agent_icon="🧭", agent_name="Nora")
+
+        save_session(messages, session_name="Test", current_agent="arthur", mandat_complete=True)
+        loaded, meta = load_session()
+
+        assert [m["content"] for m in loaded] == ["Nachricht 0", "Nachricht 1", "Nachricht 2"]
+        assert loaded[1]["agent_name"] == "Nora"
+        assert "agent" not in loaded[0]
+        assert meta["name"] == "Test"
+        assert meta["current_agent"] == "arthur"
+        assert meta["mandat_complete"] is True
+        assert meta["message_count"] == 3
+
+    def test_id_and_created_at_are_kept(self, session_dir):
+        """Test that later saves keep the session identity."""
+        save_session(make_messages(1))
+        _, first = load_session()
+        save_session(make_messages(2))
+        _, second = load_session()
+
+        assert second["id"] == first["id"]
+        assert second["created_at"] == first["created_at"]
+
+    def test_name_is_kept_unless_given(self, session_dir):
+        """Test that a save without a name keeps the saved one."""
+        save_session(make_messages(1))
+        assert load_session()[1]["name"] == DEFAULT_SESSION_NAME
+
+        save_session(make_messages(2), session_name="Kundenportal")
+        save_session(make_messages(3))
+
+        assert load_session()[1]["name"] == "Kundenportal"
+
+    def test_only_new_messages_are_appended(self, session_dir):
+        """Test that saving a longer history appends without rewriting."""
+        messages = make_messages(2)
+        save_session(messages)
+        log_file = session_dir / "chat-log.jsonl"
+        first_lines = log_file.read_text(encoding="utf-8").splitlines()
+
+        messages.append({"role": "user", "content": "Neu"})
+        with patch("src.discovery.session.atomic_write_text", wraps=atomic_write_text) as write:
+            save_session(messages)
+
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert lines[:2] == first_lines
+        assert len(lines) == 3
+        # Only the small metadata file is rewritten
+        assert [c.args[0].name for c in write.call_args_list] == ["session-meta.json"]
+
+    def test_shorter_history_rewrites_log(self, session_dir):
+        """Test that a reset history replaces the log."""
+        save_session(make_messages(4))
+        save_session(make_messages(1))
+
+        loaded, _ = load_session()
+        assert [m["content"] for m in loaded] == ["Nachricht 0"]
+
+    def test_append_message(self, session_dir):
+        """Test appending single messages."""
+        save_session(make_messages(1))
+        append_message({"role": "assistant", "content": "Hallo"})
+
+        loaded, _ = load_session()
+        assert [m["content"] for m in loaded] == ["Nachricht 0", "Hallo"]
+        assert loaded[1]["timestamp"]
+
+    def test_torn_line_is_skipped(self, session_dir):
+        """Test that a partly written last line does not lose the history."""
+        save_session(make_messages(2))
+        with open(session_dir / "chat-log.jsonl", "a", encoding="utf-8") as f:
+            f.write('{"role": "user", "cont')
+
+        loaded, _ = load_session()
+        assert len(loaded) == 2
+
+    def test_clear_session(self, session_dir):
+        """Test that clearing removes all session files."""
+        save_session(make_messages(2))
+        clear_session()
+
+        assert not session_exists()
+        assert load_session() == ([], {})
+
+        save_session(make_messages(1))
+        assert len(load_session()[0]) == 1
+
+
+class TestDeriveSessionName:
+    """Tests for naming sessions after their chat."""
+
+    def test_mandat_title_wins(self):
+        """Test that the mandat title is preferred."""
+        assert derive_session_name(make_messages(2), "Mandat:  Kundenportal") == "Mandat: Kundenportal"
+
+    def test_first_user_message(self):
+        """Test that commands and assistant messages are skipped."""
+        messages = [
+            {"role": "assistant", "content": "Willkommen!"},
+            {"role": "user", "content": "*hilfe"},
+            {"role": "user", "content": "Wir bauen ein\nKundenportal"}
+        ]
+        assert derive_session_name(messages) == "Wir bauen ein Kundenportal"
+
+    def test_long_message_is_shortened(self):
+        """Test that long messages are cut at a word boundary."""
+        content = "Kundenportal für Versicherungen " * 5
+        name = derive_session_name([{"role": "user", "content": content}])
+
+        assert len(name) <= SESSION_NAME_MAX_LENGTH
+        assert name.endswith("für…")
+        assert content.startswith(name[:-1] + " ")
+
+    def test_no_name_without_user_message(self):
+        """Test that there is nothing to derive from an empty chat."""
+        assert derive_session_name([{"role": "assistant", "content": "Hallo"}]) is None
+
+
+class TestLegacyMigration:
+    """Tests for migrating session-meta.yaml."""
+
+    def test_yaml_session_is_migrated(self, session_dir):
+        """Test that a YAML session is converted once."""
+        session_dir.mkdir(parents=True)
+        legacy = {
+            "session": {"id": "session-abc", "name": "Alt", "created_at": "2024-01-01T10:00:00",
+                        "current_agent": "finn", "mandat_complete": True},
+            "chat_history": [
+                {"role": "user", "content": "Hallo", "timestamp": "2024-01-01T10:00:01"},
+                {"role": "assistant", "content": "Hi", "agent": "nora", "agent_name": "Nora"}
+            ]
+        }
+        (session_dir / "session-meta.yaml").write_text(yaml.dump(legacy), encoding="utf-8")
+
+        assert session_exists()
+        loaded, meta = load_session()
+
+        assert [m["content"] for m in loaded] == ["Hallo", "Hi"]
+        assert loaded[0]["timestamp"] == "2024-01-01T10:00:01"
+        assert meta["id"] == "session-abc"
+        assert meta["current_agent"] == "finn"
+        assert not (session_dir / "session-meta.yaml").exists()
+
+        save_session(loaded + [{"role": "user", "content": "Weiter"}], current_agent="finn")
+        loaded, meta = load_session()
+        assert len(loaded) == 3
+        assert meta["id"] == "session-abc"
+        assert meta["created_at"] == "2024-01-01T10:00:00"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
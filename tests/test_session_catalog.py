@@ -0,0 +1,253 @@
+"""Tests for the session catalog."""
+
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from src.discovery.artifacts import clear_all_artifacts, save_artifact
+from src.discovery.catalog import (
+    CATALOG_FILENAME,
+    CATALOG_LOG_FILENAME,
+    SessionCatalog,
+    SessionCatalogFile
+)
+from src.discovery.session import (
+    clear_session,
+    list_sessions,
+    load_session,
+    rebuild_session_catalog,
+    save_session
+)
+from src.discovery.workspace import create_workspace
+
+
+@pytest.fixture
+def sessions_dir(tmp_path):
+    """Base directory for workspaces."""
+    return tmp_path / "sessions"
+
+
+class TestSessionCatalog:
+    """Tests for the in-memory catalog."""
+
+    def make_catalog(self) -> SessionCatalog:
+        """Create a catalog with three sessions."""
+        catalog = SessionCatalog()
+        for session_id, name, updated_at in (
+            ("a", "Kundenportal", "2024-05-01T10:00:00"),
+            ("b", "Kundenservice", "2024-05-03T10:00:00"),
+            ("c", "Onboarding", "2024-05-02T10:00:00"),
+        ):
+            catalog.record_session({"id": session_id, "name": name, "updated_at": updated_at})
+        return catalog
+
+    def test_sorted_by_recency(self):
+        """Test that sessions are listed most recent first."""
+        assert [s["id"] for s in self.make_catalog().sessions()] == ["b", "c", "a"]
+
+    def test_prefix_search(self):
+        """Test case-insensitive prefix search on the name."""
+        catalog = self.make_catalog()
+
+        assert [s["id"] for s in catalog.sessions(prefix="kunden")] == ["b", "a"]
+        assert [s["id"] for s in catalog.sessions(prefix="Kundenp")] == ["a"]
+        assert catalog.sessions(prefix="portal") == []
+
+    def test_search_sees_renames(self):
+        """Test that the name index follows updated names."""
+        catalog = self.make_catalog()
+        catalog.sessions(prefix="x")
+        catalog.record_session({"id": "c", "name": "Kundenreise"})
+
+        assert [s["id"] for s in catalog.sessions(prefix="kunden")] == ["b", "c", "a"]
+
+    def test_limit(self):
+        """Test limiting the number of sessions."""
+        assert [s["id"] for s in self.make_catalog().sessions(limit=2)] == ["b", "c"]
+
+    def test_unsaved_sessions_are_hidden(self):
+        """Test that a workspace with artifacts but no chat is not listed."""
+        catalog = SessionCatalog()
+        catalog.record_artifacts("x", {"problem": 1})
+
+        assert catalog.sessions() == []
+
+    def test_roundtrip(self):
+        """Test serialization."""
+        catalog = self.make_catalog()
+        catalog.record_artifacts("a", {"problem": 2})
+
+        restored = SessionCatalog.from_dict(catalog.to_dict())
+
+        assert restored.version == catalog.version
+        assert restored.sessions() == catalog.sessions()
+
+
+class TestListSessions:
+    """Tests for the catalog kept by the session functions."""
+
+    def test_save_updates_catalog(self, sessions_dir):
+        """Test that saving a session records it in the catalog."""
+        workspace = create_workspace(base_dir=sessions_dir)
+        save_session(
+            [{"role": "user", "content": "Hallo"}],
+            session_name="Kundenportal",
+            current_agent="finn",
+            workspace=workspace
+        )
+
+        assert (sessions_dir / CATALOG_FILENAME).exists()
+        [entry] = list_sessions(base_dir=sessions_dir)
+        assert entry["id"] == workspace.session_id
+        assert entry["name"] == "Kundenportal"
+        assert entry["message_count"] == 1
+        assert entry["current_agent"] == "finn"
+        assert entry["mandat_complete"] is False
+
+    def test_listing_does_not_open_workspaces(self, sessions_dir):
+        """Test that listing reads the catalog only."""
+        for name in ("Eins", "Zwei"):
+            save_session([], session_name=name, workspace=create_workspace(base_dir=sessions_dir))
+
+        with patch("src.discovery.session._read_meta") as read_meta:
+            sessions = list_sessions(base_dir=sessions_dir)
+
+        read_meta.assert_not_called()
+        assert [s["name"] for s in sessions] == ["Zwei", "Eins"]
+
+    def test_artifact_counts(self, sessions_dir, make_artifact):
+        """Test that saving and clearing artifacts updates the counts."""
+        workspace = create_workspace(base_dir=sessions_dir)
+        save_session([], workspace=workspace)
+        save_artifact(make_artifact("ins-1"), workspace=workspace)
+        save_artifact(make_artifact("ins-2"), workspace=workspace)
+
+        assert list_sessions(base_dir=sessions_dir)[0]["artifact_counts"]["problem"] == 2
+
+        clear_all_artifacts(workspace=workspace)
+        save_session([], workspace=workspace)
+
+        assert list_sessions(base_dir=sessions_dir)[0]["artifact_counts"]["problem"] == 0
+
+    def test_clear_session_removes_entry(self, sessions_dir):
+        """Test that a cleared session is no longer listed."""
+        workspace = create_workspace(base_dir=sessions_dir)
+        save_session([], workspace=workspace)
+
+        clear_session(workspace=workspace)
+
+        assert list_sessions(base_dir=sessions_dir) == []
+
+    def test_rebuilt_from_workspaces(self, sessions_dir, make_artifact):
+        """Test that a missing catalog is rebuilt from the workspace files."""
+        workspace = create_workspace(base_dir=sessions_dir)
+        save_session([], session_name="Vorhanden", workspace=workspace)
+        save_artifact(make_artifact("ins-1"), workspace=workspace)
+        (sessions_dir / CATALOG_FILENAME).unlink()
+
+        [entry] = list_sessions(base_dir=sessions_dir, prefix="vor")
+
+        assert entry["name"] == "Vorhanden"
+        assert entry["artifact_counts"]["problem"] == 1
+
+    def test_listing_does_not_migrate_legacy_sessions(self, sessions_dir):
+        """Test that a YAML session is listed as is and only migrated when opened."""
+        workspace = create_workspace(base_dir=sessions_dir)
+        legacy = {
+            "session": {"name": "Alt", "updated_at": "2024-01-01T10:00:00", "current_agent": "finn"},
+            "chat_history": [{"role": "user", "content": "Hallo"}, {"role": "assistant", "content": "Hi"}]
+        }
+        legacy_file = workspace.root / "session-meta.yaml"
+        legacy_file.write_text(yaml.dump(legacy), encoding="utf-8")
+
+        [entry] = list_sessions(base_dir=sessions_dir)
+
+        assert entry["name"] == "Alt"
+        assert entry["message_count"] == 2
+        assert legacy_file.exists()
+        assert not (workspace.root / "session-meta.json").exists()
+        assert not (workspace.root / "chat-log.jsonl").exists()
+
+        messages, meta = load_session(workspace=workspace)
+
+        assert [m["content"] for m in messages] == ["Hallo", "Hi"]
+        assert meta["name"] == "Alt"
+        assert not legacy_file.exists()
+
+    def test_rebuild_keeps_version_monotonic(self, sessions_dir):
+        """Test the explicit rebuild."""
+        save_session([], workspace=create_workspace(base_dir=sessions_dir))
+        before = rebuild_session_catalog(base_dir=sessions_dir).version
+
+        assert rebuild_session_catalog(base_dir=sessions_dir).version == before + 1
+
+
+class TestSessionCatalogFile:
+    """Tests for the catalog file and its change log."""
+
+    def make_file(self, sessions_dir) -> SessionCatalogFile:
+        """Create a catalog file with one session."""
+        catalog_file = SessionCatalogFile(sessions_dir / CATALOG_FILENAME)
+        catalog_file.get(lambda: [{"id": "s1", "name": "Eins", "updated_at": "2024-01-01"}])
+        return catalog_file
+
+    def test_change_is_appended_not_rewritten(self, sessions_dir):
+        """Test that recording a save appends to the log only."""
+        catalog_file = self.make_file(sessions_dir)
+        snapshot = (sessions_dir / CATALOG_FILENAME).read_text(encoding="utf-8")
+
+        with patch("src.discovery.catalog.atomic_write_text") as write:
+            catalog_file.record_session(list, {"id": "s1", "name": "Umbenannt", "updated_at": "2024-01-02"})
+
+        write.assert_not_called()
+        assert (sessions_dir / CATALOG_FILENAME).read_text(encoding="utf-8") == snapshot
+        assert len((sessions_dir / CATALOG_LOG_FILENAME).read_text(encoding="utf-8").splitlines()) == 1
+
+    def test_log_is_replayed_on_load(self, sessions_dir):
+        """Test that another reader sees the logged changes."""
+        catalog_file = self.make_file(sessions_dir)
+        catalog_file.record_session(list, {"id": "s2", "name": "Zwei", "updated_at": "2024-01-02"})
+        catalog_file.record_remove(list, "s1")
+
+        fresh = SessionCatalogFile(sessions_dir / CATALOG_FILENAME).get(list)
+
+        assert [entry["name"] for entry in fresh.sessions()] == ["Zwei"]
+        assert fresh.version == catalog_file.get(list).version
+
+    def test_unchanged_metadata_is_not_logged(self, sessions_dir):
+        """Test that recording the same metadata writes nothing."""
+        catalog_file = self.make_file(sessions_dir)
+        catalog_file.record_session(list, {"id": "s1", "name": "Eins", "updated_at": "2024-01-01"})
+
+        assert not (sessions_dir / CATALOG_LOG_FILENAME).exists()
+
+    def test_log_is_compacted(self, sessions_dir):
+        """Test that a long log is folded into the snapshot."""
+        catalog_file = self.make_file(sessions_dir)
+
+        with patch("src.discovery.catalog.COMPACT_AFTER_CHANGES", 3):
+            for count in range(3):
+                catalog_file.record_session(list, {"id": "s1", "message_count": count + 1})
+
+        assert not (sessions_dir / CATALOG_LOG_FILENAME).exists()
+        fresh = SessionCatalogFile(sessions_dir / CATALOG_FILENAME).get(list)
+        assert fresh.sessions()[0]["message_count"] == 3
+
+    def test_torn_log_line_is_ignored(self, sessions_dir):
+        """Test that a half-written change does not break loading."""
+        catalog_file = self.make_file(sessions_dir)
+        catalog_file.record_session(list, {"id": "s1", "name": "Umbenannt"})
+        with open(sessions_dir / CATALOG_LOG_FILENAME, "a", encoding="utf-8") as f:
+            f.write('{"op": "remove", "id": "s1", "vers')
+
+        reader = SessionCatalogFile(sessions_dir / CATALOG_FILENAME)
+        assert reader.get(list).sessions()[0]["name"] == "Umbenannt"
+
+        reader.record_session(list, {"id": "s1", "name": "Danach"})
+        fresh = SessionCatalogFile(sessions_dir / CATALOG_FILENAME).get(list)
+        assert fresh.sessions()[0]["name"] == "Danach"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
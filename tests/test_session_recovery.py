@@ -0,0 +1,116 @@
+"""Tests for checksummed chat log records and crash recovery."""
+
+import json
+
+import pytest
+
+from src.discovery.chat_log import ChatLog, _decode, _encode
+from src.discovery.session import load_session, recover_session, save_session
+
+
+def make_messages(count: int) -> list:
+    """Create numbered user messages."""
+    return [{"role": "user", "content": f"Nachricht {i}"} for i in range(count)]
+
+
+class TestChecksums:
+    """Tests for the record encoding."""
+
+    def test_roundtrip(self):
+        """Test that an encoded record decodes unchanged."""
+        record = {"role": "assistant", "content": "Grüße\nmit Umbruch", "agent": "nora"}
+        line = _encode(record)
+
+        assert line.endswith(b"\n")
+        assert json.loads(line)["msg"] == record
+        assert _decode(line) == record
+
+    def test_flipped_byte_is_detected(self):
+        """Test that a modified record fails the checksum."""
+        line = _encode({"role": "user", "content": "Hallo"})
+        assert _decode(line.replace(b"Hallo", b"Hallx")) is None
+
+    def test_plain_lines_are_accepted(self):
+        """Test that lines written before checksums still load."""
+        assert _decode(b'{"role": "user", "content": "Alt"}\n') == {"role": "user", "content": "Alt"}
+
+
+class TestRecovery:
+    """Tests for recover_session()."""
+
+    def test_clean_session(self, session_dir):
+        """Test that an intact session reports no issues."""
+        save_session(make_messages(3))
+
+        report = recover_session()
+
+        assert report.message_count == 3
+        assert not report.has_issues
+
+    def test_torn_tail_is_cut_off(self, session_dir):
+        """Test that a partly written last line is removed and reported."""
+        save_session(make_messages(3))
+        log_file = session_dir / "chat-log.jsonl"
+        intact_size = log_file.stat().st_size
+        with open(log_file, "ab") as f:
+            f.write(_encode({"role": "user", "content": "abgebrochen"})[:20])
+
+        report = recover_session()
+
+        assert report.torn_tail_bytes == 20
+        assert report.has_issues
+        assert log_file.stat().st_size == intact_size
+        assert len(load_session()[0]) == 3
+
+    def test_corrupt_record_is_skipped(self, session_dir):
+        """Test that a record with a bad checksum is skipped and counted."""
+        save_session(make_messages(3))
+        log_file = session_dir / "chat-log.jsonl"
+        log_file.write_bytes(log_file.read_bytes().replace(b"Nachricht 1", b"Nachricht X"))
+
+        report = ChatLog(session_dir).recover()
+
+        assert report.corrupt_records == 1
+        assert report.message_count == 2
+
+    def test_corrupt_record_before_snapshot_is_counted(self, session_dir):
+        """Test that a bad record already covered by the snapshot is still counted."""
+        save_session(make_messages(60))
+        assert (session_dir / "chat-snapshot.json").exists()
+        log_file = session_dir / "chat-log.jsonl"
+        log_file.write_bytes(log_file.read_bytes().replace(b'"Nachricht 3"', b'"Nachricht X"'))
+
+        report = ChatLog(session_dir).recover()
+
+        assert report.corrupt_records == 1
+        assert report.message_count == 59
+        assert ChatLog(session_dir).count() == 59
+
+    def test_lost_metadata_is_rebuilt(self, session_dir):
+        """Test that the metadata is restored from the log."""
+        messages = make_messages(2)
+        messages[1].update(role="assistant", agent="arthur", timestamp="2024-05-01T12:00:00")
+        save_session(messages)
+        (session_dir / "session-meta.json").write_text('{"id": "sess', encoding="utf-8")
+
+        report = recover_session()
+
+        assert report.meta_rebuilt
+        _, meta = load_session()
+        assert meta["message_count"] == 2
+        assert meta["current_agent"] == "arthur"
+        assert meta["updated_at"] == "2024-05-01T12:00:00"
+
+    def test_unreadable_legacy_file_is_reported(self, session_dir):
+        """Test that a truncated session-meta.yaml is not silently ignored."""
+        session_dir.mkdir(parents=True)
+        (session_dir / "session-meta.yaml").write_text("session:\n  id: [unterbrochen", encoding="utf-8")
+
+        report = recover_session()
+
+        assert report.legacy_unreadable
+        assert (session_dir / "session-meta.yaml").exists()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,177 @@
+"""Tests for the token counting service."""
+
+import asyncio
+
+import pytest
+
+from src.llm.base import BaseLLMClient
+from src.llm.tokens import (
+    PROVIDER_BYTES_PER_TOKEN,
+    TokenCounter,
+    create_token_counter
+)
+
+
+GERMAN = "Die Nutzerinnen möchten ihre Rückmeldungen schnell über die Übersicht äußern. " * 20
+
+
+class StubCountAPI:
+    """Count API returning a fixed count per call, recording the texts."""
+
+    def __init__(self, tokens=500, fail=False):
+        self.tokens = tokens
+        self.fail = fail
+        self.texts = []
+
+    async def __call__(self, text):
+        self.texts.append(text)
+        if self.fail:
+            raise RuntimeError("Count-API nicht erreichbar")
+        return self.tokens
+
+
+class UsageClient(BaseLLMClient):
+    """Client reporting a fixed number of input tokens per call."""
+
+    def __init__(self, input_tokens):
+        super().__init__({"model": "test-model"})
+        self.input_tokens = input_tokens
+
+    async def complete(self, messages, system_prompt=None):
+        self._record_usage(
+            input_tokens=self.input_tokens // 2,
+            cache_read_tokens=self.input_tokens - self.input_tokens // 2,
+            output_tokens=10,
+            prompt=self._prompt_text(messages, system_prompt)
+        )
+        return "Antwort"
+
+    def get_provider_name(self):
+        return "Test"
+
+
+class TestEstimate:
+    """Tests for the uncalibrated estimate."""
+
+    def test_counts_utf8_bytes(self):
+        """Umlauts weigh more than plain letters."""
+        counter = TokenCounter(bytes_per_token=4.0)
+        assert counter.count("ä" * 400) == 200
+        assert counter.count("a" * 400) == 100
+
+    def test_empty_and_short_text(self):
+        """Empty text has no tokens, any other text at least one."""
+        counter = TokenCounter()
+        assert counter.count("") == 0
+        assert counter.count("a") == 1
+
+    def test_provider_ratio(self):
+        """The ratio comes from the configured provider."""
+        counter = create_token_counter({"llm": {"provider": "anthropic"}})
+        assert counter.bytes_per_token == PROVIDER_BYTES_PER_TOKEN["anthropic"]
+
+
+class TestCache:
+    """Tests for the count cache."""
+
+    def test_same_content_counted_once(self):
+        """A repeated text is answered from the cache."""
+        counter = TokenCounter()
+        counter.count(GERMAN)
+        counter.count(GERMAN)
+        stats = counter.stats()
+        assert stats.hits == 1
+        assert stats.entries == 1
+
+    def test_uncached_counts(self):
+        """One-off texts are not kept."""
+        counter = TokenCounter()
+        counter.count(GERMAN, cache=False)
+        assert counter.stats().entries == 0
+
+    def test_lru_eviction(self):
+        """The least recently used count is evicted."""
+        counter = TokenCounter(max_entries=2)
+        counter.count("eins")
+        counter.count("zwei")
+        counter.count("eins")
+        counter.count("drei")
+        counter.count("eins")
+        assert counter.stats().hits == 2
+        assert counter.stats().entries == 2
+
+
+class TestExactCounting:
+    """Tests for the count API path."""
+
+    def test_exact_count_cached(self):
+        """The count API is asked once per content."""
+        api = StubCountAPI(tokens=321)
+        counter = TokenCounter(count_api=api)
+
+        assert counter.count(GERMAN, exact=True) == 321
+        assert counter.count(GERMAN, exact=True) == 321
+        assert counter.count(GERMAN) == 321
+        assert api.texts == [GERMAN]
+        assert counter.stats().exact_counts == 1
+
+    def test_exact_count_calibrates(self):
+        """Exact counts also calibrate the estimate."""
+        counter = TokenCounter(bytes_per_token=4.0, count_api=StubCountAPI(tokens=10000))
+        counter.count(GERMAN, exact=True)
+        assert counter.scale > 1.0
+        assert counter.count("x" * 400) > 100
+
+    def test_failing_api_falls_back(self):
+        """If the count API fails, the estimate is used and not cached as exact."""
+        api = StubCountAPI(fail=True)
+        counter = TokenCounter(count_api=api)
+
+        assert counter.count(GERMAN, exact=True) == counter.count(GERMAN)
+        counter.count(GERMAN, exact=True)
+        assert len(api.texts) == 2
+        assert counter.stats().exact_counts == 0
+
+    def test_without_api(self):
+        """Without a count API, exact counting is the estimate."""
+        counter = TokenCounter()
+        assert counter.count(GERMAN, exact=True) == counter.count(GERMAN)
+
+
+class TestCalibration:
+    """Tests for the calibration against provider counts."""
+
+    def test_converges_to_recorded_ratio(self):
+        """Many samples pull the estimate to the provider's counts."""
+        counter = TokenCounter(bytes_per_token=4.0)
+        raw = counter.raw_estimate(GERMAN)
+        for _ in range(200):
+            counter.record_text(GERMAN, round(raw * 1.5))
+
+        assert counter.scale == pytest.approx(1.5, rel=0.02)
+        assert counter.count(GERMAN) == pytest.approx(raw * 1.5, rel=0.02)
+
+    def test_ignores_empty_samples(self):
+        """Samples without tokens are not recorded."""
+        counter = TokenCounter()
+        counter.record_text(GERMAN, 0)
+        counter.record_text("", 100)
+        assert counter.stats().samples == 0
+        assert counter.scale == 1.0
+
+    def test_client_usage_calibrates(self):
+        """Recorded usage (incl. cached input) calibrates the client's counter."""
+        counter = TokenCounter(bytes_per_token=4.0)
+        client = UsageClient(input_tokens=4000)
+        client.token_counter = counter
+        messages = [{"role": "user", "content": GERMAN}]
+
+        asyncio.run(client.complete(messages, "System"))
+
+        assert counter.stats().samples == 1
+        assert counter.scale > 1.0
+        assert client.usage_stats().input_tokens == 2000
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
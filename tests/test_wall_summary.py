@@ -0,0 +1,88 @@
+"""Tests for the materialized Discovery Wall summary."""
+
+import pytest
+from unittest.mock import patch
+
+from src.discovery.artifacts import (
+    save_artifact,
+    clear_all_artifacts,
+    get_artifact_counts,
+    get_artifacts_for_wall,
+    get_wall_summary,
+    rebuild_wall_summary
+)
+from src.discovery.markdown_store import MarkdownArtifactStore
+from src.discovery.models import ArtifactType
+
+
+class TestWallSummary:
+    """Tests for incremental wall summary maintenance."""
+
+    def test_counts_and_titles_follow_saves(self, wall_dir, make_artifact):
+        """Test that saves update counts and titles."""
+        save_artifact(make_artifact("mandat", ArtifactType.MANDAT))
+        save_artifact(make_artifact("insight-1", ArtifactType.INSIGHT))
+        save_artifact(make_artifact("idea-1", ArtifactType.IDEA))
+
+        assert get_artifact_counts() == {"mandat": 1, "problem": 1, "solution": 1, "test": 0}
+        assert get_artifacts_for_wall()["problem"] == ["Titel insight-1"]
+
+    def test_reads_do_not_load_artifacts(self, wall_dir, make_artifact):
+        """Test that counters are served without touching the store."""
+        save_artifact(make_artifact("insight-1", ArtifactType.INSIGHT))
+
+        with patch.object(MarkdownArtifactStore, "load_all") as load_all:
+            get_artifact_counts()
+            get_artifacts_for_wall()
+
+        load_all.assert_not_called()
+
+    def test_resave_updates_title_without_double_count(self, wall_dir, make_artifact):
+        """Test that saving an existing artifact replaces its entry."""
+        save_artifact(make_artifact("insight-1", ArtifactType.INSIGHT, title="Alt"))
+        save_artifact(make_artifact("insight-1", ArtifactType.INSIGHT, title="Neu"))
+
+        assert get_artifacts_for_wall()["problem"] == ["Neu"]
+        assert get_artifact_counts()["problem"] == 1
+
+    def test_recent_artifacts(self, wall_dir, make_artifact):
+        """Test that the most recently saved artifact comes first."""
+        save_artifact(make_artifact("insight-1", ArtifactType.INSIGHT))
+        save_artifact(make_artifact("idea-1", ArtifactType.IDEA))
+
+        assert [r["id"] for r in get_wall_summary().recent] == ["idea-1", "insight-1"]
+
+    def test_version_is_monotonic(self, wall_dir, make_artifact):
+        """Test that every change bumps the version, including clear."""
+        save_artifact(make_artifact("insight-1", ArtifactType.INSIGHT))
+        v1 = get_wall_summary().version
+        clear_all_artifacts()
+        v2 = get_wall_summary().version
+        save_artifact(make_artifact("insight-2", ArtifactType.INSIGHT))
+        v3 = get_wall_summary().version
+
+        assert v1 < v2 < v3
+        assert get_artifact_counts()["problem"] == 1
+
+    def test_rebuild_picks_up_hand_edits(self, wall_dir, make_artifact):
+        """Test that rebuilding reflects files added outside save_artifact."""
+        save_artifact(make_artifact("insight-1", ArtifactType.INSIGHT))
+        version = get_wall_summary().version
+
+        MarkdownArtifactStore(wall_dir).save(make_artifact("insight-2", ArtifactType.INSIGHT))
+        assert get_artifact_counts()["problem"] == 1
+
+        summary = rebuild_wall_summary()
+
+        assert summary.counts()["problem"] == 2
+        assert summary.version > version
+
+    def test_missing_summary_is_built_from_disk(self, wall_dir, make_artifact):
+        """Test that an existing wall without summary file is indexed once."""
+        MarkdownArtifactStore(wall_dir).save(make_artifact("mandat", ArtifactType.MANDAT))
+
+        assert get_artifact_counts()["mandat"] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,136 @@
+"""Tests for per-session workspaces."""
+
+import threading
+
+import pytest
+
+from src.discovery.artifacts import (
+    get_artifact_counts,
+    load_artifacts,
+    save_artifact,
+    search_artifacts
+)
+from src.discovery.session import list_sessions, load_session, save_session
+from src.discovery.sqlite_store import SqliteArtifactStore
+from src.discovery.workspace import (
+    create_workspace,
+    get_current_workspace,
+    open_workspace,
+    set_current_workspace,
+    workspace_exists
+)
+
+
+@pytest.fixture
+def sessions_dir(tmp_path):
+    """Base directory for workspaces."""
+    return tmp_path / "sessions"
+
+
+@pytest.fixture(autouse=True)
+def reset_current_workspace():
+    """Make sure no test leaks its current workspace."""
+    yield
+    set_current_workspace(None)
+
+
+class TestWorkspace:
+    """Tests for opening and creating workspaces."""
+
+    def test_create_and_reopen(self, sessions_dir):
+        """Test that a session ID maps to its own directory."""
+        workspace = create_workspace(base_dir=sessions_dir)
+
+        assert workspace.root == sessions_dir / workspace.session_id
+        assert workspace_exists(workspace.session_id, base_dir=sessions_dir)
+        assert open_workspace(workspace.session_id, base_dir=sessions_dir).root == workspace.root
+
+    def test_invalid_session_id(self, sessions_dir):
+        """Test that session IDs cannot escape the base directory."""
+        with pytest.raises(ValueError):
+            open_workspace("../etc", base_dir=sessions_dir)
+        assert not workspace_exists("../etc", base_dir=sessions_dir)
+
+    def test_store_backend_from_config(self, sessions_dir):
+        """Test that the workspace store follows the config."""
+        config = {"discovery": {"store": "sqlite"}, "paths": {"sessions": str(sessions_dir)}}
+        workspace = create_workspace(config=config)
+
+        assert isinstance(workspace.store, SqliteArtifactStore)
+        assert workspace.root.parent == sessions_dir
+        workspace.store.close()
+
+
+class TestIsolation:
+    """Tests that sessions do not share data."""
+
+    def test_artifacts_are_per_workspace(self, sessions_dir, make_artifact):
+        """Test explicit workspace handles."""
+        first = create_workspace(base_dir=sessions_dir)
+        second = create_workspace(base_dir=sessions_dir)
+
+        save_artifact(make_artifact("insight-1"), workspace=first)
+        save_artifact(make_artifact("insight-2"), workspace=second)
+
+        assert [a.id for a in load_artifacts(workspace=first)] == ["insight-1"]
+        assert get_artifact_counts(workspace=second)["problem"] == 1
+        assert search_artifacts("insight-1", workspace=second) == []
+
+    def test_current_workspace_is_the_default(self, sessions_dir, make_artifact):
+        """Test that module functions use the current workspace."""
+        workspace = create_workspace(base_dir=sessions_dir)
+        set_current_workspace(workspace)
+
+        save_artifact(make_artifact("insight-1"))
+        save_session([{"role": "user", "content": "Hallo"}])
+
+        assert (workspace.root / "research" / "insights" / "insight-1.md").exists()
+        messages, meta = load_session(workspace=workspace)
+        assert messages[0]["content"] == "Hallo"
+        assert meta["id"] == workspace.session_id
+
+    def test_current_workspace_is_thread_local(self, sessions_dir):
+        """Test that concurrent script runs keep their own workspace."""
+        workspaces = [create_workspace(base_dir=sessions_dir) for _ in range(4)]
+        seen = {}
+
+        def run(workspace):
+            set_current_workspace(workspace)
+            save_session([{"role": "user", "content": workspace.session_id}])
+            seen[workspace.session_id] = get_current_workspace().session_id
+
+        threads = [threading.Thread(target=run, args=(w,)) for w in workspaces]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(key == value for key, value in seen.items())
+        for workspace in workspaces:
+            messages, _ = load_session(workspace=workspace)
+            assert [m["content"] for m in messages] == [workspace.session_id]
+
+
+class TestListSessions:
+    """Tests for the session listing."""
+
+    def test_lists_most_recent_first(self, sessions_dir):
+        """Test listing saved sessions."""
+        first = create_workspace(base_dir=sessions_dir)
+        second = create_workspace(base_dir=sessions_dir)
+        create_workspace(base_dir=sessions_dir)  # Never saved
+
+        save_session([], session_name="Alt", workspace=first)
+        save_session([], session_name="Neu", workspace=second)
+
+        sessions = list_sessions(base_dir=sessions_dir)
+        assert [s["name"] for s in sessions] == ["Neu", "Alt"]
+        assert sessions[0]["id"] == second.session_id
+
+    def test_missing_base_dir(self, sessions_dir):
+        """Test listing without any sessions."""
+        assert list_sessions(base_dir=sessions_dir) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,120 @@
+"""Tests for the background persistence writer."""
+
+import threading
+import time
+
+import pytest
+
+from src.discovery.session import load_session, save_session
+from src.discovery.writer import BackgroundWriter
+
+
+@pytest.fixture
+def writer():
+    """Writer with a long interval so bursts are coalesced."""
+    w = BackgroundWriter(interval_ms=50)
+    yield w
+    w.stop(timeout=5)
+
+
+class TestBackgroundWriter:
+    """Tests for coalescing, flushing and stats."""
+
+    def test_burst_is_coalesced(self, writer):
+        """Test that only the latest task per key runs."""
+        written = []
+        block = threading.Event()
+
+        # Keep the worker busy so the burst queues up behind it
+        writer.submit("block", block.wait, 5)
+        time.sleep(0.02)
+        for i in range(10):
+            writer.submit("chat", written.append, i)
+        assert writer.stats().queue_depth == 1
+
+        block.set()
+        assert writer.flush(timeout=5)
+
+        assert written == [9]
+        stats = writer.stats()
+        assert stats.coalesced == 9
+        assert stats.queue_depth == 0
+        assert stats.flushes >= 1
+
+    def test_keys_are_independent(self, writer):
+        """Test that different keys are all written."""
+        written = []
+        writer.submit("a", written.append, "a")
+        writer.submit("b", written.append, "b")
+        writer.flush(timeout=5)
+
+        assert sorted(written) == ["a", "b"]
+
+    def test_submit_does_not_wait_for_io(self, writer):
+        """Test that a slow write does not block the submitting thread."""
+        started = time.monotonic()
+        writer.submit("slow", time.sleep, 0.3)
+        assert time.monotonic() - started < 0.1
+        writer.flush(timeout=5)
+        assert writer.stats().last_flush_ms >= 250
+
+    def test_errors_are_counted(self, writer):
+        """Test that a failing task is reported and others still run."""
+        written = []
+
+        def fail():
+            raise OSError("Disk voll")
+
+        writer.submit("bad", fail)
+        writer.submit("good", written.append, 1)
+        writer.flush(timeout=5)
+
+        stats = writer.stats()
+        assert written == [1]
+        assert stats.errors == 1
+        assert "Disk voll" in stats.last_error
+
+    def test_stop_flushes_pending(self):
+        """Test that stopping writes pending tasks first."""
+        written = []
+        writer = BackgroundWriter(interval_ms=10_000)
+        writer.submit("first", written.append, 1)  # Written immediately
+        writer.submit("second", written.append, 2)  # Waits for the interval
+
+        writer.stop(timeout=5)
+
+        assert written == [1, 2]
+        with pytest.raises(RuntimeError):
+            writer.submit("late", written.append, 3)
+
+    def test_bounded_queue_applies_backpressure(self):
+        """Test that submitting beyond max_pending waits for the worker."""
+        writer = BackgroundWriter(interval_ms=0, max_pending=1)
+        block = threading.Event()
+        writer.submit("block", block.wait, 5)
+        time.sleep(0.02)
+        writer.submit("a", lambda: None)
+
+        submitted = threading.Event()
+        thread = threading.Thread(target=lambda: (writer.submit("b", lambda: None), submitted.set()))
+        thread.start()
+        assert not submitted.wait(0.1)
+
+        block.set()
+        assert submitted.wait(5)
+        thread.join()
+        writer.stop(timeout=5)
+
+    def test_queued_session_save(self, writer, session_dir):
+        """Test writing a chat session through the writer."""
+        messages = [{"role": "user", "content": "Hallo"}]
+        for count in range(1, 4):
+            writer.submit(("chat", session_dir), save_session, messages=list(messages * count))
+        writer.flush(timeout=5)
+
+        loaded, _ = load_session()
+        assert len(loaded) == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])